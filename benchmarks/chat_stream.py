@@ -0,0 +1,95 @@
+"""Measures per-chunk overhead of the chat completions streaming pipeline.
+
+Usage::
+
+    python benchmarks/chat_stream.py [--chunks 4000] [--runs 5] [--mode full --mode delta] [--json-codec auto]
+
+The server is replaced by an in-memory httpx transport which returns
+a prepared stream of server-sent events, so only the client side is measured:
+SSE parsing, JSON decoding and building of the results.
+Median time per chunk of the runs is reported for every mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+from yandex_ai_studio_sdk import AsyncAIStudio
+
+URL = 'https://llm.example.com/v1/'
+
+
+def make_body(chunks: int) -> bytes:
+    base = {'id': 'benchmark', 'object': 'chat.completion.chunk', 'created': 1700000000, 'model': 'benchmark'}
+    events = [{**base, 'choices': [{'index': 0, 'delta': {'role': 'assistant', 'content': ''}}]}]
+    for i in range(chunks):
+        events.append({**base, 'choices': [{'index': 0, 'delta': {'content': f'token{i} '}}]})
+    events.append({**base, 'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}]})
+    events.append({
+        **base,
+        'choices': [],
+        'usage': {'prompt_tokens': 10, 'completion_tokens': chunks, 'total_tokens': chunks + 10},
+    })
+
+    lines = [f'data: {json.dumps(event)}\n\n' for event in events]
+    lines.append('data: [DONE]\n\n')
+    return ''.join(lines).encode()
+
+
+class StreamTransport(httpx.AsyncHTTPTransport):
+    """Transport which responds to any request with the prepared event stream."""
+
+    def __init__(self, body: bytes):
+        super().__init__()
+        self._body = body
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=self._body, headers={'content-type': 'text/event-stream'})
+
+
+async def run_once(sdk: AsyncAIStudio, mode: str) -> float:
+    model = sdk.chat.completions('benchmark')
+
+    start = time.perf_counter()
+    async for _ in model.run_stream('hello', mode=mode):  # type: ignore[call-overload]
+        pass
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--chunks', type=int, default=4000)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--mode', dest='modes', action='append', choices=['full', 'delta'])
+    parser.add_argument('--json-codec', default='auto', choices=['auto', 'json', 'orjson', 'msgspec'])
+    args = parser.parse_args()
+
+    body = make_body(args.chunks)
+
+    transport = StreamTransport(body)
+
+    sdk = AsyncAIStudio(
+        folder_id='benchmark',
+        auth='benchmark',
+        service_map={'http_completions': URL},
+        json_codec=args.json_codec,
+    )
+    # pylint: disable-next=protected-access
+    sdk._client._get_http_transport = lambda base_url: transport  # type: ignore[method-assign]
+
+    # pylint: disable-next=protected-access
+    print(f'chunks: {args.chunks}; runs: {args.runs}; json codec: {sdk._client.json_codec.name}')
+    for mode in args.modes or ['full', 'delta']:
+        timings = [await run_once(sdk, mode) for _ in range(args.runs)]
+        per_chunk = statistics.median(timings) / args.chunks
+        print(f'{mode:>5} mode:  {per_chunk * 1e6:8.1f} us per chunk')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
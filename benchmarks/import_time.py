@@ -0,0 +1,67 @@
+"""Measures import time and memory of the SDK in fresh interpreters.
+
+Usage::
+
+    python benchmarks/import_time.py [--runs 20] [--domain chat]
+
+Every run starts a new python process which imports the SDK, creates
+an ``AsyncAIStudio`` instance and touches the given domains;
+median wall time and peak RSS of the runs are reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CODE = '''
+import json, resource, sys, time
+
+start = time.perf_counter()
+import yandex_ai_studio_sdk
+imported = time.perf_counter()
+
+sdk = yandex_ai_studio_sdk.AsyncAIStudio(folder_id='benchmark', auth='benchmark')
+for domain in sys.argv[1:]:
+    getattr(sdk, domain)
+finished = time.perf_counter()
+
+print(json.dumps({
+    'import': imported - start,
+    'total': finished - start,
+    'rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules': len(sys.modules),
+}))
+'''
+
+
+def run_once(domains: list[str]) -> dict[str, float]:
+    output = subprocess.check_output([sys.executable, '-c', CODE, *domains])
+    result: dict[str, float] = json.loads(output)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--domain', dest='domains', action='append', default=[])
+    args = parser.parse_args()
+
+    results = [run_once(args.domains) for _ in range(args.runs)]
+
+    def median(key: str) -> float:
+        return statistics.median(result[key] for result in results)
+
+    print(f'domains: {", ".join(args.domains) or "-"}; runs: {args.runs}')
+    print(f'import time:   {median("import") * 1000:8.1f} ms')
+    print(f'total time:    {median("total") * 1000:8.1f} ms')
+    # NB: ru_maxrss is in kilobytes on Linux
+    print(f'peak RSS:      {median("rss") / 1024:8.1f} MiB')
+    print(f'modules:       {median("modules"):8.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -34,7 +34,7 @@ async def test_auth(async_sdk, iam_token, mock_client, get_auth_meta):
     assert get_auth_meta(metadata) == f"Bearer {iam_token}"
 
 
-async def test_reissue(async_sdk, auth, monkeypatch, mock_client):
+async def test_reissue(async_sdk, auth, get_auth_meta, monkeypatch, mock_client):
     assert auth._token is None
     assert auth._issue_time is None
 
@@ -57,7 +57,11 @@ async def test_reissue(async_sdk, auth, monkeypatch, mock_client):
 
     monkeypatch.setattr(auth, "_token_refresh_period", 1)
 
-    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    # token is refreshed in background, so current token is still used
+    metadata = await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    assert get_auth_meta(metadata) == "Bearer <iam-token-0>"
+    await auth._refresh_task
+
     assert auth._token == "<iam-token-1>"
     assert auth._issue_time > issue_time
 
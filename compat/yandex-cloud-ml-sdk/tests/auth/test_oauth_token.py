@@ -50,7 +50,7 @@ async def test_auth(async_sdk, auth, get_auth_meta):
 
 
 @pytest.mark.filterwarnings(r"ignore:.*OAuth:UserWarning")
-async def test_reissue(async_sdk, auth, monkeypatch):
+async def test_reissue(async_sdk, auth, get_auth_meta, monkeypatch):
     assert auth._token is None
     assert auth._issue_time is None
 
@@ -69,7 +69,11 @@ async def test_reissue(async_sdk, auth, monkeypatch):
     # now we will trigger reissue of a token
     monkeypatch.setattr(auth, "_token_refresh_period", 1)
 
-    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    # token is refreshed in background, so current token is still used
+    metadata = await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    assert get_auth_meta(metadata) == "Bearer <iam-token-0>"
+    await auth._refresh_task
+
     assert auth._token == "<iam-token-1>"
     assert auth._issue_time > issue_time
 
@@ -30,7 +30,7 @@ async def test_auth(async_sdk, iam_token, monkeypatch, process_maker, get_auth_m
     assert get_auth_meta(metadata) == f"Bearer {iam_token}"
 
 
-async def test_reissue(async_sdk, auth, monkeypatch, process_maker):
+async def test_reissue(async_sdk, auth, get_auth_meta, monkeypatch, process_maker):
     assert auth._token is None
     assert auth._issue_time is None
 
@@ -54,7 +54,11 @@ async def test_reissue(async_sdk, auth, monkeypatch, process_maker):
 
     monkeypatch.setattr(auth, "_token_refresh_period", 1)
 
-    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    # token is refreshed in background, so current token is still used
+    metadata = await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    assert get_auth_meta(metadata) == "Bearer <iam-token-0>"
+    await auth._refresh_task
+
     assert auth._token == "<iam-token-1>"
     assert auth._issue_time > issue_time
 
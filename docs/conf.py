@@ -4,6 +4,10 @@ import yandex_ai_studio_sdk
 import yandex_ai_studio_sdk._sdk
 from sphinx.domains.python import PythonDomain
 
+# NB: SDK domains are imported lazily, so they must be imported
+# explicitly to resolve annotations of the SDK classes
+yandex_ai_studio_sdk._sdk.import_domains()
+
 # -- Project information -----------------------------------------------------
 
 project = 'yandex-ai-studio-sdk'
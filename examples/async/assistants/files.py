@@ -33,6 +33,10 @@ async def main() -> None:
     print(f"url for downloading: {await file.get_url()=}")
     print(f"getting content {await file.download_as_bytes()=}")
 
+    # for big files it is better to stream content without keeping it in memory
+    async for chunk in file.aiter_bytes(chunk_size=1024):
+        print(f"got chunk of {len(chunk)} bytes")
+
     async for file in sdk.files.list():
         print(f"deleting {file=}")
         await file.delete()
@@ -36,10 +36,11 @@ async def main() -> None:
     coros = (doc_model.run(text) for text in doc_texts)
     doc_results = await asyncio.gather(*coros)
 
-    query_embedding = np.array(query_result.embedding)
-    doc_embeddings = [np.array(doc_result.embedding) for doc_result in doc_results]
+    # results are stacked into (n, dim) matrices without copying floats one by one
+    query_embeddings = query_result.stack([query_result])
+    doc_embeddings = query_result.stack(doc_results)
 
-    dist = cdist([query_embedding], doc_embeddings, metric='cosine')
+    dist = cdist(query_embeddings, doc_embeddings, metric='cosine')
     sim = 1 - dist
     result = doc_texts[np.argmax(sim)]
     print(result)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+
+from yandex_ai_studio_sdk import AsyncAIStudio
+
+
+async def main() -> None:
+    # You can set authentication using environment variables instead of the 'auth' argument:
+    # YC_OAUTH_TOKEN, YC_TOKEN, YC_IAM_TOKEN, or YC_API_KEY
+    # You can also set 'folder_id' using the YC_FOLDER_ID environment variable
+    sdk = AsyncAIStudio(
+        # folder_id="<YC_FOLDER_ID>",
+        # auth="<YC_API_KEY/YC_IAM_TOKEN>",
+    )
+    sdk.setup_default_logging()
+
+    doc_model = sdk.models.text_embeddings('doc')
+
+    # texts could be a lazy iterator, it will be consumed as requests are sent
+    texts = (f'document number {i}' for i in range(100))
+    result = await doc_model.run_batch(texts, concurrency=8)
+
+    # failure of one text doesn't affect the others
+    for i, error in result.errors.items():
+        print(f'text {i} failed: {error}')
+
+    print(f'{len(result)} embeddings, {result.num_tokens} tokens total')
+    print(result[0])
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
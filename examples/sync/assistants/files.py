@@ -32,6 +32,10 @@ def main() -> None:
     print(f"url for downloading: {file.get_url()=}")
     print(f"getting content {file.download_as_bytes()=}")
 
+    # for big files it is better to stream content without keeping it in memory
+    for chunk in file.iter_bytes(chunk_size=1024):
+        print(f"got chunk of {len(chunk)} bytes")
+
     for file in sdk.files.list():
         print(f"deleting {file=}")
         file.delete()
@@ -31,6 +31,7 @@ class BaseAssistants(BaseDomain, Generic[AssistantTypeT]):
 
     Provides common functionality for creating, getting and listing assistants.
     """
+    _grpc_services = ('ai-assistants', )
 
     _assistant_impl: type[AssistantTypeT]
 
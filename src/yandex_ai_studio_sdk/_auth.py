@@ -19,9 +19,13 @@ from yandex.cloud.iam.v1.iam_token_service_pb2 import (  # pylint: disable=no-na
 )
 from yandex.cloud.iam.v1.iam_token_service_pb2_grpc import IamTokenServiceStub
 
+from ._logging import get_logger
+
 if TYPE_CHECKING:
     from ._client import AsyncCloudClient
 
+logger = get_logger(__name__)
+
 
 OAUTH_WARNING = """Sharing your personal OAuth token is not safe,
 and gives anyone access to your cloud infrastructure and data.
@@ -58,6 +62,9 @@ class BaseAuth(ABC):
     async def applicable_from_env(cls, **_: Any) -> Self | None:
         """:meta private:"""
 
+    async def close(self) -> None:
+        """:meta private:"""
+
 
 class NoAuth(BaseAuth):
     @override
@@ -180,33 +187,124 @@ class RefresheableIAMTokenAuth(BaseIAMTokenAuth):
 
     This class manages an IAM token that can be refreshed automatically if it has expired,
     based on the specified refresh period.
+
+    When the refresh period is over, the token is renewed by a background task
+    while requests are still using the current one, so requests are blocked
+    by the token fetching only if there is no token yet or it is already expired.
+    Failed background refreshes are retried with an exponential backoff.
     """
+    # token is renewed in background after this period since its issue
     _token_refresh_period = 60 * 60
+    # token lifetime which is used if the real expiration time is unknown
+    _token_max_age = 12 * 60 * 60
+    # token is renewed in background if it expires sooner than this margin
+    _token_expiration_margin = 15 * 60
+    _refresh_initial_backoff = 1.0
+    _refresh_max_backoff = 60.0
 
     def __init__(self, token: str | None) -> None:
         super().__init__(token)
         self._issue_time: float | None = None
+        self._expires_at: float | None = None
         if self._token is not None:
             self._issue_time = time.time()
 
-    def _need_for_token(self):
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._refresh_failures = 0
+        self._next_refresh_attempt = 0.0
+
+    def _get_expiration_time(self) -> float:
+        assert self._issue_time is not None
+        if self._expires_at is not None:
+            return self._expires_at
+        return self._issue_time + self._token_max_age
+
+    def _need_for_token(self) -> bool:
         return (
             self._token is None or
             self._issue_time is None or
-            time.time() - self._issue_time > self._token_refresh_period
+            time.time() >= self._get_expiration_time()
+        )
+
+    def _need_for_refresh(self) -> bool:
+        assert self._issue_time is not None
+        now = time.time()
+        return (
+            now - self._issue_time > self._token_refresh_period or
+            now >= self._get_expiration_time() - self._token_expiration_margin
+        )
+
+    async def _refresh_token(self, client: AsyncCloudClient, timeout: float) -> None:
+        token, expires_at = await self._fetch_token(client, timeout=timeout)
+        self._token = token
+        self._issue_time = time.time()
+        self._expires_at = expires_at
+
+    async def _background_refresh(self, client: AsyncCloudClient, timeout: float) -> None:
+        try:
+            await self._refresh_token(client, timeout=timeout)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._refresh_failures += 1
+            backoff = min(
+                self._refresh_initial_backoff * 2 ** (self._refresh_failures - 1),
+                self._refresh_max_backoff,
+            )
+            self._next_refresh_attempt = time.time() + backoff
+            logger.warning(
+                'Failed to refresh IAM token in background, current token is used for now, '
+                'next attempt in %.1f seconds', backoff,
+                exc_info=True,
+            )
+        else:
+            self._refresh_failures = 0
+            self._next_refresh_attempt = 0.0
+            logger.debug('IAM token was refreshed in background')
+
+    def _schedule_refresh(self, client: AsyncCloudClient, timeout: float) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        if time.time() < self._next_refresh_attempt:
+            return
+
+        self._refresh_task = asyncio.create_task(
+            self._background_refresh(client, timeout=timeout)
         )
 
+    @override
+    async def close(self) -> None:
+        """:meta private:"""
+        task = self._refresh_task
+        self._refresh_task = None
+        if task is None or task.done():
+            return
+
+        # NB: provider is shared by clients of all SDK event loops,
+        # so the task could belong to a loop other than the current one
+        loop = task.get_loop()
+        if loop is not asyncio.get_running_loop():
+            loop.call_soon_threadsafe(task.cancel)
+            return
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
     @override
     async def get_auth_metadata(self, client: AsyncCloudClient, timeout: float, lock: asyncio.Lock) -> tuple[str, str]:
         """:meta private:"""
         if self._need_for_token():
             async with lock:
                 if self._need_for_token():
-                    self._token = await self._get_token(client, timeout=timeout)
-                    self._issue_time = time.time()
+                    await self._refresh_token(client, timeout=timeout)
+        elif self._need_for_refresh():
+            self._schedule_refresh(client, timeout=timeout)
 
         return await super().get_auth_metadata(client, timeout=timeout, lock=lock)
 
+    async def _fetch_token(self, client: AsyncCloudClient, timeout: float) -> tuple[str, float | None]:
+        """Returns a new token and its expiration timestamp if it is known."""
+        return await self._get_token(client, timeout=timeout), None
+
     @abstractmethod
     async def _get_token(self, client: AsyncCloudClient, timeout: float) -> str:
         pass
@@ -243,7 +341,7 @@ class OAuthTokenAuth(RefresheableIAMTokenAuth):
         return None
 
     @override
-    async def _get_token(self, client: AsyncCloudClient, timeout: float) -> str:
+    async def _fetch_token(self, client: AsyncCloudClient, timeout: float) -> tuple[str, float | None]:
         request = CreateIamTokenRequest(yandex_passport_oauth_token=self._oauth_token)
         async with client.get_service_stub(IamTokenServiceStub, timeout=timeout) as stub:
             result = await client.call_service(
@@ -253,7 +351,14 @@ class OAuthTokenAuth(RefresheableIAMTokenAuth):
                 expected_type=CreateIamTokenResponse,
                 auth=False,
             )
-        return result.iam_token
+
+        expires_at = result.expires_at.ToSeconds() if result.HasField('expires_at') else None
+        return result.iam_token, expires_at
+
+    @override
+    async def _get_token(self, client: AsyncCloudClient, timeout: float) -> str:
+        token, _ = await self._fetch_token(client, timeout=timeout)
+        return token
 
 
 class YandexCloudCLIAuth(RefresheableIAMTokenAuth):
@@ -380,12 +485,17 @@ class MetadataAuth(RefresheableIAMTokenAuth):
 
         return cls(token, url)
 
+    @override
+    async def _fetch_token(self, client: AsyncCloudClient | None, timeout: float) -> tuple[str, float | None]:
+        return await self._request_token_info(timeout, self._metadata_url)
+
     @override
     async def _get_token(self, client: AsyncCloudClient | None, timeout: float) -> str:
         return await self._request_token(timeout, self._metadata_url)
 
     @classmethod
-    async def _request_token(cls, timeout: float, metadata_url: str) -> str:
+    async def _request_token_info(cls, timeout: float, metadata_url: str) -> tuple[str, float | None]:
+        request_time = time.time()
         async with httpx.AsyncClient() as client:
             response = await client.get(
                 metadata_url,
@@ -395,7 +505,14 @@ class MetadataAuth(RefresheableIAMTokenAuth):
             response.raise_for_status()
 
         data = response.json()
-        return data['access_token']
+        expires_in = data.get('expires_in')
+        expires_at = request_time + float(expires_in) if expires_in else None
+        return data['access_token'], expires_at
+
+    @classmethod
+    async def _request_token(cls, timeout: float, metadata_url: str) -> str:
+        token, _ = await cls._request_token_info(timeout, metadata_url)
+        return token
 
 
 async def get_auth_provider(
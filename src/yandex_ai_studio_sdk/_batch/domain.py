@@ -30,6 +30,7 @@ class BaseBatch(BaseDomain, Generic[BatchTaskOperationTypeT]):
 
     For usage examples see `batch example <https://github.com/yandex-cloud/yandex-cloud-ml-sdk/blob/master/examples/{link}/completions/batch.py>`_.
     """
+    _grpc_services = ('ai-foundation-models', )
     _operation_impl: type[BatchTaskOperationTypeT]
 
     async def _get(
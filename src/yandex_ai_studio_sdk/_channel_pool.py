@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import itertools
+import time
+from typing import Callable, Literal
+
+import grpc.aio
+
+from ._logging import TRACE, get_logger
+
+logger = get_logger(__name__)
+
+ChannelSelectionStrategy = Literal['least_in_flight', 'round_robin']
+
+
+@dataclasses.dataclass(frozen=True)
+class ChannelPoolConfig:
+    """A class that defines how many gRPC channels (HTTP/2 connections)
+    are opened to every service endpoint and how calls are spread among them.
+
+    Channels are created lazily: a new one is opened only when each of
+    existing channels already carries ``max_concurrent_streams`` calls,
+    and extra channels are closed after ``idle_timeout`` seconds without calls.
+    """
+    #: the maximum number of channels per endpoint
+    max_channels: int = 1
+    #: the number of concurrent calls per channel after which the pool
+    #: prefers to open a new channel; it should not exceed the server's
+    #: HTTP/2 ``SETTINGS_MAX_CONCURRENT_STREAMS`` which is usually 100
+    max_concurrent_streams: int = 100
+    #: time in seconds after which an idle extra channel is closed;
+    #: the first channel is never closed by idleness; ``None`` disables shrinking
+    idle_timeout: float | None = 300
+    #: the way a channel is selected for a new call:
+    #: ``least_in_flight`` picks the channel with the least number of running calls,
+    #: ``round_robin`` picks channels in turn
+    strategy: ChannelSelectionStrategy = 'least_in_flight'
+
+    def __post_init__(self) -> None:
+        if self.max_channels < 1:
+            raise ValueError('max_channels must be positive')
+        if self.max_concurrent_streams < 1:
+            raise ValueError('max_concurrent_streams must be positive')
+        if self.idle_timeout is not None and self.idle_timeout < 0:
+            raise ValueError('idle_timeout must be non-negative')
+        if self.strategy not in ('least_in_flight', 'round_robin'):
+            raise ValueError(f'unknown channel selection strategy {self.strategy!r}')
+
+
+@dataclasses.dataclass(eq=False)
+class PooledChannel:
+    channel: grpc.aio.Channel
+    in_flight: int = 0
+    last_used: float = dataclasses.field(default_factory=time.monotonic)
+
+
+class ChannelPool:
+    """A pool of gRPC channels to a single endpoint.
+
+    Selection and accounting are synchronous and happen
+    in the event loop thread, so there is no need for locks here.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        channel_factory: Callable[[str], grpc.aio.Channel],
+        config: ChannelPoolConfig,
+    ):
+        self._endpoint = endpoint
+        self._channel_factory = channel_factory
+        self._config = config
+        self._channels: list[PooledChannel] = []
+        self._counter = itertools.count()
+
+    @property
+    def endpoint(self) -> str:
+        return self._endpoint
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def _is_saturated(self) -> bool:
+        limit = self._config.max_concurrent_streams
+        return all(pooled.in_flight >= limit for pooled in self._channels)
+
+    def _grow(self) -> PooledChannel:
+        pooled = PooledChannel(channel=self._channel_factory(self._endpoint))
+        self._channels.append(pooled)
+        logger.log(
+            TRACE, 'Opened gRPC channel #%d to %s',
+            len(self._channels), self._endpoint,
+        )
+        return pooled
+
+    def _select(self) -> PooledChannel:
+        if self._config.strategy == 'round_robin':
+            return self._channels[next(self._counter) % len(self._channels)]
+
+        return min(self._channels, key=lambda pooled: pooled.in_flight)
+
+    def acquire(self) -> PooledChannel:
+        """Selects a channel for a new call and marks the call as running on it."""
+        if not self._channels or (len(self._channels) < self._config.max_channels and self._is_saturated()):
+            pooled = self._grow()
+        else:
+            pooled = self._select()
+
+        pooled.in_flight += 1
+        return pooled
+
+    def pin(self, pooled: PooledChannel, call: grpc.aio.Call) -> None:
+        """Counts a call as running on the channel until the call is done.
+
+        It is used for streaming calls which are kept open after the release
+        of the channel they were started on, so the channel isn't closed by idleness under them.
+        """
+        pooled.in_flight += 1
+
+        def unpin(_: grpc.aio.Call) -> None:
+            pooled.in_flight -= 1
+            pooled.last_used = time.monotonic()
+
+        call.add_done_callback(unpin)
+
+    async def release(self, pooled: PooledChannel) -> None:
+        """Marks the call as finished and closes channels which are idle for too long."""
+        pooled.in_flight -= 1
+        pooled.last_used = time.monotonic()
+
+        await self._shrink()
+
+    async def _shrink(self) -> None:
+        idle_timeout = self._config.idle_timeout
+        if idle_timeout is None or len(self._channels) <= 1:
+            return
+
+        now = time.monotonic()
+        first, *extra = self._channels
+        idle = [
+            pooled for pooled in extra
+            if not pooled.in_flight and now - pooled.last_used >= idle_timeout
+        ]
+        if not idle:
+            return
+
+        self._channels = [first] + [pooled for pooled in extra if pooled not in idle]
+        logger.log(TRACE, 'Closing %d idle gRPC channels to %s', len(idle), self._endpoint)
+        await asyncio.gather(*(pooled.channel.close() for pooled in idle))
+
+    async def close(self) -> None:
+        channels = self._channels
+        self._channels = []
+
+        for pooled in channels:
+            await pooled.channel.close()
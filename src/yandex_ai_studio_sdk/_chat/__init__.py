@@ -16,6 +16,7 @@ class BaseChat(DomainWithFunctions):
     `Yandex Cloud OpenAI Compatible API_BaseChat_URL <https://yandex.cloud/docs/ai-studio/concepts/openai-compatibility>`_.
     It serves as the foundation for chat operations.
     """
+    _http_services = ('http_completions', )
 
     #: Chat API subdomain for working with text-generation models
     completions: BaseChatCompletions
@@ -52,7 +52,7 @@ class BaseChatFunction(BaseModelFunction[ModelTypeT]):
                 timeout=timeout,
             )
         response.raise_for_status()
-        return response.json()['data']
+        return self._sdk._client.json_codec.loads(response.content)['data']
 
     async def _list(
         self,
@@ -1,12 +1,15 @@
 # pylint: disable=protected-access
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Iterator, Sequence
-from typing import Any, Generic
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from functools import cached_property
+from typing import Any, Generic, Literal, overload
 
-from typing_extensions import Self, override
+from typing_extensions import Self, TypeAlias, override
 from yandex_ai_studio_sdk._models.completions.config import CompletionTool
+from yandex_ai_studio_sdk._response_cache import cached_http_call
 from yandex_ai_studio_sdk._tools.tool_call import AsyncToolCall, ToolCall, ToolCallTypeT
+from yandex_ai_studio_sdk._tools.tool_call_list import HttpToolCallList
 from yandex_ai_studio_sdk._types.misc import UNDEFINED, UndefinedOr
 from yandex_ai_studio_sdk._types.model import ModelSyncMixin, ModelSyncStreamMixin
 from yandex_ai_studio_sdk._types.schemas import ResponseType, http_schema_from_response_format
@@ -17,9 +20,19 @@ from yandex_ai_studio_sdk._utils.sync import run_sync, run_sync_generator
 
 from .config import ChatModelConfig, ChatReasoningModeType, QueryType
 from .message import ChatMessageInputType, messages_to_json
-from .result import YCMLSDK_REASONING_TEXT, YCMLSDK_TEXT, YCMLSDK_TOOL_CALLS, ChatModelResult
+from .result import (
+    STATUS_TABLE, YCMLSDK_REASONING_TEXT, YCMLSDK_TEXT, YCMLSDK_TOOL_CALLS, ChatChoice, ChatModelDelta, ChatModelResult,
+    FinishReason
+)
 from .utils import ToolCallsBuffer
 
+StreamModeType: TypeAlias = Literal['full', 'delta']
+
+
+def _check_stream_mode(mode: str) -> None:
+    if mode not in ('full', 'delta'):
+        raise ValueError(f"unknown stream mode {mode!r}, expected 'full' or 'delta'")
+
 
 class BaseChatModel(
     Generic[ToolCallTypeT],
@@ -85,7 +98,18 @@ class BaseChatModel(
             'messages': messages_to_json(messages),
             'stream': stream,
         }
+        result.update(self._request_prefix)
+        return result
+
+    @cached_property
+    def _request_prefix(self) -> dict[str, Any]:
+        """Part of the request which depends only on the model config.
 
+        Model config is immutable, so it is built once per configured model
+        instead of converting schemas and tools at every request;
+        result is shared between requests and must not be modified.
+        """
+        result: dict[str, Any] = {}
         c = self._config
 
         if c.temperature is not None:
@@ -137,15 +161,21 @@ class BaseChatModel(
             Defaults to 180 seconds.
         """
 
-        async with self._client.httpx_for_service('http_completions', timeout) as client:
-            response = await client.post(
-                '/chat/completions',
-                json=self._build_request_json(messages, stream=False),
-                timeout=timeout,
-            )
-            response.raise_for_status()
+        request_json = self._build_request_json(messages, stream=False)
+
+        async def call() -> bytes:
+            async with self._client.httpx_for_service('http_completions', timeout) as client:
+                response = await client.post(
+                    '/chat/completions',
+                    json=request_json,
+                    timeout=timeout,
+                )
+                response.raise_for_status()
+            return response.content
 
-        return ChatModelResult._from_json(data=response.json(), sdk=self._sdk)
+        content = await cached_http_call(self._client.response_cache, '/chat/completions', request_json, call)
+        data = self._client.json_codec.loads(content)
+        return ChatModelResult._from_json(data=data, sdk=self._sdk)
 
     @override
     # pylint: disable-next=arguments-differ,too-many-locals,too-many-branches
@@ -154,7 +184,8 @@ class BaseChatModel(
         messages: ChatMessageInputType,
         *,
         timeout=180,
-    ) -> AsyncIterator[ChatModelResult[ToolCallTypeT]]:
+        mode: StreamModeType = 'full',
+    ) -> AsyncIterator[Any]:
         """
         Executes the model with the provided messages
         and yields partial results as they become available.
@@ -162,22 +193,126 @@ class BaseChatModel(
         :param messages: The input messages to process.
         :param timeout: The timeout, or the maximum time to wait for the request to complete in seconds.
             Defaults to 180 seconds.
+        :param mode: With ``'full'`` each of the partial results contains the whole text generated so far,
+            which is convenient, but costs a copy of the growing text for every chunk.
+            With ``'delta'`` lightweight :py:class:`~yandex_ai_studio_sdk._chat.completions.result.ChatModelDelta`
+            objects with only newly generated data are yielded, and the full result can be built
+            at the end with ``model.join_deltas()``.
+            Defaults to ``'full'``.
         """
+        _check_stream_mode(mode)
 
-        role: str = ""
-        content_buffer: str | None = None
-        reasoning_content_buffer: str | None = None
+        if mode == 'delta':
+            async for delta in self._run_stream_delta(messages, timeout=timeout):
+                yield delta
+            return
+
+        async for result in self._run_stream_full(messages, timeout=timeout):
+            yield result
+
+    def join_deltas(self, deltas: Iterable[ChatModelDelta]) -> ChatModelResult[ToolCallTypeT]:
+        """
+        Builds the full result from the chunks yielded by ``run_stream(..., mode='delta')``.
+
+        :param deltas: The chunks of a single streaming response in the order they were received.
+        """
+        text_parts: list[str] = []
+        reasoning_parts: list[str] = []
         tool_calls_buffer = ToolCallsBuffer()
+        role = ''
+        finish_reason = FinishReason.NULL
+        usage = None
+        last: ChatModelDelta | None = None
+
+        for delta in deltas:
+            last = delta
+            role = role or delta.role
+
+            # the same as in full mode, content_filter chunk contains a whole content instead of a delta
+            if delta.finish_reason == FinishReason.CONTENT_FILTER:
+                text_parts = [delta.text]
+            elif delta.text:
+                text_parts.append(delta.text)
+
+            if delta.reasoning_text:
+                reasoning_parts.append(delta.reasoning_text)
+
+            if delta.tool_calls_delta:
+                tool_calls_buffer.update(list(delta.tool_calls_delta))  # type: ignore[arg-type]
+
+            if delta.finish_reason not in (FinishReason.NULL, FinishReason.USAGE):
+                finish_reason = delta.finish_reason
+
+            usage = delta.usage or usage
+
+        if last is None:
+            raise ValueError('deltas must contain at least one chunk')
+
+        tool_calls: HttpToolCallList[ToolCallTypeT] | None = None
+        if raw_tool_calls := tool_calls_buffer.value:
+            # NB: HttpToolCallList._from_json is annotated with dict, but it actually takes a list
+            tool_calls = HttpToolCallList._from_json(data=raw_tool_calls, sdk=self._sdk)  # type: ignore[arg-type]
+
+        choice = ChatChoice(
+            text=''.join(text_parts),
+            role=role,
+            finish_reason=finish_reason,
+            status=STATUS_TABLE[finish_reason],
+            tool_calls=tool_calls,
+            reasoning_text=''.join(reasoning_parts) or None,
+        )
+        return self._result_type(
+            choices=(choice, ),
+            usage=usage,
+            created=last.created,
+            model=last.model,
+            id=last.id,
+        )
 
-        async for sse in self._client.sse_stream(
+    def _stream_request(self, messages: ChatMessageInputType, *, timeout: float) -> AsyncIterator[Any]:
+        return self._client.sse_stream(
             'http_completions',
             method='POST',
             url='/chat/completions',
             json=self._build_request_json(messages, stream=True),
             timeout=timeout
-        ):
+        )
+
+    async def _run_stream_delta(
+        self,
+        messages: ChatMessageInputType,
+        *,
+        timeout: float,
+    ) -> AsyncIterator[ChatModelDelta]:
+        role = ''
+        async for data in self._stream_request(messages, timeout=timeout):
+            delta = ChatModelDelta._from_json(data=data, role=role)
+            # only the first chunk of the stream have a role
+            role = delta.role
+
+            # we don't want to generate chunks without any new information
+            if (
+                delta.text or
+                delta.reasoning_text or
+                delta.tool_calls_delta or
+                delta.finish_reason != FinishReason.NULL
+            ):
+                yield delta
+
+    # pylint: disable-next=too-many-locals,too-many-branches
+    async def _run_stream_full(
+        self,
+        messages: ChatMessageInputType,
+        *,
+        timeout: float,
+    ) -> AsyncIterator[ChatModelResult[ToolCallTypeT]]:
+        role: str = ""
+        content_buffer: str | None = None
+        reasoning_content_buffer: str | None = None
+        tool_calls_buffer = ToolCallsBuffer()
+
+        async for data in self._stream_request(messages, timeout=timeout):
             # {'id': '...', 'object': 'chat.completion.chunk', 'created': ..., 'model': '...', 'choices': [{'index': 0, 'delta': {'content': '...', 'tool_calls': '...', 'role': '...'}}]}
-            data = sse.json()
 
             if choices := data.get('choices'):
                 choice = choices[0]
@@ -270,18 +405,41 @@ class AsyncChatModel(
             timeout=timeout
         )
 
-    @doc_from(BaseChatModel._run_stream)
-    async def run_stream(
+    @overload
+    def run_stream(
         self,
         messages: ChatMessageInputType,
         *,
         timeout=180,
+        mode: Literal['full'] = 'full',
     ) -> AsyncIterator[ChatModelResult[AsyncToolCall]]:
-        async for result in self._run_stream(
+        pass
+
+    @overload
+    def run_stream(
+        self,
+        messages: ChatMessageInputType,
+        *,
+        timeout=180,
+        mode: Literal['delta'],
+    ) -> AsyncIterator[ChatModelDelta]:
+        pass
+
+    @doc_from(BaseChatModel._run_stream)
+    def run_stream(
+        self,
+        messages: ChatMessageInputType,
+        *,
+        timeout=180,
+        mode: StreamModeType = 'full',
+    ) -> AsyncIterator[ChatModelResult[AsyncToolCall] | ChatModelDelta]:
+        # NB: mode is checked at the call instead of the first iteration of the generator
+        _check_stream_mode(mode)
+        return self._run_stream(
             messages=messages,
-            timeout=timeout
-        ):
-            yield result
+            timeout=timeout,
+            mode=mode,
+        )
 
 
 @doc_from(BaseChatModel)
@@ -304,14 +462,37 @@ class ChatModel(
             timeout=timeout
         )
 
-    @doc_from(BaseChatModel._run_stream)
+    @overload
     def run_stream(
         self,
         messages: ChatMessageInputType,
         *,
         timeout=180,
+        mode: Literal['full'] = 'full',
     ) -> Iterator[ChatModelResult[ToolCall]]:
-        yield from self.__run_stream(
+        pass
+
+    @overload
+    def run_stream(
+        self,
+        messages: ChatMessageInputType,
+        *,
+        timeout=180,
+        mode: Literal['delta'],
+    ) -> Iterator[ChatModelDelta]:
+        pass
+
+    @doc_from(BaseChatModel._run_stream)
+    def run_stream(
+        self,
+        messages: ChatMessageInputType,
+        *,
+        timeout=180,
+        mode: StreamModeType = 'full',
+    ) -> Iterator[ChatModelResult[ToolCall] | ChatModelDelta]:
+        _check_stream_mode(mode)
+        return self.__run_stream(
             messages=messages,
-            timeout=timeout
+            timeout=timeout,
+            mode=mode,
         )
@@ -13,6 +13,7 @@ from yandex_ai_studio_sdk._tools.tool_call_list import HttpToolCallList
 from yandex_ai_studio_sdk._types.json import JsonBased
 from yandex_ai_studio_sdk._types.message import TextMessage
 from yandex_ai_studio_sdk._types.result import BaseJsonResult, SDKType
+from yandex_ai_studio_sdk._types.schemas import JsonObject
 
 # Keys for passing "special" message data from streaming handler to
 # results parser
@@ -34,6 +35,14 @@ class ChatUsage(Usage):
         """Alias for input_text_tokens for compatibility with chat naming."""
         return self.input_text_tokens
 
+    @classmethod
+    def _from_json(cls, data: dict[str, Any]) -> ChatUsage:
+        return cls(
+            input_text_tokens=data['prompt_tokens'],
+            completion_tokens=data['completion_tokens'],
+            total_tokens=data['total_tokens'],
+        )
+
 
 class FinishReason(Enum):
     """
@@ -201,11 +210,7 @@ class ChatModelResult(BaseJsonResult, Sequence, HaveToolCalls[ToolCallTypeT]):
         choices = tuple(ChatChoice._from_json(data=choice, sdk=sdk) for choice in data['choices'])
         usage: ChatUsage | None = None
         if raw_usage := data.get('usage'):
-            usage = ChatUsage(
-                input_text_tokens=raw_usage['prompt_tokens'],
-                completion_tokens=raw_usage['completion_tokens'],
-                total_tokens=raw_usage['total_tokens']
-            )
+            usage = ChatUsage._from_json(raw_usage)
 
         return cls(
             choices=choices,
@@ -269,3 +274,69 @@ class ChatModelResult(BaseJsonResult, Sequence, HaveToolCalls[ToolCallTypeT]):
     def tool_calls(self) -> HttpToolCallList[ToolCallTypeT] | None:
         """Shortcut for ``result.choice[0].tool_calls``"""
         return self[0].tool_calls
+
+
+@dataclass(frozen=True)
+class ChatModelDelta:
+    """
+    A chunk of a chat model streaming response in ``mode='delta'``.
+
+    Unlike :py:class:`ChatModelResult`, it contains only the data generated
+    since the previous chunk; use ``model.join_deltas()`` to build
+    a full result from the chunks.
+    """
+
+    #: Text generated since the previous chunk
+    text: str
+    #: Reasoning text generated since the previous chunk
+    reasoning_text: str | None
+    #: Raw fragments of tool calls generated since the previous chunk
+    tool_calls_delta: tuple[JsonObject, ...]
+    #: Role of the message author
+    role: str
+    #: Reason why completion request was finished, ``FinishReason.NULL`` while in progress
+    finish_reason: FinishReason
+    #: Usage statistics, usually present only at the last chunk
+    usage: ChatUsage | None
+    #: Date and time when completion request was performed
+    created: datetime.datetime
+    #: URI of the chat model used for generating the result
+    model: str
+    #: ID of the completion request (for debugging purposes)
+    id: str
+
+    @property
+    def status(self) -> AlternativeStatus:
+        """Request status (semantic synonym for finish_reason)"""
+        return STATUS_TABLE[self.finish_reason]
+
+    @property
+    def content(self) -> str:
+        """Alias for text property for compatibility with chat naming."""
+        return self.text
+
+    @classmethod
+    def _from_json(cls, *, data: dict[str, Any], role: str) -> ChatModelDelta:
+        choices = data.get('choices')
+        choice = choices[0] if choices else {}
+        delta = choice.get('delta') or {}
+
+        finish_reason = choice.get('finish_reason')
+        if not finish_reason and 'usage' in data:
+            finish_reason = 'usage'
+
+        usage: ChatUsage | None = None
+        if raw_usage := data.get('usage'):
+            usage = ChatUsage._from_json(raw_usage)
+
+        return cls(
+            text=delta.get('content') or '',
+            reasoning_text=delta.get('reasoning_content'),
+            tool_calls_delta=tuple(delta.get('tool_calls') or ()),
+            role=delta.get('role') or role,
+            finish_reason=FinishReason._coerce(finish_reason),
+            usage=usage,
+            created=datetime.datetime.utcfromtimestamp(data['created']),
+            model=data['model'],
+            id=data['id'],
+        )
@@ -8,7 +8,7 @@ from typing_extensions import Self
 from yandex_ai_studio_sdk._models.text_embeddings.config import TextEmbeddingsModelConfig
 from yandex_ai_studio_sdk._types.schemas import QueryType
 
-EncodingFormatType = Literal['float']
+EncodingFormatType = Literal['float', 'base64']
 
 
 @dataclass(frozen=True)
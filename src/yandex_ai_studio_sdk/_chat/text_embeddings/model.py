@@ -5,6 +5,7 @@ from collections.abc import Sequence
 from typing import Any, Union
 
 from typing_extensions import Self, override
+from yandex_ai_studio_sdk._response_cache import cached_http_call
 from yandex_ai_studio_sdk._types.misc import UNDEFINED, UndefinedOr
 from yandex_ai_studio_sdk._types.model import ModelSyncMixin
 from yandex_ai_studio_sdk._types.schemas import QueryType
@@ -68,15 +69,21 @@ class BaseChatEmbeddingsModel(
         *,
         timeout=180,
     ) -> ChatEmbeddingsModelResult:
-        async with self._client.httpx_for_service('http_completions', timeout) as client:
-            response = await client.post(
-                '/embeddings',
-                json=self._build_request_json(input),
-                timeout=timeout,
-            )
-            response.raise_for_status()
-
-        return ChatEmbeddingsModelResult._from_json(data=response.json(), sdk=self._sdk)
+        request_json = self._build_request_json(input)
+
+        async def call() -> bytes:
+            async with self._client.httpx_for_service('http_completions', timeout) as client:
+                response = await client.post(
+                    '/embeddings',
+                    json=request_json,
+                    timeout=timeout,
+                )
+                response.raise_for_status()
+            return response.content
+
+        content = await cached_http_call(self._client.response_cache, '/embeddings', request_json, call)
+        data = self._client.json_codec.loads(content)
+        return ChatEmbeddingsModelResult._from_json(data=data, sdk=self._sdk)
 
 
 class AsyncChatEmbeddingsModel(BaseChatEmbeddingsModel):
@@ -1,10 +1,11 @@
-# pylint: disable=no-name-in-module
+# pylint: disable=no-name-in-module,protected-access
 from __future__ import annotations
 
-from collections.abc import Sequence
+import base64
 from dataclasses import dataclass
-from typing import cast, overload
+from typing import cast
 
+from yandex_ai_studio_sdk._types.embeddings import BaseEmbeddingResult, EmbeddingVector
 from yandex_ai_studio_sdk._types.result import BaseJsonResult, SDKType
 from yandex_ai_studio_sdk._types.schemas import JsonObject
 from yandex_ai_studio_sdk._types.usage import BaseUsage
@@ -23,7 +24,7 @@ class EmbeddingsUsage(BaseUsage):
 
 
 @dataclass(frozen=True)
-class ChatEmbeddingsModelResult(BaseJsonResult, Sequence):
+class ChatEmbeddingsModelResult(BaseEmbeddingResult, BaseJsonResult):
     """
     Represents the result of a text embeddings model.
 
@@ -31,8 +32,8 @@ class ChatEmbeddingsModelResult(BaseJsonResult, Sequence):
     version of the model that is used to generate embeggings.
     """
 
-    #: the embedding vector as a tuple of floats
-    embedding: tuple[float, ...]
+    #: the embedding vector; it is a sequence of floats backed by a contiguous buffer
+    embedding: EmbeddingVector
     #: URI of the chat model used for generating the result
     model: str
     #: Usage statistics for the embedding request
@@ -48,7 +49,7 @@ class ChatEmbeddingsModelResult(BaseJsonResult, Sequence):
         first_data = raw_data[0]
         assert isinstance(first_data, dict)
         embedding = first_data.get('embedding')
-        assert isinstance(embedding, list)
+        assert isinstance(embedding, (list, str))
 
         usage: EmbeddingsUsage | None = None
         if usage_value := data.get('usage'):
@@ -59,32 +60,16 @@ class ChatEmbeddingsModelResult(BaseJsonResult, Sequence):
                 total_tokens=raw_usage['total_tokens']
             )
 
+        vector: EmbeddingVector
+        if isinstance(embedding, str):
+            # encoding_format='base64' gives raw little-endian float32 buffer,
+            # which is used as is without creating a Python float per element
+            vector = EmbeddingVector._from_bytes(base64.b64decode(embedding), typecode='f', byteorder='little')
+        else:
+            vector = EmbeddingVector(cast(list[float], embedding))
+
         return cls(
             model=model,
-            embedding=tuple(cast(list[float], embedding)),
+            embedding=vector,
             usage=usage
         )
-
-    def __len__(self):
-        return len(self.embedding)
-
-    @overload
-    def __getitem__(self, index: int, /) -> float:
-        pass
-
-    @overload
-    def __getitem__(self, slice_: slice, /) -> tuple[float, ...]:
-        pass
-
-    def __getitem__(self, index, /):
-        return self.embedding[index]
-
-    def __array__(self, dtype=None, copy=None):
-        import numpy  # pylint: disable=import-outside-toplevel
-
-        if copy is False:
-            raise ValueError(
-                "`copy=False` isn't supported. A copy is always created."
-            )
-
-        return numpy.array(self.embedding, dtype=dtype)
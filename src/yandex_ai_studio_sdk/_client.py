@@ -1,10 +1,13 @@
 # pylint: disable=too-many-instance-attributes
 from __future__ import annotations
 
+import asyncio
+import copy
 import sys
 import uuid
-from collections.abc import AsyncIterator, Iterator, Sequence
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from typing import Any, Literal, Protocol, TypeVar, cast
 
 import grpc
@@ -16,8 +19,13 @@ from yandex.cloud.endpoint.api_endpoint_service_pb2 import ListApiEndpointsReque
 from yandex.cloud.endpoint.api_endpoint_service_pb2_grpc import ApiEndpointServiceStub
 
 from ._auth import BaseAuth, get_auth_provider
+from ._channel_pool import ChannelPool, ChannelPoolConfig, PooledChannel
+from ._endpoint_cache import EndpointCache
 from ._exceptions import AioRpcError, HttpSseError, UnknownEndpointError
+from ._json_codec import JsonCodec, get_json_codec
+from ._logging import get_logger
 from ._logging.interceptors import get_log_interceprtors
+from ._response_cache import ResponseCache
 from ._retry import RETRY_KIND_METADATA_KEY, RetryKind, RetryPolicy
 from ._types.misc import PathLike, coerce_path
 from ._utils.http import HTTPServiceName, get_http_service_endpoint
@@ -30,9 +38,20 @@ class StubType(Protocol):
         ...
 
 
+logger = get_logger(__name__)
+
 _T = TypeVar('_T', bound=StubType)
 _D = TypeVar('_D', bound=Message)
 
+# NB: channel of the innermost get_service_stub block; streaming calls are pinning it,
+# because they could outlive the block they were started in
+_current_channel: ContextVar[tuple[ChannelPool, PooledChannel] | None] = ContextVar(
+    '_current_channel', default=None
+)
+
+# timeout of the background revalidation of cached service endpoints
+DEFAULT_SERVICE_MAP_TIMEOUT = 60
+
 TEMPORARY_ADDITIONAL_SERVICE_MAP = {
     'api.cloud.yandex.net:443': {
        'ai-tts-v3': 'tts.api.cloud.yandex.net:443'
@@ -42,6 +61,47 @@ TEMPORARY_ADDITIONAL_SERVICE_MAP = {
     }
 }
 
+class _SharedTransport(httpx_.AsyncBaseTransport):
+    """Wrapper around a pooled transport which is owned by AsyncCloudClient.
+
+    Short-lived httpx clients are closing their transport on exit, but
+    pooled connections must outlive them, so closing is a no-op here.
+    """
+
+    def __init__(self, transport: httpx_.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx_.Request) -> httpx_.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _AsyncClient(httpx_.AsyncClient):
+    """httpx client which encodes ``json=`` request bodies with the SDK json codec."""
+
+    def __init__(self, *, json_codec: JsonCodec, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._json_codec = json_codec
+
+    def build_request(  # type: ignore[override]
+        self,
+        method: str,
+        url: httpx_.URL | str,
+        *,
+        json: Any = None,
+        **kwargs: Any,
+    ) -> httpx_.Request:
+        if json is not None:
+            headers = httpx_.Headers(kwargs.pop('headers', None))
+            headers['Content-Type'] = 'application/json'
+            kwargs['headers'] = headers
+            kwargs['content'] = self._json_codec.dumps(json)
+
+        return super().build_request(method, url, **kwargs)
+
+
 def _get_user_agent() -> str:
     from . import __version__  # pylint: disable=import-outside-toplevel,cyclic-import
 
@@ -64,6 +124,12 @@ class AsyncCloudClient:
         retry_policy: RetryPolicy,
         enable_server_data_logging: bool | None,
         verify: PathLike | bool | None,
+        http_limits: httpx_.Limits | None = None,
+        http2: bool = False,
+        channel_pool: ChannelPoolConfig | None = None,
+        endpoint_cache: EndpointCache | None = None,
+        json_codec: JsonCodec | None = None,
+        response_cache: ResponseCache | None = None,
     ):
         self._endpoint = endpoint
         self._auth = auth
@@ -72,14 +138,24 @@ class AsyncCloudClient:
 
         self._service_map_override: dict[str, str] = service_map
         self._service_map: dict[str, str] = {}
+        self._endpoint_cache = endpoint_cache
+        # NB: True when service map was taken from the on-disk cache
+        # and wasn't confirmed by the endpoint service yet
+        self._service_map_cached = False
+        self._service_map_refresh: asyncio.Task[None] | None = None
 
+        self._retry_policy = retry_policy
         self._interceptors = (
             (tuple(interceptors) if interceptors else ()) +
             retry_policy.get_interceptors() +
             get_log_interceprtors()
         )
 
-        self._channels: dict[type[StubType], grpc.aio.Channel] = {}
+        self._channel_pool_config = channel_pool or ChannelPoolConfig()
+        # NB: channels are keyed by endpoint, so all of the stubs which are resolving
+        # to the same host are sharing connections; credentials and options
+        # are the same for every channel of the client
+        self._channel_pools: dict[str, ChannelPool] = {}
         self._endpoints: dict[type[StubType], str] = {}
 
         self._auth_lock = LazyLock()
@@ -89,6 +165,41 @@ class AsyncCloudClient:
         self._enable_server_data_logging = enable_server_data_logging
         self._verify = verify if verify is not None else True
 
+        self._json_codec = json_codec or get_json_codec('auto')
+        # NB: cache is shared with the clones, its backends are thread-safe
+        self._response_cache = response_cache
+        self._http_limits = http_limits or httpx_.Limits()
+        self._http2 = http2
+        # NB: connections are bound to the event loop they were opened in,
+        # so we are remembering loop alongside with the transport
+        self._http_transports: dict[str | None, tuple[asyncio.AbstractEventLoop, httpx_.AsyncHTTPTransport]] = {}
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        """Codec of the JSON bodies of HTTP requests and responses"""
+        return self._json_codec
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Client-side cache of the model responses, if enabled"""
+        return self._response_cache
+
+    def _clone(self) -> AsyncCloudClient:
+        """Returns a client with the same settings and credentials, but with
+        its own channels, transports and locks.
+
+        It is used to serve another event loop, because gRPC channels and
+        asyncio primitives can't be shared between loops.
+        """
+        clone = copy.copy(self)
+        clone._service_map_refresh = None
+        clone._channel_pools = {}
+        clone._endpoints = dict(self._endpoints)
+        clone._auth_lock = LazyLock()
+        clone._channels_lock = LazyLock()
+        clone._http_transports = {}
+        return clone
+
     async def _get_auth_provider(self) -> BaseAuth:
         if self._auth_provider is None:
             async with self._auth_lock():
@@ -102,26 +213,69 @@ class AsyncCloudClient:
         return self._auth_provider
 
     async def _init_service_map(self, timeout: float):
-        metadata = await self._get_metadata(auth_required=False, timeout=timeout, retry_kind=RetryKind.SINGLE)
-
         if not self._endpoint:
             raise RuntimeError('This method should be never called while endpoint=None')
 
-        channel = self._new_channel(self._endpoint)
-        async with channel:
-            stub = ApiEndpointServiceStub(channel)
+        if self._endpoint_cache and (cached := await self._endpoint_cache.load(self._endpoint)):
+            services, is_fresh = cached
+            self._service_map = services
+            self._service_map_cached = True
+            logger.debug(
+                'Service endpoints for %s were loaded from %s cache %s',
+                self._endpoint, 'fresh' if is_fresh else 'stale', self._endpoint_cache.path
+            )
+
+            if not is_fresh and not self._service_map_refresh:
+                # NB: stale map is still good enough to start right away,
+                # and it is revalidated in background
+                self._service_map_refresh = asyncio.create_task(
+                    self._refresh_service_map(timeout=timeout)
+                )
+            return
+
+        await self._fetch_service_map(timeout=timeout)
+
+    async def _refresh_service_map(self, timeout: float) -> None:
+        try:
+            await self._fetch_service_map(timeout=timeout)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning('Failed to revalidate cached service endpoints for %s', self._endpoint, exc_info=True)
+        finally:
+            self._service_map_refresh = None
+
+    async def _fetch_service_map(self, timeout: float) -> None:
+        assert self._endpoint
+
+        metadata = await self._get_metadata(auth_required=False, timeout=timeout, retry_kind=RetryKind.SINGLE)
+
+        # NB: channel to the cloud endpoint is pooled, so it will be reused
+        # by services which are living at the same host
+        pool = self._get_endpoint_channel_pool(self._endpoint)
+        pooled = pool.acquire()
+        try:
+            stub = ApiEndpointServiceStub(pooled.channel)
             response = await stub.List(
                 ListApiEndpointsRequest(),
                 timeout=timeout,
                 metadata=metadata,
             )  # type: ignore[misc]
-            for endpoint in response.endpoints:
-                self._service_map[endpoint.id] = endpoint.address
+        finally:
+            await pool.release(pooled)
+
+        service_map = {endpoint.id: endpoint.address for endpoint in response.endpoints}
+        if service_map != self._service_map:
+            # NB: endpoints resolved from the previous map could be outdated
+            self._endpoints = {}
+        self._service_map = service_map
+        self._service_map_cached = False
+
+        if self._endpoint_cache:
+            await self._endpoint_cache.save(self._endpoint, service_map)
 
     async def _discover_service_endpoint(
         self,
         service_name: str,
-        stub_class: type[StubType],
+        stub_class: type[StubType] | None,
         timeout: float
     ) -> str:
         endpoint: str | None
@@ -141,6 +295,12 @@ class AsyncCloudClient:
         if endpoint := self._service_map.get(service_name):
             return endpoint
 
+        if self._service_map_cached:
+            # cached map could be outdated and miss a newly added service
+            await self._fetch_service_map(timeout=timeout)
+            if endpoint := self._service_map.get(service_name):
+                return endpoint
+
         # NB: Problem is, tts-v3 service is not added to endpoints service
         # (I hope not added YET).
         # So, we are hardcoding this service into additional map.
@@ -204,9 +364,12 @@ class AsyncCloudClient:
 
         return metadata
 
-    def _get_options(self) -> tuple[tuple[str, str], ...]:
+    def _get_options(self) -> tuple[tuple[str, str | int], ...]:
         return (
             ("grpc.primary_user_agent", self._user_agent),
+            # NB: by default grpc shares subchannels with the same arguments between channels,
+            # so all of the pooled channels would be served by a single TCP connection
+            ("grpc.use_local_subchannel_pool", 1),
         )
 
     def _new_channel(self, endpoint: str) -> grpc.aio.Channel:
@@ -231,18 +394,29 @@ class AsyncCloudClient:
             options=self._get_options(),
         )
 
-    async def _get_channel(
+    def _get_endpoint_channel_pool(self, endpoint: str) -> ChannelPool:
+        if pool := self._channel_pools.get(endpoint):
+            return pool
+
+        pool = self._channel_pools[endpoint] = ChannelPool(
+            endpoint,
+            channel_factory=self._new_channel,
+            config=self._channel_pool_config,
+        )
+        return pool
+
+    async def _get_channel_pool(
         self,
         stub_class: type[_T],
         timeout: float,
         service_name: str | None = None,
-    ) -> grpc.aio.Channel:
-        if stub_class in self._channels:
-            return self._channels[stub_class]
+    ) -> ChannelPool:
+        if endpoint := self._endpoints.get(stub_class):
+            return self._get_endpoint_channel_pool(endpoint)
 
         async with self._channels_lock():
-            if stub_class in self._channels:
-                return self._channels[stub_class]
+            if endpoint := self._endpoints.get(stub_class):
+                return self._get_endpoint_channel_pool(endpoint)
 
             service_name = service_name if service_name else service_for_ctor(stub_class)
 
@@ -253,8 +427,68 @@ class AsyncCloudClient:
             )
 
             self._endpoints[stub_class] = endpoint
-            channel = self._channels[stub_class] = self._new_channel(endpoint)
-            return channel
+            return self._get_endpoint_channel_pool(endpoint)
+
+    async def _warmup_grpc_service(self, service_name: str, timeout: float) -> None:
+        async with self._channels_lock():
+            endpoint = await self._discover_service_endpoint(
+                service_name=service_name,
+                stub_class=None,
+                timeout=timeout,
+            )
+
+        pool = self._get_endpoint_channel_pool(endpoint)
+        pooled = pool.acquire()
+        try:
+            await asyncio.wait_for(pooled.channel.channel_ready(), timeout=timeout)
+        finally:
+            await pool.release(pooled)
+
+    async def _warmup_http_service(self, service_name: HTTPServiceName, timeout: float) -> None:
+        async with self.httpx(
+            timeout=timeout,
+            auth=False,
+            base_url=self._discover_http_endpoint(service_name),
+        ) as client:
+            # NB: response status doesn't matter, we need just
+            # an established connection in the pool
+            await client.head('')
+
+    async def warmup(
+        self,
+        *,
+        grpc_services: Iterable[str],
+        http_services: Iterable[HTTPServiceName],
+        timeout: float,
+    ) -> None:
+        """Concurrently obtains auth credentials, resolves endpoints and opens connections
+        to the given services, so the first real calls don't pay for it."""
+
+        # NB: endpoints discovery is serialized by the channels lock and the first one
+        # fills the whole service map, but channels are connecting concurrently
+        await asyncio.gather(
+            self._get_common_headers(auth_required=True, timeout=timeout),
+            *(
+                self._warmup_grpc_service(service_name, timeout=timeout)
+                for service_name in dict.fromkeys(grpc_services)
+            ),
+            *(
+                self._warmup_http_service(service_name, timeout=timeout)
+                for service_name in dict.fromkeys(http_services)
+            ),
+        )
+
+    def _invalidate_endpoint(self, stub_class: type[StubType]) -> None:
+        """Forgets the endpoint of the unavailable service, so it is resolved again for the next call."""
+        if self._endpoints.pop(stub_class, None) is None:
+            return
+
+        logger.debug('Endpoint of %s is unavailable, it will be resolved again', stub_class.__name__)
+        if self._service_map_cached and not self._service_map_refresh:
+            # NB: the service could be moved since the service map was cached
+            self._service_map_refresh = asyncio.create_task(
+                self._refresh_service_map(timeout=DEFAULT_SERVICE_MAP_TIMEOUT)
+            )
 
     @contextmanager
     def with_sdk_error(
@@ -263,7 +497,13 @@ class AsyncCloudClient:
     ) -> Iterator[None]:
         try:
             yield
+        except AioRpcError:
+            raise
         except grpc.aio.AioRpcError as original:
+            endpoint = self._endpoints.get(stub_class, '')
+            if original.code() == grpc.StatusCode.UNAVAILABLE:
+                self._invalidate_endpoint(stub_class)
+
             # .with_traceback(...) from None allows to mimic
             # original exception without increasing traceback with an
             # extra info, like
@@ -271,7 +511,7 @@ class AsyncCloudClient:
             # or # "The above exception was the direct cause of the following exception"
             raise AioRpcError.from_base_rpc_error(
                 original,
-                endpoint=self._endpoints[stub_class],
+                endpoint=endpoint,
                 auth=self._auth_provider,
                 stub_class=stub_class,
             ).with_traceback(original.__traceback__) from None
@@ -283,12 +523,17 @@ class AsyncCloudClient:
         timeout: float,
         service_name: str | None = None
     ) -> AsyncIterator[_T]:
-        # NB: right now get_service_stub is asynccontextmanager and it is unnecessary,
-        # but in future if we will make some ChannelPool, it could be handy to know,
-        # when "user" releases resource
-        channel = await self._get_channel(stub_class, timeout, service_name=service_name)
-        with self.with_sdk_error(stub_class):
-            yield stub_class(channel)
+        # NB: get_service_stub is asynccontextmanager because channel pool needs to know
+        # when "user" releases resource to count calls running on every channel
+        pool = await self._get_channel_pool(stub_class, timeout, service_name=service_name)
+        pooled = pool.acquire()
+        token = _current_channel.set((pool, pooled))
+        try:
+            with self.with_sdk_error(stub_class):
+                yield stub_class(pooled.channel)
+        finally:
+            _current_channel.reset(token)
+            await pool.release(pooled)
 
     async def call_service_stream(
         self,
@@ -366,8 +611,61 @@ class AsyncCloudClient:
             metadata=metadata,
             timeout=timeout,
         )
+        if current := _current_channel.get():
+            pool, pooled = current
+            pool.pin(pooled, call)
         return call
 
+    def _get_httpx_verify(self) -> str | bool:
+        if isinstance(self._verify, bool):
+            return self._verify
+
+        return str(coerce_path(self._verify))
+
+    def _get_http_transport(self, base_url: str | None) -> httpx_.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        if pooled := self._http_transports.get(base_url):
+            transport_loop, transport = pooled
+            if transport_loop is loop:
+                return transport
+
+        # NB: in case of loop change we are just dropping old transport,
+        # because it is impossible to close its connections outside of its own loop
+        transport = httpx_.AsyncHTTPTransport(
+            verify=self._get_httpx_verify(),
+            limits=self._http_limits,
+            http2=self._http2,
+        )
+        self._http_transports[base_url] = (loop, transport)
+        return transport
+
+    async def close(self) -> None:
+        """Closes all pooled http connections and grpc channels of the client
+        and stops background refresh of the auth credentials."""
+
+        loop = asyncio.get_running_loop()
+        http_transports = [
+            transport for transport_loop, transport in self._http_transports.values()
+            if transport_loop is loop
+        ]
+        self._http_transports.clear()
+
+        if self._service_map_refresh:
+            self._service_map_refresh.cancel()
+            self._service_map_refresh = None
+
+        if self._auth_provider is not None:
+            await self._auth_provider.close()
+
+        channel_pools = list(self._channel_pools.values())
+        self._channel_pools.clear()
+
+        for transport in http_transports:
+            await transport.aclose()
+
+        for pool in channel_pools:
+            await pool.close()
+
     @asynccontextmanager
     async def httpx(
         self,
@@ -383,15 +681,15 @@ class AsyncCloudClient:
         headers.update(common_headers)
         headers.update(kwargs.pop('headers', {}))
 
-        verify: str | bool
-        if isinstance(self._verify, bool):
-            verify = self._verify
-        else:
-            verify = str(coerce_path(self._verify))
+        # NB: client itself is cheap to create when transport is passed,
+        # all of the connections are living at the pooled transport
+        transport = self._get_http_transport(kwargs.get('base_url'))
 
-        async with httpx_.AsyncClient(
+        async with _AsyncClient(
+            json_codec=self._json_codec,
             headers=headers,
-            verify=verify,
+            verify=self._get_httpx_verify(),
+            transport=_SharedTransport(transport),
             **kwargs,
         ) as client:
             yield client
@@ -418,7 +716,11 @@ class AsyncCloudClient:
         url: str,
         timeout: float,
         **kwargs: Any
-    ) -> AsyncIterator[httpx_sse.ServerSentEvent]:
+    ) -> AsyncIterator[Any]:
+        """Yields decoded JSON payloads of the server-sent events.
+
+        Every event is decoded exactly once, so consumers must not decode it again.
+        """
         async with self.httpx_for_service(service_name, timeout=timeout) as client:
             async with client.stream(
                 method=method,
@@ -432,7 +734,7 @@ class AsyncCloudClient:
                     if sse.data.startswith('[DONE]'):
                         break
 
-                    data = sse.json()
+                    data = self._json_codec.loads(sse.data)
                     if isinstance(data, dict) and data.get('error'):
                         error = data['error']
                         message: str | None = None
@@ -447,4 +749,4 @@ class AsyncCloudClient:
                             error=error
                         )
 
-                    yield sse
+                    yield data
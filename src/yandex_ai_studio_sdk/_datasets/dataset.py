@@ -3,11 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
-import tempfile
 from collections.abc import AsyncIterator, Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Final, TypeVar
 
 import aiofiles
 import httpx
@@ -25,20 +24,31 @@ from yandex_ai_studio_sdk._logging import get_logger
 from yandex_ai_studio_sdk._types.misc import UNDEFINED, PathLike, UndefinedOr, coerce_path, get_defined_value
 from yandex_ai_studio_sdk._types.proto import ProtoBased
 from yandex_ai_studio_sdk._types.resource import BaseDeleteableResource, safe_on_delete
+from yandex_ai_studio_sdk._utils.contextlib import aclosing
 from yandex_ai_studio_sdk._utils.doc import doc_from
+from yandex_ai_studio_sdk._utils.download import (
+    DEFAULT_DOWNLOAD_CHUNK_SIZE, DEFAULT_MAX_RESUME_ATTEMPTS, DownloadProgressCallback, iter_prefetched_files,
+    iter_url_bytes
+)
 from yandex_ai_studio_sdk._utils.packages import requires_package
-from yandex_ai_studio_sdk._utils.pyarrow import read_dataset_records
+from yandex_ai_studio_sdk._utils.pyarrow import read_dataset_batches, read_dataset_records, read_dataset_table
 from yandex_ai_studio_sdk._utils.sync import run_sync, run_sync_generator
 
 from .status import DatasetStatus
 
 if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
     from yandex_ai_studio_sdk._sdk import BaseSDK
 
 logger = get_logger(__name__)
 
 DEFAULT_CHUNK_SIZE = 100 * 1024 ** 2
 DEFAULT_MAX_PARALLEL_DOWNLOADS: Final[int] = 16 # maximum number of files open for writing during download
+DEFAULT_READ_PREFETCH: Final[int] = 2 # number of files downloading in background during read
+
+ItemT = TypeVar('ItemT')
 
 @dataclasses.dataclass(frozen=True)
 class ValidationErrorInfo(ProtoBased[ProtoValidationError]):
@@ -189,16 +199,28 @@ class BaseDataset(DatasetInfo, BaseDeleteableResource[ProtoDatasetInfo]):
         download_path: PathLike,
         timeout: float = 60,
         exist_ok: bool = False,
-        max_parallel_downloads: int = DEFAULT_MAX_PARALLEL_DOWNLOADS
+        max_parallel_downloads: int = DEFAULT_MAX_PARALLEL_DOWNLOADS,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
     ) -> tuple[Path, ...]:
         """Download a dataset to the specified path.
 
+        Files are streamed to the disk by chunks, so memory usage
+        doesn't depend on the size of the dataset.
+
         :param download_path: the path where the dataset will be downloaded.
         :param timeout: the timeout, or maximum time to wait for the download.
             Defaults to 60 seconds.
         :param exist_ok: if ``True``, do not raise an error if files already exist.
             Defaults to False.
         :param max_parallel_downloads: the maximum number of concurrent downloads.
+        :param chunk_size: the size of chunks in bytes to read from network and write to disk.
+            Defaults to 8 megabytes.
+        :param max_resume_attempts: the maximum number of attempts to resume each file download
+            from the last received byte after a network failure. Defaults to 3.
+        :param progress_callback: a function which will be called with
+            a :py:class:`~.DownloadProgress` object after each received chunk of each file.
         """
         logger.debug("Downloading dataset %s", self.id)
 
@@ -214,6 +236,9 @@ class BaseDataset(DatasetInfo, BaseDeleteableResource[ProtoDatasetInfo]):
             exist_ok=exist_ok,
             timeout=timeout,
             max_parallel_downloads=max_parallel_downloads,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
         ), timeout)
 
     async def _read(
@@ -221,14 +246,178 @@ class BaseDataset(DatasetInfo, BaseDeleteableResource[ProtoDatasetInfo]):
         *,
         timeout: float,
         batch_size: UndefinedOr[int],
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
     ) -> AsyncIterator[dict[Any, Any]]:
         """Read dataset records; reading is implemented by batched process and requires RAM equal to the batch size.
 
         :param timeout: the maximum time to wait for the download operation.
         :param batch_size: the size of each batch to read in records; if undefined, defaults to ``None``.
+        :param chunk_size: the size of chunks in bytes to read from network.
+        :param max_resume_attempts: the maximum number of attempts to resume each file download.
+        :param progress_callback: a function which will be called with a download progress of each file.
+        :param prefetch: the number of next dataset files to download while the current one is being read.
+        """
+        batch_size_ = get_defined_value(batch_size, None)
+
+        def read_file(filename: str) -> AsyncIterator[dict[Any, Any]]:
+            return read_dataset_records(filename, batch_size=batch_size_)
+
+        # NB: closing of this generator must close the nested ones, so
+        # pending downloads and temporary files are cleaned up right away
+        async with aclosing(self.__read_files(
+            read_file,
+            timeout=timeout,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )) as records:
+            async for record in records:
+                yield record
+
+    async def _read_batches(
+        self,
+        *,
+        timeout: float = 60,
+        batch_size: UndefinedOr[int] = UNDEFINED,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
+    ) -> AsyncIterator[pyarrow.RecordBatch]:
+        """Reads the dataset from backend and yields it by :py:class:`pyarrow.RecordBatch` objects.
+
+        This is the fastest way to process large datasets, because records are not converted
+        to Python objects; memory usage is limited by the size of one batch.
+
+        .. note::
+            This method creates temporary files in the system's default temporary directory
+            during operation. Temporary files are automatically cleaned up after use.
+
+        :param timeout: Maximum time in seconds for both gRPC and HTTP operations.
+            Defaults to 60 seconds.
+        :param batch_size: Maximum number of records in one batch.
+            When UNDEFINED (default), uses backend's optimal batch size.
+        :param chunk_size: Size of chunks in bytes to read from network. Defaults to 8 megabytes.
+        :param max_resume_attempts: Maximum number of attempts to resume each file download
+            from the last received byte after a network failure. Defaults to 3.
+        :param progress_callback: Function which will be called with
+            a :py:class:`~.DownloadProgress` object after each received chunk of each file.
+        :param prefetch: Number of next dataset files which are downloaded in background
+            while the current one is being decoded; at most ``prefetch + 1`` files are stored
+            in temporary directory at once. ``0`` disables prefetching. Defaults to 2.
+        :yields: :py:class:`pyarrow.RecordBatch` objects in the order of dataset files.
         """
         batch_size_ = get_defined_value(batch_size, None)
 
+        def read_file(filename: str) -> AsyncIterator[pyarrow.RecordBatch]:
+            return read_dataset_batches(filename, batch_size=batch_size_)
+
+        async with aclosing(self.__read_files(
+            read_file,
+            timeout=timeout,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )) as batches:
+            async for batch in batches:
+                yield batch
+
+    async def _read_arrow(
+        self,
+        *,
+        timeout: float = 60,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
+    ) -> pyarrow.Table:
+        """Reads the whole dataset from backend into one :py:class:`pyarrow.Table`.
+
+        Each dataset file is decoded in a separate thread as a whole;
+        the resulting table requires RAM equal to the size of the dataset.
+
+        :param timeout: Maximum time in seconds for both gRPC and HTTP operations.
+            Defaults to 60 seconds.
+        :param chunk_size: Size of chunks in bytes to read from network. Defaults to 8 megabytes.
+        :param max_resume_attempts: Maximum number of attempts to resume each file download
+            from the last received byte after a network failure. Defaults to 3.
+        :param progress_callback: Function which will be called with
+            a :py:class:`~.DownloadProgress` object after each received chunk of each file.
+        :param prefetch: Number of next dataset files which are downloaded in background
+            while the current one is being decoded; at most ``prefetch + 1`` files are stored
+            in temporary directory at once. ``0`` disables prefetching. Defaults to 2.
+        """
+        import pyarrow  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        async def read_file(filename: str) -> AsyncIterator[pyarrow.Table]:
+            yield await read_dataset_table(filename)
+
+        async with aclosing(self.__read_files(
+            read_file,
+            timeout=timeout,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )) as tables_iter:
+            tables = [table async for table in tables_iter]
+        if not tables:
+            return pyarrow.table({})
+
+        return pyarrow.concat_tables(tables)
+
+    async def _read_pandas(
+        self,
+        *,
+        timeout: float = 60,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
+    ) -> pandas.DataFrame:
+        """Reads the whole dataset from backend into one :py:class:`pandas.DataFrame`.
+
+        It is a shortcut for :py:meth:`read_arrow` followed by :py:meth:`pyarrow.Table.to_pandas`,
+        which is performed in a separate thread.
+
+        :param timeout: Maximum time in seconds for both gRPC and HTTP operations.
+            Defaults to 60 seconds.
+        :param chunk_size: Size of chunks in bytes to read from network. Defaults to 8 megabytes.
+        :param max_resume_attempts: Maximum number of attempts to resume each file download
+            from the last received byte after a network failure. Defaults to 3.
+        :param progress_callback: Function which will be called with
+            a :py:class:`~.DownloadProgress` object after each received chunk of each file.
+        :param prefetch: Number of next dataset files which are downloaded in background
+            while the current one is being decoded; at most ``prefetch + 1`` files are stored
+            in temporary directory at once. ``0`` disables prefetching. Defaults to 2.
+        """
+        table = await self._read_arrow(
+            timeout=timeout,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )
+        return await asyncio.to_thread(table.to_pandas)
+
+    async def __read_files(
+        self,
+        read_file: Callable[[str], AsyncIterator[ItemT]],
+        *,
+        timeout: float,
+        chunk_size: int,
+        max_resume_attempts: int,
+        progress_callback: DownloadProgressCallback | None,
+        prefetch: int,
+    ) -> AsyncIterator[ItemT]:
+        if prefetch < 0:
+            raise ValueError('prefetch must be non-negative')
+
         urls = await self._get_download_urls(timeout=timeout)
 
         def key_comparator(item: tuple[str, str]) -> tuple[int, int | str]:
@@ -242,39 +431,55 @@ class BaseDataset(DatasetInfo, BaseDeleteableResource[ProtoDatasetInfo]):
         sorted_urls = sorted(urls, key=key_comparator)
 
         async with self._client.httpx(timeout=timeout, auth=False) as client:
-            for key, url in sorted_urls:
-                with tempfile.NamedTemporaryFile(delete=False) as tmp:
-                    filename = tmp.name
+            async def download(path: Path, key: str, url: str) -> None:
+                await self.__download_file(
+                    path=path,
+                    key=key,
+                    url=url,
+                    client=client,
+                    timeout=timeout,
+                    chunk_size=chunk_size,
+                    max_resume_attempts=max_resume_attempts,
+                    progress_callback=progress_callback,
+                )
 
-                path = Path(filename)
-                try:
-                    await self.__download_file(
-                        path=path,
-                        url=url,
-                        client=client,
-                        timeout=timeout
-                    )
-                    async for record in read_dataset_records(filename, batch_size=batch_size_):
-                        yield record
-                finally:
-                    if path.exists():
-                        path.unlink()
+            async with aclosing(iter_prefetched_files(
+                sorted_urls,
+                download=download,
+                read_file=read_file,
+                prefetch=prefetch,
+            )) as items:
+                async for item in items:
+                    yield item
 
+    # pylint: disable-next=too-many-locals
     async def __download_impl(
         self,
         base_path: Path,
         exist_ok: bool,
         timeout: float,
-        max_parallel_downloads: int = DEFAULT_MAX_PARALLEL_DOWNLOADS
+        max_parallel_downloads: int,
+        chunk_size: int,
+        max_resume_attempts: int,
+        progress_callback: DownloadProgressCallback | None,
     ) -> tuple[Path, ...]:
         urls = await self._get_download_urls(timeout=timeout)
 
         async with self._client.httpx(timeout=timeout, auth=False) as client:
             semaphore = asyncio.Semaphore(max_parallel_downloads)
 
-            async def limited_download(file_path, url) -> None:
+            async def limited_download(file_path: Path, key: str, url: str) -> None:
                 async with semaphore:
-                    await self.__download_file(file_path, url, client, timeout=timeout)
+                    await self.__download_file(
+                        path=file_path,
+                        key=key,
+                        url=url,
+                        client=client,
+                        timeout=timeout,
+                        chunk_size=chunk_size,
+                        max_resume_attempts=max_resume_attempts,
+                        progress_callback=progress_callback,
+                    )
 
             coroutines = []
             for key, url in urls:
@@ -283,7 +488,7 @@ class BaseDataset(DatasetInfo, BaseDeleteableResource[ProtoDatasetInfo]):
                     raise ValueError(f"{file_path} already exists")
 
                 coroutines.append(
-                    limited_download(file_path, url)
+                    limited_download(file_path, key, url)
                 )
 
             await asyncio.gather(*coroutines)
@@ -292,30 +497,32 @@ class BaseDataset(DatasetInfo, BaseDeleteableResource[ProtoDatasetInfo]):
 
     async def __download_file(
         self,
+        *,
         path: Path | str,
+        key: str,
         url: str,
         client: httpx.AsyncClient,
         timeout: float,
+        chunk_size: int,
+        max_resume_attempts: int,
+        progress_callback: DownloadProgressCallback | None,
     ) -> None:
         async with aiofiles.open(path, "wb") as file:
             logger.debug(
                 'Going to download file for dataset %s from url %s to %s',
                 self.id, url, file.name
             )
-            async for chunk in self.__read_from_url(url, client, timeout=timeout):
-                await file.write(chunk)
-
-    async def __read_from_url(
-        self,
-        url: str,
-        client: httpx.AsyncClient,
-        timeout: float,
-        chunk_size: int = 1024 * 1024 * 8,  # 8Mb
-    ) -> AsyncIterator[bytes]:
-        resp = await client.get(url, timeout=timeout)
-        resp.raise_for_status()
-        async for chunk in resp.aiter_bytes(chunk_size=chunk_size):
-            yield chunk
+            async with aclosing(iter_url_bytes(
+                client,
+                url,
+                key=key,
+                timeout=timeout,
+                chunk_size=chunk_size,
+                max_resume_attempts=max_resume_attempts,
+                progress_callback=progress_callback,
+            )) as chunks:
+                async for chunk in chunks:
+                    await file.write(chunk)
 
     async def _list_upload_formats(
         self,
@@ -479,12 +686,18 @@ class AsyncDataset(BaseDataset):
         timeout: float = 60,
         exist_ok: bool = False,
         max_parallel_downloads: int = DEFAULT_MAX_PARALLEL_DOWNLOADS,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
     ) -> tuple[Path, ...]:
         return await self._download(
             download_path=download_path,
             timeout=timeout,
             exist_ok=exist_ok,
             max_parallel_downloads=max_parallel_downloads,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
         )
 
     @requires_package('pyarrow', '>=19', 'AsyncDataset.read')
@@ -493,6 +706,10 @@ class AsyncDataset(BaseDataset):
         *,
         timeout: float = 60,
         batch_size: UndefinedOr[int] = UNDEFINED,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
     ) -> AsyncIterator[dict[Any, Any]]:
         """Reads the dataset from backend and yields it records one by one.
 
@@ -511,15 +728,90 @@ class AsyncDataset(BaseDataset):
         :param batch_size: Number of records to load to memory in one chunk.
             When UNDEFINED (default), uses backend's optimal chunk size (typically
             corresponds to distinct Parquet files storage layout).
+        :param chunk_size: Size of chunks in bytes to read from network. Defaults to 8 megabytes.
+        :param max_resume_attempts: Maximum number of attempts to resume each file download
+            from the last received byte after a network failure. Defaults to 3.
+        :param progress_callback: Function which will be called with
+            a :py:class:`~.DownloadProgress` object after each received chunk of each file.
+        :param prefetch: Number of next dataset files which are downloaded in background
+            while the current one is being decoded; at most ``prefetch + 1`` files are stored
+            in temporary directory at once. ``0`` disables prefetching. Defaults to 2.
         :yields: Dictionary representing single record with field-value pairs
 
         """
 
-        async for record in self._read(
+        async with aclosing(self._read(
             timeout=timeout,
-            batch_size=batch_size
-        ):
-            yield record
+            batch_size=batch_size,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )) as records:
+            async for record in records:
+                yield record
+
+    @requires_package('pyarrow', '>=19', 'AsyncDataset.read_batches')
+    @doc_from(BaseDataset._read_batches)
+    async def read_batches(
+        self,
+        *,
+        timeout: float = 60,
+        batch_size: UndefinedOr[int] = UNDEFINED,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
+    ) -> AsyncIterator[pyarrow.RecordBatch]:
+        async with aclosing(self._read_batches(
+            timeout=timeout,
+            batch_size=batch_size,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )) as batches:
+            async for batch in batches:
+                yield batch
+
+    @requires_package('pyarrow', '>=19', 'AsyncDataset.read_arrow')
+    @doc_from(BaseDataset._read_arrow)
+    async def read_arrow(
+        self,
+        *,
+        timeout: float = 60,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
+    ) -> pyarrow.Table:
+        return await self._read_arrow(
+            timeout=timeout,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )
+
+    @requires_package('pyarrow', '>=19', 'AsyncDataset.read_pandas')
+    @requires_package('pandas', '>=1.0', 'AsyncDataset.read_pandas')
+    @doc_from(BaseDataset._read_pandas)
+    async def read_pandas(
+        self,
+        *,
+        timeout: float = 60,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
+    ) -> pandas.DataFrame:
+        return await self._read_pandas(
+            timeout=timeout,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )
 
 
 class Dataset(BaseDataset):
@@ -528,6 +820,9 @@ class Dataset(BaseDataset):
     __list_upload_formats = run_sync(BaseDataset._list_upload_formats)
     __download = run_sync(BaseDataset._download)
     __read = run_sync_generator(BaseDataset._read)
+    __read_batches = run_sync_generator(BaseDataset._read_batches)
+    __read_arrow = run_sync(BaseDataset._read_arrow)
+    __read_pandas = run_sync(BaseDataset._read_pandas)
 
     @doc_from(BaseDataset._update)
     def update(
@@ -568,11 +863,19 @@ class Dataset(BaseDataset):
         download_path: PathLike,
         timeout: float = 60,
         exist_ok: bool = False,
+        max_parallel_downloads: int = DEFAULT_MAX_PARALLEL_DOWNLOADS,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
     ) -> tuple[Path, ...]:
         return self.__download(
             download_path=download_path,
             timeout=timeout,
             exist_ok=exist_ok,
+            max_parallel_downloads=max_parallel_downloads,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
         )
 
     @requires_package('pyarrow', '>=19', 'Dataset.read')
@@ -581,6 +884,10 @@ class Dataset(BaseDataset):
         *,
         timeout: float = 60,
         batch_size: UndefinedOr[int] = UNDEFINED,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
     ) -> Iterator[dict[Any, Any]]:
         """Reads the dataset from backend and yields it records one by one.
 
@@ -599,13 +906,85 @@ class Dataset(BaseDataset):
         :param batch_size: Number of records to load to memory in one chunk.
             When UNDEFINED (default), uses backend's optimal chunk size (typically
             corresponds to distinct Parquet files storage layout).
+        :param chunk_size: Size of chunks in bytes to read from network. Defaults to 8 megabytes.
+        :param max_resume_attempts: Maximum number of attempts to resume each file download
+            from the last received byte after a network failure. Defaults to 3.
+        :param progress_callback: Function which will be called with
+            a :py:class:`~.DownloadProgress` object after each received chunk of each file.
+        :param prefetch: Number of next dataset files which are downloaded in background
+            while the current one is being decoded; at most ``prefetch + 1`` files are stored
+            in temporary directory at once. ``0`` disables prefetching. Defaults to 2.
         :yields: Dictionary representing single record with field-value pairs
 
         """
 
         yield from self.__read(
             timeout=timeout,
-            batch_size=batch_size
+            batch_size=batch_size,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )
+
+    @requires_package('pyarrow', '>=19', 'Dataset.read_batches')
+    @doc_from(BaseDataset._read_batches)
+    def read_batches(
+        self,
+        *,
+        timeout: float = 60,
+        batch_size: UndefinedOr[int] = UNDEFINED,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        yield from self.__read_batches(
+            timeout=timeout,
+            batch_size=batch_size,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )
+
+    @requires_package('pyarrow', '>=19', 'Dataset.read_arrow')
+    @doc_from(BaseDataset._read_arrow)
+    def read_arrow(
+        self,
+        *,
+        timeout: float = 60,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
+    ) -> pyarrow.Table:
+        return self.__read_arrow(
+            timeout=timeout,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
+        )
+
+    @requires_package('pyarrow', '>=19', 'Dataset.read_pandas')
+    @requires_package('pandas', '>=1.0', 'Dataset.read_pandas')
+    @doc_from(BaseDataset._read_pandas)
+    def read_pandas(
+        self,
+        *,
+        timeout: float = 60,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+        progress_callback: DownloadProgressCallback | None = None,
+        prefetch: int = DEFAULT_READ_PREFETCH,
+    ) -> pandas.DataFrame:
+        return self.__read_pandas(
+            timeout=timeout,
+            chunk_size=chunk_size,
+            max_resume_attempts=max_resume_attempts,
+            progress_callback=progress_callback,
+            prefetch=prefetch,
         )
 
 
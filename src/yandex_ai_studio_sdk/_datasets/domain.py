@@ -21,6 +21,7 @@ from yandex_ai_studio_sdk._utils.sync import run_sync, run_sync_generator
 from .dataset import AsyncDataset, Dataset, DatasetTypeT
 from .draft import AsyncDatasetDraft, DatasetDraft, DatasetDraftT
 from .schema import DatasetUploadSchema
+from .sources import DatasetSource, is_dataset_source
 from .status import DatasetStatus
 from .task_types import KnownTaskType, TaskTypeProxy
 
@@ -34,6 +35,7 @@ DatasetStatusInput: TypeAlias = Union[SingleDatasetStatus, Iterable[SingleDatase
 
 class BaseDatasets(BaseDomain, Generic[DatasetTypeT, DatasetDraftT]):
     """This class provides methods to create and manage datasets of a specific type."""
+    _grpc_services = ('ai-foundation-models', )
     #: the implementation type for the dataset
     _dataset_impl: type[DatasetTypeT]
     #: the implementation type for the dataset draft
@@ -88,6 +90,51 @@ class BaseDatasets(BaseDomain, Generic[DatasetTypeT, DatasetDraftT]):
             allow_data_logging=get_defined_value(allow_data_logging, None),
         )
 
+    def draft_from_data(
+        self,
+        data: DatasetSource,
+        *,
+        task_type: UndefinedOr[str] = UNDEFINED,
+        upload_format: str = 'jsonlines',
+        name: UndefinedOr[str] = UNDEFINED,
+        description: UndefinedOr[str] = UNDEFINED,
+        metadata: UndefinedOr[str] = UNDEFINED,
+        labels: UndefinedOr[dict[str, str]] = UNDEFINED,
+        allow_data_logging: UndefinedOr[bool] = UNDEFINED,
+    ) -> DatasetDraftT:
+        """Create a new dataset draft from in-memory data.
+
+        Data is serialized incrementally during the upload, without writing it
+        to an intermediate file first (unless it is bigger than one upload chunk).
+
+        :param data: a sync or async iterable of records (dicts), :py:class:`pyarrow.Table`,
+            :py:class:`pyarrow.RecordBatch`, :py:class:`pyarrow.RecordBatchReader`
+            or :py:class:`pandas.DataFrame`.
+        :param task_type: the type of task for the dataset.
+        :param upload_format: the format in which the data should be serialized and uploaded;
+            only ``jsonlines`` is supported for now.
+        :param name: the name of the dataset.
+        :param description: a description of the dataset.
+        :param metadata: metadata associated with the dataset.
+        :param labels: a set of labels for the dataset.
+        :param allow_data_logging: a flag indicating if data logging is allowed.
+        """
+        if not is_dataset_source(data):
+            raise TypeError(f'unsupported type of data: {type(data)}; use draft_from_path for files')
+
+        logger.debug('Creating a new (local) dataset draft of type %s from in-memory data', task_type)
+        return self._dataset_draft_impl(
+            _domain=self,
+            source=data,
+            task_type=get_defined_value(task_type, None),
+            upload_format=upload_format,
+            name=get_defined_value(name, None),
+            description=get_defined_value(description, None),
+            metadata=get_defined_value(metadata, None),
+            labels=get_defined_value(labels, None),
+            allow_data_logging=get_defined_value(allow_data_logging, None),
+        )
+
     async def _create_impl(
         self,
         *,
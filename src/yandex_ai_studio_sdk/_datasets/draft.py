@@ -10,12 +10,15 @@ from yandex.cloud.ai.dataset.v1.dataset_service_pb2 import ValidateDatasetReques
 from yandex.cloud.ai.dataset.v1.dataset_service_pb2_grpc import DatasetServiceStub
 from yandex.cloud.operation.operation_pb2 import Operation as ProtoOperation
 from yandex_ai_studio_sdk._logging import get_logger
+from yandex_ai_studio_sdk._polling import PollIntervalType
 from yandex_ai_studio_sdk._types.misc import PathLike, coerce_path
 from yandex_ai_studio_sdk._types.operation import AsyncOperation, Operation, OperationTypeT, ReturnsOperationMixin
 from yandex_ai_studio_sdk._utils.doc import doc_from
 from yandex_ai_studio_sdk._utils.sync import run_sync
 
 from .dataset import AsyncDataset, Dataset, DatasetTypeT
+from .manifest import UploadManifest
+from .sources import DatasetSource
 from .uploaders import DEFAULT_CHUNK_SIZE, create_uploader
 from .validation import DatasetValidationResult
 
@@ -54,6 +57,8 @@ class BaseDatasetDraft(Generic[DatasetTypeT, OperationTypeT], ReturnsOperationMi
     labels: dict[str, str] | None = None
     #: a flag indicating if iy\t is allowed to use the dataset to improve the models quality. Default false.
     allow_data_logging: bool | None = None
+    #: in-memory data to upload instead of a file at ``path``
+    source: DatasetSource | None = None
 
     @property
     def _sdk(self) -> BaseSDK:
@@ -66,9 +71,11 @@ class BaseDatasetDraft(Generic[DatasetTypeT, OperationTypeT], ReturnsOperationMi
         if self.task_type is None:
             raise TypeError('task_type should be not None to upload a dataset')
 
-        # NB: in future it must be xor with a stream attr
-        if self.path is None:
-            raise TypeError('path should be not None to upload a dataset')
+        if self.path is None and self.source is None:
+            raise TypeError('path or source should be not None to upload a dataset')
+
+        if self.path is not None and self.source is not None:
+            raise TypeError('only one of path or source should be specified to upload a dataset')
 
         if self.path is not None:
             path = coerce_path(self.path)
@@ -141,6 +148,7 @@ class BaseDatasetDraft(Generic[DatasetTypeT, OperationTypeT], ReturnsOperationMi
         raise_on_validation_failure: bool = True,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         parallelism: int | None = None,
+        manifest_path: PathLike | None = None,
     ) -> OperationTypeT:
         """
         Creates a dataset object on the server, uploads data to S3, triggers validation of the created dataset, and waits for its completion.
@@ -155,45 +163,93 @@ class BaseDatasetDraft(Generic[DatasetTypeT, OperationTypeT], ReturnsOperationMi
             Default is defined by DEFAULT_CHUNK_SIZE.
         :param parallelism: the level of parallelism for the upload.
             Default is None, which means no limit.
+        :param manifest_path: the path of a local file to persist the upload progress to.
+            If the upload fails, the dataset draft is not deleted and the upload could be resumed
+            by calling this method again with the same ``manifest_path``; only parts that weren't uploaded
+            will be sent. The manifest is removed after a successful upload.
+            Note that presigned upload urls stored in the manifest expire after some time.
         """
         self.validate()
         assert self.task_type
         assert self.upload_format
-        assert self.path
+
+        data = self.path if self.path is not None else self.source
+        assert data is not None
+        if manifest_path is not None and self.path is None:
+            raise ValueError('manifest_path is supported only for uploads from path')
+
+        manifest: UploadManifest | None = None
+        dataset: DatasetTypeT | None = None
+        if manifest_path is not None:
+            manifest = UploadManifest.load(manifest_path)
+
+        if manifest is not None:
+            assert self.path
+            manifest.check_source(coerce_path(self.path))
+            # NB: part layout must be the same as in the interrupted upload
+            chunk_size = manifest.chunk_size
+            dataset = await self._domain._get(dataset_id=manifest.dataset_id, timeout=timeout)
+            logger.info('Resuming upload to dataset %s from manifest %s', dataset.id, manifest.manifest_path)
 
         uploader = create_uploader(
-            path_or_iterator=self.path,
+            path_or_iterator=data,
             chunk_size=chunk_size,
-            parallelism=parallelism
-        )
-
-        dataset = await self._domain._create_impl(
-            task_type=self.task_type,
+            parallelism=parallelism,
             upload_format=self.upload_format,
-            name=self.name,
-            description=self.description,
-            metadata=self.metadata,
-            labels=self.labels,
-            allow_data_logging=self.allow_data_logging,
-            timeout=timeout,
         )
 
-        logger.debug("Uploading data from path %s to dataset %s with %s uploader", self.path, dataset.id, uploader)
+        if dataset is None:
+            dataset = await self._domain._create_impl(
+                task_type=self.task_type,
+                upload_format=self.upload_format,
+                name=self.name,
+                description=self.description,
+                metadata=self.metadata,
+                labels=self.labels,
+                allow_data_logging=self.allow_data_logging,
+                timeout=timeout,
+            )
+
+        if manifest_path is not None and manifest is None:
+            assert self.path
+            path = coerce_path(self.path)
+            manifest = UploadManifest(
+                manifest_path=coerce_path(manifest_path),
+                dataset_id=dataset.id,
+                source_path=str(path.resolve()),
+                source_size=path.stat().st_size,
+                chunk_size=chunk_size,
+            )
+            await manifest.save()
+
+        origin = f'path {self.path}' if self.path is not None else 'in-memory source'
+        logger.debug("Uploading data from %s to dataset %s with %s uploader", origin, dataset.id, uploader)
         try:
             await uploader.upload(
-                self.path,
+                data,
                 dataset=dataset,
                 timeout=timeout,
-                upload_timeout=upload_timeout
+                upload_timeout=upload_timeout,
+                manifest=manifest,
             )
         except Exception:
+            if manifest is not None:
+                logger.warning(
+                    "Upload to dataset %s failed, it could be resumed with manifest_path=%s",
+                    dataset.id, manifest.manifest_path
+                )
+                raise
+
             logger.warning("Deleting dataset %s because of incompleted uploading", dataset.id)
             # in case of HTTP error while uploading we want to remove dataset draft,
             # because user don't have any access to this draft
             await dataset._delete(timeout=timeout)
             raise
 
-        logger.info("Data from path %s to dataset %s successfully uploaded", self.path, dataset.id)
+        if manifest is not None:
+            manifest.remove()
+
+        logger.info("Data from %s to dataset %s successfully uploaded", origin, dataset.id)
 
         operation = await self._validate_deferred(
             dataset=dataset,
@@ -207,7 +263,7 @@ class BaseDatasetDraft(Generic[DatasetTypeT, OperationTypeT], ReturnsOperationMi
         *,
         timeout: float = 60,
         poll_timeout: int = DEFAULT_OPERATION_POLL_TIMEOUT,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType = 60,
         **kwargs,
     ) -> DatasetTypeT:
         """
@@ -219,7 +275,8 @@ class BaseDatasetDraft(Generic[DatasetTypeT, OperationTypeT], ReturnsOperationMi
         :param poll_timeout: the time to wait for polling the operation status.
             Default is defined by DEFAULT_OPERATION_POLL_TIMEOUT.
         :param poll_interval: the interval at which to poll for operation status
-            Defaults to 60 seconds).
+            or a :py:class:`~yandex_ai_studio_sdk._polling.PollingStrategy` instance.
+            Defaults to 60 seconds.
         :param kwargs: additional keyword arguments passed to ``_upload_deferred``.
         """
         operation = await self._upload_deferred(
@@ -248,6 +305,7 @@ class AsyncDatasetDraft(BaseDatasetDraft[AsyncDataset, AsyncOperation[AsyncDatas
         raise_on_validation_failure: bool = True,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         parallelism: int | None = None,
+        manifest_path: PathLike | None = None,
     ) -> AsyncOperation[AsyncDataset]:
         return await self._upload_deferred(
             timeout=timeout,
@@ -255,6 +313,7 @@ class AsyncDatasetDraft(BaseDatasetDraft[AsyncDataset, AsyncOperation[AsyncDatas
             raise_on_validation_failure=raise_on_validation_failure,
             chunk_size=chunk_size,
             parallelism=parallelism,
+            manifest_path=manifest_path,
         )
 
     @doc_from(BaseDatasetDraft._upload)
@@ -265,9 +324,10 @@ class AsyncDatasetDraft(BaseDatasetDraft[AsyncDataset, AsyncOperation[AsyncDatas
         upload_timeout: float = 360,
         raise_on_validation_failure: bool = True,
         poll_timeout: int = DEFAULT_OPERATION_POLL_TIMEOUT,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType = 60,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         parallelism: int | None = None,
+        manifest_path: PathLike | None = None,
     ):
         return await self._upload(
             timeout=timeout,
@@ -277,6 +337,7 @@ class AsyncDatasetDraft(BaseDatasetDraft[AsyncDataset, AsyncOperation[AsyncDatas
             poll_interval=poll_interval,
             chunk_size=chunk_size,
             parallelism=parallelism,
+            manifest_path=manifest_path,
         )
 
 
@@ -296,6 +357,7 @@ class DatasetDraft(BaseDatasetDraft[Dataset, Operation[Dataset]]):
         raise_on_validation_failure: bool = True,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         parallelism: int | None = None,
+        manifest_path: PathLike | None = None,
     ) -> Operation[Dataset]:
         return self.__upload_deferred(
             timeout=timeout,
@@ -303,6 +365,7 @@ class DatasetDraft(BaseDatasetDraft[Dataset, Operation[Dataset]]):
             raise_on_validation_failure=raise_on_validation_failure,
             chunk_size=chunk_size,
             parallelism=parallelism,
+            manifest_path=manifest_path,
         )
 
     @doc_from(BaseDatasetDraft._upload)
@@ -313,9 +376,10 @@ class DatasetDraft(BaseDatasetDraft[Dataset, Operation[Dataset]]):
         upload_timeout: float = 360,
         raise_on_validation_failure: bool = True,
         poll_timeout: int = DEFAULT_OPERATION_POLL_TIMEOUT,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType = 60,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         parallelism: int | None = None,
+        manifest_path: PathLike | None = None,
     ):
         return self.__upload(
             timeout=timeout,
@@ -325,6 +389,7 @@ class DatasetDraft(BaseDatasetDraft[Dataset, Operation[Dataset]]):
             poll_interval=poll_interval,
             chunk_size=chunk_size,
             parallelism=parallelism,
+            manifest_path=manifest_path,
         )
 
 
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import os
+import pathlib
+from collections.abc import Iterable
+from typing import Any
+
+from typing_extensions import Self
+from yandex_ai_studio_sdk._logging import get_logger
+from yandex_ai_studio_sdk._types.misc import PathLike, coerce_path
+from yandex_ai_studio_sdk._utils.lock import LazyLock
+
+logger = get_logger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+@dataclasses.dataclass
+class UploadManifest:
+    """This class represents a local state of a dataset upload,
+    which is persisted to the disk after every uploaded part,
+    so an interrupted upload could be resumed later.
+
+    :param manifest_path: the path of the manifest file.
+    """
+    manifest_path: pathlib.Path
+    #: the id of the dataset which the data is uploading to
+    dataset_id: str
+    #: the absolute path of the uploading file
+    source_path: str
+    #: the size of the uploading file in bytes
+    source_size: int
+    #: the chunk size which was used to split the file into parts
+    chunk_size: int
+    #: presigned urls of multipart upload parts; empty for single part uploads
+    urls: list[str] = dataclasses.field(default_factory=list)
+    #: ETags of already uploaded parts by their numbers (starting with 1)
+    etags: dict[int, str] = dataclasses.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._lock = LazyLock()
+
+    @classmethod
+    def load(cls, manifest_path: PathLike) -> Self | None:
+        """Loads a manifest from the disk; returns None if it doesn't exist."""
+        manifest_path = coerce_path(manifest_path)
+        if not manifest_path.exists():
+            return None
+
+        data: dict[str, Any] = json.loads(manifest_path.read_text(encoding='utf-8'))
+        if data.get('version') != MANIFEST_VERSION:
+            raise ValueError(f'unsupported upload manifest version in {manifest_path}: {data.get("version")!r}')
+
+        return cls(
+            manifest_path=manifest_path,
+            dataset_id=data['dataset_id'],
+            source_path=data['source_path'],
+            source_size=data['source_size'],
+            chunk_size=data['chunk_size'],
+            urls=list(data['urls']),
+            etags={int(part): etag for part, etag in data['etags'].items()},
+        )
+
+    def check_source(self, path: pathlib.Path) -> None:
+        """Checks that manifest describes an upload of the given file."""
+        source_path = str(path.resolve())
+        source_size = path.stat().st_size
+        if self.source_path != source_path or self.source_size != source_size:
+            raise ValueError(
+                f'upload manifest {self.manifest_path} was created for {self.source_path} '
+                f'of size {self.source_size}, but {source_path} of size {source_size} is uploading'
+            )
+
+    def _dump(self) -> str:
+        return json.dumps({
+            'version': MANIFEST_VERSION,
+            'dataset_id': self.dataset_id,
+            'source_path': self.source_path,
+            'source_size': self.source_size,
+            'chunk_size': self.chunk_size,
+            'urls': self.urls,
+            'etags': {str(part): etag for part, etag in sorted(self.etags.items())},
+        })
+
+    def _write(self, content: str) -> None:
+        # NB: writing to a temporary file and replacing is atomic,
+        # so a crash in the middle of writing doesn't corrupt the manifest
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        tmp_path.write_text(content, encoding='utf-8')
+        os.replace(tmp_path, self.manifest_path)
+
+    async def save(self) -> None:
+        async with self._lock():
+            await asyncio.to_thread(self._write, self._dump())
+
+    async def set_urls(self, urls: Iterable[str]) -> None:
+        self.urls = list(urls)
+        await self.save()
+
+    async def add_part(self, part_number: int, etag: str) -> None:
+        self.etags[part_number] = etag
+        await self.save()
+
+    def remove(self) -> None:
+        logger.debug('Removing upload manifest %s', self.manifest_path)
+        self.manifest_path.unlink(missing_ok=True)
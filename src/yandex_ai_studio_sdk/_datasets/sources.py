@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import decimal
+import json
+import sys
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any, Union
+
+from typing_extensions import TypeAlias
+
+#: type alias for in-memory data which could be uploaded to a dataset:
+#: a sync or async iterable of records (dicts), :py:class:`pyarrow.Table`,
+#: :py:class:`pyarrow.RecordBatch`, :py:class:`pyarrow.RecordBatchReader`
+#: or :py:class:`pandas.DataFrame`
+DatasetSource: TypeAlias = Union[Iterable[dict[str, Any]], AsyncIterable[dict[str, Any]], Any]
+
+SUPPORTED_SOURCE_FORMATS = ('jsonlines', )
+
+# size of serialized blocks which are yielded by source serializers
+SERIALIZATION_BLOCK_SIZE = 1024 ** 2  # 1 Mb
+# number of rows which are serialized at once in a thread for columnar sources
+SERIALIZATION_BATCH_ROWS = 10_000
+
+
+def _is_instance_of(obj: Any, module: str, names: tuple[str, ...]) -> bool:
+    # NB: we don't want to import heavy optional packages just to check a type;
+    # if module wasn't imported by user, obj can't be an instance of its classes
+    if not (mod := sys.modules.get(module)):
+        return False
+
+    return isinstance(obj, tuple(getattr(mod, name) for name in names))
+
+
+def _is_arrow(source: Any) -> bool:
+    return _is_instance_of(source, 'pyarrow', ('Table', 'RecordBatch', 'RecordBatchReader'))
+
+
+def _is_pandas(source: Any) -> bool:
+    return _is_instance_of(source, 'pandas', ('DataFrame', ))
+
+
+def is_dataset_source(source: Any) -> bool:
+    if isinstance(source, (str, bytes, dict)):
+        return False
+
+    return (
+        _is_arrow(source) or
+        _is_pandas(source) or
+        isinstance(source, (Iterable, AsyncIterable))
+    )
+
+
+def _json_default(value: Any) -> Any:
+    # NB: pyarrow ``to_pylist`` gives Python objects for temporal, decimal and binary
+    # columns; they are serialized like ``pandas.DataFrame.to_json(date_format='iso')`` does
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        minutes, seconds = divmod(value.seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        seconds_str = f'{seconds}.{value.microseconds:06d}'.rstrip('0').rstrip('.')
+        return f'P{value.days}DT{hours}H{minutes}M{seconds_str}S'
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # NB: binary columns usually carry text; non UTF-8 data is reported by _dump_record
+        return bytes(value).decode('utf-8')
+
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _dump_record(record: dict[str, Any]) -> bytes:
+    try:
+        dumped = json.dumps(record, ensure_ascii=False, default=_json_default)
+    except UnicodeDecodeError:
+        columns = [
+            key for key, value in record.items()
+            if isinstance(value, (bytes, bytearray, memoryview)) and not _is_utf8(value)
+        ]
+        where = f'column {columns[0]!r}' if columns else 'a nested value'
+        raise TypeError(
+            f'binary data of {where} is not valid UTF-8 and could not be serialized to JSON lines; '
+            'decode or base64-encode it before the upload'
+        ) from None
+
+    return dumped.encode('utf-8') + b'\n'
+
+
+def _is_utf8(value: bytes | bytearray | memoryview) -> bool:
+    try:
+        bytes(value).decode('utf-8')
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _dump_records(records: Iterable[dict[str, Any]]) -> bytes:
+    return b''.join(_dump_record(record) for record in records)
+
+
+async def _iter_records_bytes(
+    records: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]]
+) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+
+    if isinstance(records, AsyncIterable):
+        async for record in records:
+            buffer += _dump_record(record)
+            if len(buffer) >= SERIALIZATION_BLOCK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+    else:
+        for record in records:
+            buffer += _dump_record(record)
+            if len(buffer) >= SERIALIZATION_BLOCK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def _iter_arrow_batches(source: Any) -> Iterator[Any]:
+    import pyarrow  # pylint: disable=import-outside-toplevel
+
+    if isinstance(source, pyarrow.Table):
+        yield from source.to_batches(max_chunksize=SERIALIZATION_BATCH_ROWS)
+    elif isinstance(source, pyarrow.RecordBatch):
+        for offset in range(0, source.num_rows, SERIALIZATION_BATCH_ROWS):
+            yield source.slice(offset, SERIALIZATION_BATCH_ROWS)
+    else:
+        yield from source
+
+
+def _iter_pandas_batches(source: Any) -> Iterator[Any]:
+    for offset in range(0, len(source), SERIALIZATION_BATCH_ROWS):
+        yield source.iloc[offset:offset + SERIALIZATION_BATCH_ROWS]
+
+
+def _dump_pandas_batch(batch: Any) -> bytes:
+    data: str = batch.to_json(orient='records', lines=True, force_ascii=False, date_format='iso')
+    return data.rstrip('\n').encode('utf-8') + b'\n'
+
+
+async def _iter_batches_bytes(batches: Iterator[Any], dump: Any) -> AsyncIterator[bytes]:
+    # NB: getting the next batch (which could be reading from a RecordBatchReader)
+    # and its serialization are both happening in a thread, one hop per batch
+    def get_next() -> bytes | None:
+        batch = next(batches, None)
+        if batch is None:
+            return None
+        return dump(batch)
+
+    while (data := await asyncio.to_thread(get_next)) is not None:
+        if data:
+            yield data
+
+
+def iter_source_bytes(source: DatasetSource, upload_format: str) -> AsyncIterator[bytes]:
+    """Serializes in-memory dataset source incrementally, block by block."""
+    if upload_format not in SUPPORTED_SOURCE_FORMATS:
+        raise ValueError(
+            f'upload_format {upload_format!r} is not supported for in-memory data, '
+            f'supported formats are: {", ".join(SUPPORTED_SOURCE_FORMATS)}'
+        )
+
+    if _is_arrow(source):
+        return _iter_batches_bytes(
+            _iter_arrow_batches(source),
+            lambda batch: _dump_records(batch.to_pylist()),
+        )
+
+    if _is_pandas(source):
+        return _iter_batches_bytes(_iter_pandas_batches(source), _dump_pandas_batch)
+
+    return _iter_records_bytes(source)
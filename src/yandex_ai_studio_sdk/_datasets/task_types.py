@@ -85,6 +85,11 @@ class DatasetsWrapper:
         """Returns ``sdk.datasets.draft_from_path`` function with predefined ``task_type``."""
         return partial(self._domain.draft_from_path, task_type=self._task_type)
 
+    @property
+    def draft_from_data(self):
+        """Returns ``sdk.datasets.draft_from_data`` function with predefined ``task_type``."""
+        return partial(self._domain.draft_from_data, task_type=self._task_type)
+
     @property
     def list_upload_formats(self):
         """Returns ``sdk.datasets.list_upload_formats`` function with predefined ``task type``."""
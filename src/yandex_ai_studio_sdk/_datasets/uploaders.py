@@ -2,17 +2,27 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import hashlib
 import math
+import os
 import pathlib
-from typing import TYPE_CHECKING
+import re
+import tempfile
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
 
 import aiofiles
+import httpx
 from yandex_ai_studio_sdk._logging import get_logger
+from yandex_ai_studio_sdk._retry import NoRetryPolicy, RetryPolicy
 from yandex_ai_studio_sdk._types.misc import PathLike, coerce_path, is_path_like
 from yandex_ai_studio_sdk._utils.doc import doc_from
 
+from .sources import DatasetSource, is_dataset_source, iter_source_bytes
+
 if TYPE_CHECKING:
     from .dataset import BaseDataset
+    from .manifest import UploadManifest
 
 logger = get_logger(__name__)
 
@@ -24,8 +34,156 @@ MAX_CHUNK_SIZE_PRETTY = '5GB'
 MIN_CHUNK_SIZE = 5 * 1024 ** 2  # 5 MB
 MIN_CHUNK_SIZE_PRETTY = '5MB'
 
+# size of blocks which are read from disk and sent to network while streaming a chunk
+UPLOAD_BLOCK_SIZE = 1024 ** 2  # 1 Mb
+
+# NB: S3 returns md5 of the object as an ETag only for simple (non-multipart and non-KMS) uploads
+MD5_ETAG_RE = re.compile(r'^"?([0-9a-fA-F]{32})"?$')
+
+
+class ETagMismatchError(RuntimeError):
+    pass
+
+
+async def _iter_file_range(
+    path: pathlib.Path,
+    offset: int,
+    length: int,
+    checksum: hashlib._Hash,
+) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, 'rb') as file_:
+        await file_.seek(offset)
+
+        remaining = length
+        while remaining > 0:
+            data = await file_.read(min(UPLOAD_BLOCK_SIZE, remaining))
+            if not data:
+                raise RuntimeError(f'file {path} was truncated during upload')
+
+            remaining -= len(data)
+            checksum.update(data)
+            yield data
+
 
-class BaseUploader(abc.ABC):
+def _check_etag(etag: str | None, checksum: hashlib._Hash) -> None:
+    if not etag or not (match := MD5_ETAG_RE.match(etag)):
+        return
+
+    if match.group(1).lower() != checksum.hexdigest():
+        raise ETagMismatchError(
+            f'uploaded data checksum {checksum.hexdigest()} does not match the returned ETag {etag}'
+        )
+
+
+def _is_retriable(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status in (httpx.codes.REQUEST_TIMEOUT, httpx.codes.TOO_MANY_REQUESTS)
+
+    return isinstance(error, (httpx.TransportError, ETagMismatchError))
+
+
+async def _put_with_retries(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    make_body: Callable[[hashlib._Hash], bytes | AsyncIterator[bytes]],
+    length: int,
+    timeout: float,
+    retry_policy: RetryPolicy,
+    description: str,
+) -> str | None:
+    max_attempts = 1 if isinstance(retry_policy, NoRetryPolicy) else retry_policy.max_attempts
+    # NB: negative max_attempts means infinite retries, as in the gRPC retry interceptor
+    infinite = max_attempts < 0
+    max_attempts = max(max_attempts, 1)
+
+    attempt = 0
+    while True:
+        checksum = hashlib.md5(usedforsecurity=False)
+        try:
+            response = await client.put(
+                url=url,
+                content=make_body(checksum),
+                # NB: presigned urls doesn't support chunked transfer encoding
+                headers={'Content-Length': str(length)},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+
+            etag = response.headers.get('etag')
+            _check_etag(etag, checksum)
+            return etag
+        except (httpx.HTTPError, ETagMismatchError) as e:
+            attempt += 1
+            if (attempt >= max_attempts and not infinite) or not _is_retriable(e):
+                raise
+
+            logger.warning(
+                'Upload of %s failed with %r, retrying (attempt %d of %s)',
+                description, e, attempt + 1, 'infinite' if infinite else max_attempts,
+            )
+            await retry_policy.sleep(attempt - 1, deadline=None)
+
+
+async def put_file_range(
+    client: httpx.AsyncClient,
+    url: str,
+    path: pathlib.Path,
+    *,
+    offset: int,
+    length: int,
+    timeout: float,
+    retry_policy: RetryPolicy,
+) -> str | None:
+    """Streams the ``[offset, offset + length)`` range of a file to the presigned url.
+
+    Data is read from the disk by small blocks during the request, so memory usage doesn't
+    depend on the length of the range. Failed requests are retried with the backoff of ``retry_policy``,
+    and, where possible, checksum of the sent data is verified against the returned ETag.
+
+    :returns: ETag of the uploaded data.
+    """
+    return await _put_with_retries(
+        client,
+        url,
+        make_body=lambda checksum: _iter_file_range(path, offset=offset, length=length, checksum=checksum),
+        length=length,
+        timeout=timeout,
+        retry_policy=retry_policy,
+        description=f'{length} bytes from {path} at offset {offset}',
+    )
+
+
+async def put_bytes(
+    client: httpx.AsyncClient,
+    url: str,
+    data: bytes,
+    *,
+    timeout: float,
+    retry_policy: RetryPolicy,
+) -> str | None:
+    """Uploads in-memory data to the presigned url with the same retries and checks as :func:`put_file_range`."""
+
+    def make_body(checksum: hashlib._Hash) -> bytes:
+        checksum.update(data)
+        return data
+
+    return await _put_with_retries(
+        client,
+        url,
+        make_body=make_body,
+        length=len(data),
+        timeout=timeout,
+        retry_policy=retry_policy,
+        description=f'{len(data)} bytes of in-memory data',
+    )
+
+
+SourceT = TypeVar('SourceT')
+
+
+class BaseUploader(abc.ABC, Generic[SourceT]):
     """This class provides a blueprint for different implementations of dataset uploads,
     accommodating various dataset sizes and upload strategies.
 
@@ -37,26 +195,41 @@ class BaseUploader(abc.ABC):
         self._parallelism = parallelism
 
     @abc.abstractmethod
-    async def upload(self, path_or_iterator: PathLike, /, dataset: BaseDataset, timeout: float, upload_timeout: float) -> None:
+    async def upload(
+        self,
+        path_or_iterator: SourceT,
+        /,
+        dataset: BaseDataset,
+        timeout: float,
+        upload_timeout: float,
+        manifest: UploadManifest | None = None,
+    ) -> None:
         """Upload the dataset to a specified location.
 
         :param path_or_iterator: the path or iterator to the data to be uploaded.
         :param dataset: the dataset object containing metadata and methods for upload.
         :param timeout: the overall time to wait for the upload operation.
         :param upload_timeout: the time to wait for individual upload requests.
+        :param manifest: the manifest to persist upload progress to and to resume upload from.
         """
         pass
 
 
-def create_uploader(path_or_iterator: PathLike, chunk_size: int, parallelism: int | None) -> BaseUploader:
+def create_uploader(
+    path_or_iterator: PathLike | DatasetSource,
+    chunk_size: int,
+    parallelism: int | None,
+    upload_format: str = 'jsonlines',
+) -> BaseUploader[Any]:
     """Create an appropriate uploader based on the provided parameters.
 
-    :param path_or_iterator: the path or iterator to the data to be uploaded.
+    :param path_or_iterator: the path or in-memory data source to be uploaded.
     :param chunk_size: the size of chunks to upload.
     :param parallelism: the level of parallelism for uploads.
+    :param upload_format: the format to serialize in-memory data to.
     """
-    if not is_path_like(path_or_iterator):
-        raise NotImplementedError('only paths are supported yet')
+    if not is_path_like(path_or_iterator) and not is_dataset_source(path_or_iterator):
+        raise TypeError(f'unsupported type of data to upload: {type(path_or_iterator)}')
 
     if chunk_size <= 0:
         chunk_size = DEFAULT_CHUNK_SIZE
@@ -68,31 +241,44 @@ def create_uploader(path_or_iterator: PathLike, chunk_size: int, parallelism: in
             f'{MAX_CHUNK_SIZE} bytes ({MAX_CHUNK_SIZE_PRETTY})'
         )
 
+    parallelism = parallelism or 1
+    parallelism = max(parallelism, 1)
+
+    if not is_path_like(path_or_iterator):
+        return SourceUploader(chunk_size=chunk_size, parallelism=parallelism, upload_format=upload_format)
+
     path = coerce_path(path_or_iterator)
     size = path.stat().st_size
 
-    kls: type[BaseUploader]
+    kls: type[BaseUploader[PathLike]]
     if size <= chunk_size:
         kls = SingleUploader
     else:
         kls = MultipartUploader
 
-    parallelism = parallelism or 1
-    parallelism = max(parallelism, 1)
-
     return kls(chunk_size=chunk_size, parallelism=parallelism)
 
 
-class SingleUploader(BaseUploader):
+class SingleUploader(BaseUploader[PathLike]):
     """This class implements the upload method for datasets that can be uploaded in one go without needing to split into multiple parts."""
 
-    async def upload(self, path: PathLike, /, dataset: BaseDataset, timeout: float, upload_timeout: float) -> None:
+    async def upload(
+        self,
+        path: PathLike,
+        /,
+        dataset: BaseDataset,
+        timeout: float,
+        upload_timeout: float,
+        manifest: UploadManifest | None = None,
+    ) -> None:
         """Upload the dataset using a single request or a multipart upload.
 
         :param path: the path to the data to be uploaded.
         :param dataset: the dataset object containing metadata and methods for upload.
         :param timeout: the overall time to wait for the upload operation.
         :param upload_timeout: the time to wait for the individual upload request.
+        :param manifest: the manifest to persist upload progress to and to resume upload from;
+            a single part upload is always restarted from the beginning.
         """
         path = coerce_path(path)
         size = path.stat().st_size
@@ -100,23 +286,22 @@ class SingleUploader(BaseUploader):
         # pylint: disable=protected-access
         presigned_url = await dataset._get_upload_url(size=size, timeout=timeout)
         logger.debug('Uploading data from %s to presigned url', path)
-        async with aiofiles.open(path, mode='rb') as file_:
-            data = await file_.read()
 
-        # NB: here will be retries at sometime
         async with dataset._client.httpx(timeout=timeout, auth=False) as client:
-            response = await client.put(
-                url=presigned_url,
-                content=data,
+            await put_file_range(
+                client,
+                presigned_url,
+                path,
+                offset=0,
+                length=size,
                 timeout=upload_timeout,
+                retry_policy=dataset._client._retry_policy,
             )
 
-        logger.debug("Data upload from %s to presigned url finished with a status %d", path, response.status_code)
-
-        response.raise_for_status()
+        logger.debug("Data upload from %s to presigned url finished", path)
 
 
-class MultipartUploader(BaseUploader):
+class MultipartUploader(BaseUploader[PathLike]):
     """This class implements the upload method for datasets that need to
     be split into smaller parts (chunks) for upload. It allows for
     concurrent uploads of these chunks to improve performance.
@@ -131,39 +316,47 @@ class MultipartUploader(BaseUploader):
     async def _upload_part(
         self,
         dataset: BaseDataset,
+        client: httpx.AsyncClient,
         path: pathlib.Path,
+        *,
         chunk_number: int,
         chunk_size: int,
+        size: int,
         url: str,
         timeout: float
     ) -> str:
         async with self._semaphore:
             logger.debug("Uploading %d chunk from %s to presigned url", chunk_number, path)
-            async with aiofiles.open(path, 'rb') as f:
-                await f.seek(chunk_number * chunk_size)
-                data = await f.read(chunk_size)
-
-            async with dataset._client.httpx(timeout=timeout, auth=False) as client:
-                response = await client.put(
-                    url=url,
-                    content=data,
-                    timeout=timeout,
-                )
+            offset = chunk_number * chunk_size
 
-            del data
+            # pylint: disable=protected-access
+            etag = await put_file_range(
+                client,
+                url,
+                path,
+                offset=offset,
+                length=min(chunk_size, size - offset),
+                timeout=timeout,
+                retry_policy=dataset._client._retry_policy,
+            )
 
-            if 'etag' not in response.headers:
+            if etag is None:
                 raise RuntimeError('missing etag header in s3 response')
 
-            logger.debug(
-                "%d chunk from %s upload to presigned url returned status code %d",
-                chunk_number, path, response.status_code
-            )
+            logger.debug("%d chunk from %s upload to presigned url finished", chunk_number, path)
 
-            return response.headers['etag']
+            return etag
 
     @doc_from(SingleUploader.upload)
-    async def upload(self, path: PathLike, /, dataset: BaseDataset, timeout: float, upload_timeout: float) -> None:
+    async def upload(  # pylint: disable=too-many-locals
+        self,
+        path: PathLike,
+        /,
+        dataset: BaseDataset,
+        timeout: float,
+        upload_timeout: float,
+        manifest: UploadManifest | None = None,
+    ) -> None:
         path = coerce_path(path)
         size = path.stat().st_size
 
@@ -171,25 +364,137 @@ class MultipartUploader(BaseUploader):
         real_chunk_size = math.ceil(size / parts)
 
         # pylint: disable=protected-access
-        urls = await dataset._start_multipart_upload(
-            size_bytes=size,
-            parts=parts,
-            timeout=timeout,
-        )
+        if manifest and manifest.urls:
+            if len(manifest.urls) != parts:
+                raise ValueError(
+                    f'upload manifest {manifest.manifest_path} contains {len(manifest.urls)} parts, '
+                    f'but file {path} must be uploaded in {parts} parts'
+                )
+            urls = tuple(manifest.urls)
+            logger.info(
+                'Resuming multipart upload of %s to dataset %s: %d of %d parts are already uploaded',
+                path, dataset.id, len(manifest.etags), parts
+            )
+        else:
+            urls = await dataset._start_multipart_upload(
+                size_bytes=size,
+                parts=parts,
+                timeout=timeout,
+            )
+            if manifest:
+                await manifest.set_urls(urls)
+
+        etags: dict[int, str] = dict(manifest.etags) if manifest else {}
 
-        upload_coros = []
-        for i, url in enumerate(urls):
-            upload_coro = self._upload_part(
+        async def upload_part(i: int, url: str) -> None:
+            etag = await self._upload_part(
                 dataset,
+                client,
                 path,
                 chunk_number=i,
                 chunk_size=real_chunk_size,
+                size=size,
                 url=url,
                 timeout=upload_timeout
             )
-            upload_coros.append(upload_coro)
+            etags[i + 1] = etag
+            if manifest:
+                await manifest.add_part(i + 1, etag)
 
-        etags = await asyncio.gather(*upload_coros)
-
-        chunks_etags = [(i + 1, etag) for i, etag in enumerate(etags)]
+        async with dataset._client.httpx(timeout=timeout, auth=False) as client:
+            upload_coros = [
+                upload_part(i, url)
+                for i, url in enumerate(urls)
+                if i + 1 not in etags
+            ]
+
+            # NB: we are waiting for all parts even if some of them failed,
+            # so that successfully uploaded parts got into the manifest
+            results = await asyncio.gather(*upload_coros, return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.error('%d of %d parts of %s failed to upload', len(errors), len(upload_coros), path)
+            raise errors[0]
+
+        chunks_etags = sorted(etags.items())
         await dataset._finish_multipart_upload(chunks_etags, timeout=timeout)
+
+
+class SourceUploader(BaseUploader[DatasetSource]):
+    """This class implements the upload of in-memory data sources, which are serialized
+    incrementally during the upload.
+
+    Backend requires to know the size of the data before the upload starts, so the serialized
+    data is kept in memory while it fits one chunk, and only bigger datasets are spilled
+    to a temporary file, which is uploaded by parts after that.
+
+    :param _upload_format: the format to serialize data to.
+    """
+
+    def __init__(self, chunk_size: int, parallelism: int, upload_format: str):
+        super().__init__(chunk_size=chunk_size, parallelism=parallelism)
+        self._upload_format = upload_format
+
+    async def _upload_bytes(self, data: bytes, dataset: BaseDataset, timeout: float, upload_timeout: float) -> None:
+        # pylint: disable=protected-access
+        presigned_url = await dataset._get_upload_url(size=len(data), timeout=timeout)
+        logger.debug('Uploading %d bytes of in-memory data to presigned url', len(data))
+
+        async with dataset._client.httpx(timeout=timeout, auth=False) as client:
+            await put_bytes(
+                client,
+                presigned_url,
+                data,
+                timeout=upload_timeout,
+                retry_policy=dataset._client._retry_policy,
+            )
+
+    async def upload(
+        self,
+        source: DatasetSource,
+        /,
+        dataset: BaseDataset,
+        timeout: float,
+        upload_timeout: float,
+        manifest: UploadManifest | None = None,
+    ) -> None:
+        """Serialize and upload the in-memory data.
+
+        :param source: the in-memory data to be uploaded.
+        :param dataset: the dataset object containing metadata and methods for upload.
+        :param timeout: the overall time to wait for the upload operation.
+        :param upload_timeout: the time to wait for the individual upload request.
+        :param manifest: not supported for in-memory data.
+        """
+        if manifest is not None:
+            raise ValueError('resumable uploads are supported only for files')
+
+        iterator = iter_source_bytes(source, self._upload_format)
+
+        buffer = bytearray()
+        async for data in iterator:
+            buffer += data
+            if len(buffer) > self._chunk_size:
+                break
+        else:
+            await self._upload_bytes(bytes(buffer), dataset=dataset, timeout=timeout, upload_timeout=upload_timeout)
+            return
+
+        fd, filename = tempfile.mkstemp(prefix='dataset-upload-')
+        os.close(fd)
+        path = pathlib.Path(filename)
+        logger.debug('In-memory data is bigger than one chunk, spilling it to %s', path)
+
+        try:
+            async with aiofiles.open(path, 'wb') as file_:
+                await file_.write(buffer)
+                buffer.clear()
+
+                async for data in iterator:
+                    await file_.write(data)
+
+            uploader = MultipartUploader(chunk_size=self._chunk_size, parallelism=self._parallelism)
+            await uploader.upload(path, dataset=dataset, timeout=timeout, upload_timeout=upload_timeout)
+        finally:
+            path.unlink(missing_ok=True)
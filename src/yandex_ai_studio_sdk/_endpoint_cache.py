@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import pathlib
+import time
+from typing import Any
+
+from ._logging import get_logger
+from ._types.misc import PathLike, coerce_path
+
+logger = get_logger(__name__)
+
+ENDPOINT_CACHE_VERSION = 1
+DEFAULT_ENDPOINT_CACHE_TTL = 24 * 60 * 60  # 1 day
+
+
+def get_default_endpoint_cache_path() -> pathlib.Path:
+    cache_home = os.getenv('XDG_CACHE_HOME') or pathlib.Path.home() / '.cache'
+    return coerce_path(cache_home) / 'yandex-ai-studio-sdk' / 'endpoints.json'
+
+
+class EndpointCache:
+    """On-disk cache of service endpoints maps keyed by the cloud endpoint.
+
+    Cache is shared between processes, so it is written atomically via
+    temporary file replacement; in case of concurrent writes the last one wins.
+    Any problem with reading or writing the cache is logged and
+    treated as a cache miss.
+    """
+
+    def __init__(self, path: PathLike, ttl: float = DEFAULT_ENDPOINT_CACHE_TTL):
+        if ttl < 0:
+            raise ValueError('endpoint cache ttl must be non-negative')
+
+        self._path = coerce_path(path)
+        self._ttl = ttl
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    def _read(self) -> dict[str, Any]:
+        if not self._path.exists():
+            return {}
+
+        data = json.loads(self._path.read_text(encoding='utf-8'))
+        if not isinstance(data, dict) or data.get('version') != ENDPOINT_CACHE_VERSION:
+            logger.debug('Ignoring endpoint cache %s with unsupported format', self._path)
+            return {}
+
+        endpoints: dict[str, Any] = data['endpoints']
+        return endpoints
+
+    def _load(self, endpoint: str) -> tuple[dict[str, str], bool] | None:
+        entry = self._read().get(endpoint)
+        if not entry:
+            return None
+
+        services = {str(name): str(address) for name, address in entry['services'].items()}
+        is_fresh = time.time() - entry['updated_at'] < self._ttl
+        return services, is_fresh
+
+    def _save(self, endpoint: str, services: dict[str, str]) -> None:
+        try:
+            endpoints = self._read()
+        except (OSError, ValueError, KeyError, TypeError):
+            endpoints = {}
+
+        endpoints[endpoint] = {
+            'updated_at': time.time(),
+            'services': services,
+        }
+        content = json.dumps({
+            'version': ENDPOINT_CACHE_VERSION,
+            'endpoints': endpoints,
+        })
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # NB: pid in the name prevents concurrent writers from clobbering each other's temp files
+        tmp_path = self._path.with_name(f'{self._path.name}.{os.getpid()}.tmp')
+        tmp_path.write_text(content, encoding='utf-8')
+        os.replace(tmp_path, self._path)
+
+    async def load(self, endpoint: str) -> tuple[dict[str, str], bool] | None:
+        """Returns cached services map for the endpoint and a flag if it is still fresh."""
+        try:
+            return await asyncio.to_thread(self._load, endpoint)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            logger.warning('Failed to read endpoint cache %s', self._path, exc_info=True)
+            return None
+
+    async def save(self, endpoint: str, services: dict[str, str]) -> None:
+        try:
+            await asyncio.to_thread(self._save, endpoint, services)
+        except OSError:
+            logger.warning('Failed to write endpoint cache %s', self._path, exc_info=True)
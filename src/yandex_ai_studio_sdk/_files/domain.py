@@ -27,6 +27,7 @@ class BaseFiles(BaseDomain, Generic[FileTypeT]):
     which is the only place you could use it.
     Provides upload, get and list methods that allow you to work with remote file objects you created earlier.
     """
+    _grpc_services = ('ai-files', )
     _file_impl: type[FileTypeT]
 
     async def _upload_bytes(
@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import dataclasses
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
+from pathlib import Path
 from typing import TypeVar
 
+import aiofiles
 from typing_extensions import Self
 from yandex.cloud.ai.files.v1.file_pb2 import File as ProtoFile
 from yandex.cloud.ai.files.v1.file_service_pb2 import (
@@ -12,10 +15,11 @@ from yandex.cloud.ai.files.v1.file_service_pb2 import (
 )
 from yandex.cloud.ai.files.v1.file_service_pb2_grpc import FileServiceStub
 from yandex_ai_studio_sdk._types.expiration import ExpirationConfig, ExpirationPolicyAlias
-from yandex_ai_studio_sdk._types.misc import UNDEFINED, UndefinedOr, get_defined_value
+from yandex_ai_studio_sdk._types.misc import UNDEFINED, PathLike, UndefinedOr, coerce_path, get_defined_value
 from yandex_ai_studio_sdk._types.resource import ExpirableResource, safe_on_delete
 from yandex_ai_studio_sdk._utils.doc import doc_from
-from yandex_ai_studio_sdk._utils.sync import run_sync
+from yandex_ai_studio_sdk._utils.download import DEFAULT_DOWNLOAD_CHUNK_SIZE, iter_url_bytes
+from yandex_ai_studio_sdk._utils.sync import run_sync, run_sync_generator
 
 
 @dataclasses.dataclass(frozen=True)
@@ -139,6 +143,23 @@ class BaseFile(ExpirableResource[ProtoFile]):
             )
             object.__setattr__(self, '_deleted', True)
 
+    async def __aiter_url_bytes(
+        self,
+        url: str,
+        *,
+        chunk_size: int,
+        timeout: float,
+    ) -> AsyncIterator[bytes]:
+        async with self._client.httpx(timeout=timeout, auth=False) as client:
+            async for chunk in iter_url_bytes(
+                client,
+                url,
+                key=self.id,
+                timeout=timeout,
+                chunk_size=chunk_size,
+            ):
+                yield chunk
+
     @safe_on_delete
     async def _download_as_bytes(
         self,
@@ -150,6 +171,7 @@ class BaseFile(ExpirableResource[ProtoFile]):
 
         This method retrieves the file's URL and streams the file's content as whole
         (this may overflow the user's memory), returning it as a byte string.
+        Use :py:meth:`download_to` or :py:meth:`aiter_bytes` for large files.
 
         :param chunk_size: The size of each chunk to read from the stream in bytes.
         :param timeout: Timeout, or the maximum time to wait for the request to complete in seconds.
@@ -159,15 +181,73 @@ class BaseFile(ExpirableResource[ProtoFile]):
         # I didn't invent better way to use this function without a @safe_on_delete-lock
         url = await self._get_url.__wrapped__(self, timeout=timeout)  # type: ignore[attr-defined]
 
-        async with self._client.httpx(timeout=timeout, auth=False) as client:
-            async with client.stream("GET", url, timeout=timeout) as response:
-                response.raise_for_status()
+        # NB: bytearray grows in amortized linear time unlike bytes concatenation
+        file_bytes = bytearray()
+        async for chunk in self.__aiter_url_bytes(url, chunk_size=chunk_size, timeout=timeout):
+            file_bytes += chunk
+
+        return bytes(file_bytes)
+
+    @safe_on_delete
+    async def _download_to(
+        self,
+        path: PathLike,
+        *,
+        exist_ok: bool = False,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        timeout: float = 60,
+    ) -> Path:
+        """Download the file to the given path.
+
+        The file's content is streamed straight to the disk chunk by chunk,
+        so memory usage doesn't depend on the file size.
+        In case of failure the partially written file is removed.
+
+        :param path: The path of the file to write the content to.
+        :param exist_ok: If ``True``, overwrite the file if it already exists.
+            Defaults to False.
+        :param chunk_size: The size of each chunk to read from the stream in bytes.
+            Defaults to 8 megabytes.
+        :param timeout: Timeout, or the maximum time to wait for the request to complete in seconds.
+            Defaults to 60 seconds.
+        :return: The path of the downloaded file.
+        """
+        path = coerce_path(path)
+        if path.exists() and not exist_ok:
+            raise ValueError(f"{path} already exists")
+
+        url = await self._get_url.__wrapped__(self, timeout=timeout)  # type: ignore[attr-defined]
+
+        try:
+            async with aiofiles.open(path, 'wb') as file:
+                async for chunk in self.__aiter_url_bytes(url, chunk_size=chunk_size, timeout=timeout):
+                    await file.write(chunk)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
 
-                file_bytes = b''
-                async for chunk in response.aiter_bytes(chunk_size):
-                    file_bytes += chunk
+        return path
+
+    async def _aiter_bytes(
+        self,
+        *,
+        chunk_size: int = 32768,
+        timeout: float = 60,
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the file's content by chunks.
+
+        Chunks are yielded as soon as they are received, so only one chunk
+        is held in memory at a time. If the connection breaks in the middle,
+        the download is resumed from the last received byte.
+
+        :param chunk_size: The maximum size of each chunk in bytes.
+        :param timeout: Timeout, or the maximum time to wait for the request to complete in seconds.
+            Defaults to 60 seconds.
+        """
+        url = await self._get_url(timeout=timeout)
 
-                return file_bytes
+        async for chunk in self.__aiter_url_bytes(url, chunk_size=chunk_size, timeout=timeout):
+            yield chunk
 
 
 @dataclasses.dataclass(frozen=True)
@@ -251,12 +331,43 @@ class AsyncFile(RichFile):
             timeout=timeout
         )
 
+    @doc_from(BaseFile._download_to)
+    async def download_to(
+        self,
+        path: PathLike,
+        *,
+        exist_ok: bool = False,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        timeout: float = 60,
+    ) -> Path:
+        return await self._download_to(
+            path,
+            exist_ok=exist_ok,
+            chunk_size=chunk_size,
+            timeout=timeout,
+        )
+
+    @doc_from(BaseFile._aiter_bytes)
+    async def aiter_bytes(
+        self,
+        *,
+        chunk_size: int = 32768,
+        timeout: float = 60,
+    ) -> AsyncIterator[bytes]:
+        async for chunk in self._aiter_bytes(
+            chunk_size=chunk_size,
+            timeout=timeout,
+        ):
+            yield chunk
+
 
 class File(RichFile):
     __get_url = run_sync(RichFile._get_url)
     __update = run_sync(RichFile._update)
     __delete = run_sync(RichFile._delete)
     __download_as_bytes = run_sync(RichFile._download_as_bytes)
+    __download_to = run_sync(RichFile._download_to)
+    __iter_bytes = run_sync_generator(RichFile._aiter_bytes)
 
     @doc_from(BaseFile._get_url)
     def get_url(
@@ -310,4 +421,32 @@ class File(RichFile):
             timeout=timeout
         )
 
+    @doc_from(BaseFile._download_to)
+    def download_to(
+        self,
+        path: PathLike,
+        *,
+        exist_ok: bool = False,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        timeout: float = 60,
+    ) -> Path:
+        return self.__download_to(
+            path,
+            exist_ok=exist_ok,
+            chunk_size=chunk_size,
+            timeout=timeout,
+        )
+
+    @doc_from(BaseFile._aiter_bytes)
+    def iter_bytes(
+        self,
+        *,
+        chunk_size: int = 32768,
+        timeout: float = 60,
+    ) -> Iterator[bytes]:
+        yield from self.__iter_bytes(
+            chunk_size=chunk_size,
+            timeout=timeout,
+        )
+
 FileTypeT = TypeVar('FileTypeT', bound=BaseFile)
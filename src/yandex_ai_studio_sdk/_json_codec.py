@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Literal, Union
+
+from typing_extensions import TypeAlias
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Pair of functions which are encoding request bodies and decoding
+    response bodies of the SDK HTTP requests (OpenAI-compatible API).
+
+    Any other JSON library could be plugged in with a custom codec.
+    """
+    #: the name of the codec
+    name: str
+    #: decodes a JSON document from ``str`` or ``bytes``
+    loads: Callable[[Union[str, bytes]], Any]
+    #: encodes an object into JSON document in UTF-8 ``bytes``
+    dumps: Callable[[Any], bytes]
+
+
+JsonCodecType: TypeAlias = Union[Literal['auto', 'json', 'orjson', 'msgspec'], JsonCodec]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # NB: the same options as httpx uses for the json= argument
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), allow_nan=False).encode('utf-8')
+
+
+def _get_stdlib_codec() -> JsonCodec:
+    return JsonCodec(name='json', loads=json.loads, dumps=_stdlib_dumps)
+
+
+def _get_orjson_codec() -> JsonCodec:
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    return JsonCodec(name='orjson', loads=orjson.loads, dumps=orjson.dumps)  # pylint: disable=no-member
+
+
+def _get_msgspec_codec() -> JsonCodec:
+    import msgspec.json  # pylint: disable=import-outside-toplevel,import-error
+
+    return JsonCodec(name='msgspec', loads=msgspec.json.decode, dumps=msgspec.json.encode)
+
+
+_CODEC_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    'json': _get_stdlib_codec,
+    'orjson': _get_orjson_codec,
+    'msgspec': _get_msgspec_codec,
+}
+
+
+def get_json_codec(codec: JsonCodecType) -> JsonCodec:
+    """Returns a codec by its name.
+
+    ``'auto'`` means the fastest of the installed libraries: orjson, msgspec,
+    or the standard ``json`` module if neither of them is installed.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    if codec == 'auto':
+        for name in ('orjson', 'msgspec'):
+            try:
+                return _CODEC_FACTORIES[name]()
+            except ImportError:
+                pass
+        return _get_stdlib_codec()
+
+    if codec not in _CODEC_FACTORIES:
+        raise ValueError(
+            f"unknown json_codec {codec!r}, expected one of 'auto', 'json', 'orjson', 'msgspec' or JsonCodec instance"
+        )
+
+    try:
+        return _CODEC_FACTORIES[codec]()
+    except ImportError as e:
+        raise RuntimeError(f'json_codec={codec!r} requires package "{codec}" to be installed') from e
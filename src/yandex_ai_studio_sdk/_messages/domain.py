@@ -23,6 +23,7 @@ class BaseMessages(BaseDomain):
     """
     Base class for message operations (sync and async implementations).
     """
+    _grpc_services = ('ai-assistants', )
     _message_impl = Message
 
     async def _create(
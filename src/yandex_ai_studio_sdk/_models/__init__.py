@@ -11,6 +11,7 @@ from .text_embeddings.function import AsyncTextEmbeddings, BaseTextEmbeddings, T
 
 class BaseModels(DomainWithFunctions):
     """Domain for working with `Yandex Foundation Models <https://yandex.cloud/ru/services/foundation-models>`_."""
+    _grpc_services = ('ai-foundation-models', 'operation')
 
     completions: BaseCompletions
     text_classifiers: BaseTextClassifiers
@@ -17,6 +17,8 @@ from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_servic
     TextGenerationAsyncServiceStub, TextGenerationBatchServiceStub, TextGenerationServiceStub, TokenizerServiceStub
 )
 from yandex.cloud.operation.operation_pb2 import Operation as ProtoOperation
+from yandex_ai_studio_sdk._polling import PollIntervalType
+from yandex_ai_studio_sdk._response_cache import cached_proto_call
 from yandex_ai_studio_sdk._tools.tool import BaseTool
 from yandex_ai_studio_sdk._tools.tool_call import AsyncToolCall, ToolCall, ToolCallTypeT
 from yandex_ai_studio_sdk._tuning.tuning_task import AsyncTuningTask, TuningTask, TuningTaskTypeT
@@ -232,17 +234,28 @@ class BaseGPTModel(
         *,
         timeout=180,
     ) -> GPTModelResult[ToolCallTypeT]:
-        result: GPTModelResult[ToolCallTypeT] | None = None
-        async for res in self._run_sync_impl(
+        request = self._make_request(
             messages=messages,
-            timeout=timeout,
-            stream=False
-        ):
-            result = res
+            stream=False,
+        )
+
+        async def call() -> CompletionResponse:
+            result: CompletionResponse | None = None
+            async with self._client.get_service_stub(TextGenerationServiceStub, timeout=timeout) as stub:
+                async for response in self._client.call_service_stream(
+                    stub.Completion,
+                    request,
+                    timeout=timeout,
+                    expected_type=CompletionResponse,
+                ):
+                    result = response
 
-        if result is None:
-            raise RuntimeError("call returned less then one result")
-        return result
+            if result is None:
+                raise RuntimeError("call returned less then one result")
+            return result
+
+        response = await cached_proto_call(self._client.response_cache, request, CompletionResponse, call)
+        return self._result_type._from_proto(proto=response, sdk=self._sdk)
 
     @override
     # pylint: disable-next=arguments-differ
@@ -475,7 +488,7 @@ class AsyncGPTModel(
         optimizer: UndefinedOr[BaseOptimizer] = UNDEFINED,
         timeout: float = 60,
         poll_timeout: int = 72 * 60 * 60,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType | None = None,
     ) -> Self:
         """Tune the model with the specified training datasets and parameters.
 
@@ -495,8 +508,9 @@ class AsyncGPTModel(
             Defaults to 60 seconds.
         :param poll_timeout: the maximum time to wait while polling for completion of the tuning task.
             Defaults to 259200 seconds (72 hours).
-        :param poll_interval: the interval between polling attempts during the tuning process.
-            Defaults to 60 seconds.
+        :param poll_interval: the interval in seconds between polling attempts during the tuning process
+            or a :py:class:`~yandex_ai_studio_sdk._polling.PollingStrategy` instance.
+            By default the interval is adapted to the tuning progress.
         """
         return await self._tune(
             train_datasets=train_datasets,
@@ -657,7 +671,7 @@ class GPTModel(
         optimizer: UndefinedOr[BaseOptimizer] = UNDEFINED,
         timeout: float = 60,
         poll_timeout: int = 72 * 60 * 60,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType | None = None,
     ) -> Self:
         return self.__tune(
             train_datasets=train_datasets,
@@ -16,6 +16,8 @@ from yandex.cloud.ai.foundation_models.v1.text_classification.text_classificatio
 from yandex.cloud.ai.foundation_models.v1.text_classification.text_classification_service_pb2_grpc import (
     TextClassificationServiceStub
 )
+from yandex_ai_studio_sdk._polling import PollIntervalType
+from yandex_ai_studio_sdk._response_cache import cached_proto_call
 from yandex_ai_studio_sdk._tuning.tuning_task import AsyncTuningTask, TuningTask, TuningTaskTypeT
 from yandex_ai_studio_sdk._types.misc import UNDEFINED, UndefinedOr
 from yandex_ai_studio_sdk._types.model import ModelSyncMixin, ModelTuneMixin
@@ -88,14 +90,18 @@ class BaseTextClassifiersModel(
             model_uri=self._uri,
             text=text,
         )
-        async with self._client.get_service_stub(TextClassificationServiceStub, timeout=timeout) as stub:
-            response = await self._client.call_service(
-                stub.Classify,
-                request,
-                timeout=timeout,
-                expected_type=TextClassificationResponse,
-            )
-            return TextClassifiersModelResult._from_proto(proto=response, sdk=self._sdk)
+
+        async def call() -> TextClassificationResponse:
+            async with self._client.get_service_stub(TextClassificationServiceStub, timeout=timeout) as stub:
+                return await self._client.call_service(
+                    stub.Classify,
+                    request,
+                    timeout=timeout,
+                    expected_type=TextClassificationResponse,
+                )
+
+        response = await cached_proto_call(self._client.response_cache, request, TextClassificationResponse, call)
+        return TextClassifiersModelResult._from_proto(proto=response, sdk=self._sdk)
 
     async def _run_few_shot(
         self,
@@ -130,14 +136,20 @@ class BaseTextClassifiersModel(
             samples=(proto_samples if proto_samples else None),
         )
 
-        async with self._client.get_service_stub(TextClassificationServiceStub, timeout=timeout) as stub:
-            response = await self._client.call_service(
-                stub.FewShotClassify,
-                request,
-                timeout=timeout,
-                expected_type=FewShotTextClassificationResponse,
-            )
-            return FewShotTextClassifiersModelResult._from_proto(proto=response, sdk=self._sdk)
+
+        async def call() -> FewShotTextClassificationResponse:
+            async with self._client.get_service_stub(TextClassificationServiceStub, timeout=timeout) as stub:
+                return await self._client.call_service(
+                    stub.FewShotClassify,
+                    request,
+                    timeout=timeout,
+                    expected_type=FewShotTextClassificationResponse,
+                )
+
+        response = await cached_proto_call(
+            self._client.response_cache, request, FewShotTextClassificationResponse, call,
+        )
+        return FewShotTextClassifiersModelResult._from_proto(proto=response, sdk=self._sdk)
 
 
 @doc_from(BaseTextClassifiersModel)
@@ -240,7 +252,7 @@ class AsyncTextClassifiersModel(BaseTextClassifiersModel[AsyncTuningTask['AsyncT
         optimizer: UndefinedOr[BaseOptimizer] = UNDEFINED,
         timeout: float = 60,
         poll_timeout: int = 72 * 60 * 60,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType | None = None,
     ) -> Self:
         """Tune the model with the specified training datasets and parameters.
 
@@ -261,8 +273,9 @@ class AsyncTextClassifiersModel(BaseTextClassifiersModel[AsyncTuningTask['AsyncT
         :param optimizer: an optimizer for tuning.
         :param poll_timeout: the maximum time to wait while polling for completion of the tuning task.
             Defaults to 259200 seconds (72 hours).
-        :param poll_interval: the interval between polling attempts during the tuning process.
-            Defaults to 60 seconds.
+        :param poll_interval: the interval in seconds between polling attempts during the tuning process
+            or a :py:class:`~yandex_ai_studio_sdk._polling.PollingStrategy` instance.
+            By default the interval is adapted to the tuning progress.
         """
         return await self._tune(
             train_datasets=train_datasets,
@@ -376,7 +389,7 @@ class TextClassifiersModel(BaseTextClassifiersModel[TuningTask['TextClassifiersM
         optimizer: UndefinedOr[BaseOptimizer] = UNDEFINED,
         timeout: float = 60,
         poll_timeout: int = 72 * 60 * 60,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType | None = None,
     ) -> Self:
         return self.__tune(
             train_datasets=train_datasets,
@@ -1,7 +1,9 @@
 # pylint: disable=arguments-renamed,no-name-in-module
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+from collections.abc import Iterable, Sequence
+from functools import partial
 from typing import cast
 
 from google.protobuf.wrappers_pb2 import Int64Value
@@ -10,6 +12,9 @@ from yandex.cloud.ai.foundation_models.v1.embedding.embedding_service_pb2 import
     TextEmbeddingRequest, TextEmbeddingResponse
 )
 from yandex.cloud.ai.foundation_models.v1.embedding.embedding_service_pb2_grpc import EmbeddingsServiceStub
+from yandex_ai_studio_sdk._exceptions import AioRpcError
+from yandex_ai_studio_sdk._polling import PollIntervalType
+from yandex_ai_studio_sdk._response_cache import cached_proto_call
 from yandex_ai_studio_sdk._tuning.tuning_task import AsyncTuningTask, TuningTask, TuningTaskTypeT
 from yandex_ai_studio_sdk._types.misc import UNDEFINED, UndefinedOr, get_defined_value
 from yandex_ai_studio_sdk._types.model import ModelSyncMixin, ModelTuneMixin
@@ -21,7 +26,7 @@ from yandex_ai_studio_sdk._utils.doc import doc_from
 from yandex_ai_studio_sdk._utils.sync import run_sync
 
 from .config import TextEmbeddingsModelConfig
-from .result import TextEmbeddingsModelResult
+from .result import TextEmbeddingsBatchResult, TextEmbeddingsModelResult
 from .tune_params import EmbeddingsTuneType, TextEmbeddingsModelTuneParams
 
 
@@ -84,14 +89,79 @@ class BaseTextEmbeddingsModel(
             text=text,
             dimensions=dimensions
         )
-        async with self._client.get_service_stub(EmbeddingsServiceStub, timeout=timeout) as stub:
-            response = await self._client.call_service(
-                stub.TextEmbedding,
-                request,
-                timeout=timeout,
-                expected_type=TextEmbeddingResponse,
-            )
-            return TextEmbeddingsModelResult._from_proto(proto=response, sdk=self._sdk)
+
+        async def call() -> TextEmbeddingResponse:
+            async with self._client.get_service_stub(EmbeddingsServiceStub, timeout=timeout) as stub:
+                return await self._client.call_service(
+                    stub.TextEmbedding,
+                    request,
+                    timeout=timeout,
+                    expected_type=TextEmbeddingResponse,
+                )
+
+        response = await cached_proto_call(self._client.response_cache, request, TextEmbeddingResponse, call)
+        return TextEmbeddingsModelResult._from_proto(proto=response, sdk=self._sdk)
+
+    async def _run_batch(
+        self,
+        texts: Iterable[str],
+        *,
+        timeout: float,
+        dimensions: UndefinedOr[int],
+        concurrency: int,
+    ) -> TextEmbeddingsBatchResult:
+        if concurrency < 1:
+            raise ValueError('concurrency must be a positive integer')
+
+        results: list[TextEmbeddingsModelResult | None] = []
+        errors: dict[int, AioRpcError] = {}
+        # NB: all of workers are sharing one iterator, so at any moment there is
+        # no more than `concurrency` requests in flight and no more than
+        # `concurrency` texts taken from the input, which could be a lazy iterator
+        texts_iterator = enumerate(texts)
+
+        async def call(request: TextEmbeddingRequest) -> TextEmbeddingResponse:
+            # NB: stub is taken for every request, so requests are spread over the channel pool
+            async with self._client.get_service_stub(EmbeddingsServiceStub, timeout=timeout) as stub:
+                return await self._client.call_service(
+                    stub.TextEmbedding,
+                    request,
+                    timeout=timeout,
+                    expected_type=TextEmbeddingResponse,
+                )
+
+        async def worker() -> None:
+            for i, text in texts_iterator:
+                results.append(None)
+
+                request = self._make_request(text=text, dimensions=dimensions)
+                try:
+                    # NB: retries are performed by the client according to the SDK retry policy,
+                    # so we are getting there only after all of attempts for this text have failed
+                    response = await cached_proto_call(
+                        self._client.response_cache, request, TextEmbeddingResponse, partial(call, request),
+                    )
+                except AioRpcError as e:
+                    errors[i] = e
+                    continue
+
+                results[i] = TextEmbeddingsModelResult._from_proto(proto=response, sdk=self._sdk)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            await asyncio.wait(workers, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # NB: if one of workers failed or the batch itself was cancelled,
+            # the rest of workers must not keep on taking texts and making requests
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        for task in workers:
+            if not task.cancelled() and (exception := task.exception()):
+                raise exception
+
+        return TextEmbeddingsBatchResult(results=tuple(results), errors=errors)
 
 @doc_from(BaseTextEmbeddingsModel)
 class AsyncTextEmbeddingsModel(BaseTextEmbeddingsModel):
@@ -117,6 +187,35 @@ class AsyncTextEmbeddingsModel(BaseTextEmbeddingsModel):
             dimensions=dimensions
         )
 
+    async def run_batch(
+        self,
+        texts: Iterable[str],
+        *,
+        timeout=60,
+        dimensions: UndefinedOr[int] = UNDEFINED,
+        concurrency: int = 16,
+    ) -> TextEmbeddingsBatchResult:
+        """Run the model to generate embeddings for a lot of texts concurrently.
+
+        Results are returned in the order of input texts. Failure of any single text
+        does not interrupt the whole run: its error is stored in the ``errors``
+        field of the result and the rest of embeddings are kept.
+
+        :param texts: the input texts for which embeddings are to be generated;
+            could be a lazy iterable, it will be consumed no faster than requests are sent.
+        :param timeout: the timeout, or the maximum time to wait for each of the requests to complete in seconds.
+            Defaults to 60 seconds.
+        :param dimensions: the dimensions of output vectors
+        :param concurrency: the maximum number of requests in flight.
+            Defaults to 16.
+        """
+        return await self._run_batch(
+            texts=texts,
+            timeout=timeout,
+            dimensions=dimensions,
+            concurrency=concurrency,
+        )
+
     # pylint: disable=too-many-locals
     async def tune_deferred(
         self,
@@ -194,7 +293,7 @@ class AsyncTextEmbeddingsModel(BaseTextEmbeddingsModel):
         optimizer: UndefinedOr[BaseOptimizer] = UNDEFINED,
         timeout: float = 60,
         poll_timeout: int = 72 * 60 * 60,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType | None = None,
     ) -> Self:
         """Tune the model with the specified training datasets and parameters.
 
@@ -216,8 +315,9 @@ class AsyncTextEmbeddingsModel(BaseTextEmbeddingsModel):
             Defaults to 60 seconds.
         :param poll_timeout: the maximum time to wait while polling for completion of the tuning task.
             Defaults to 259200 seconds (72 hours).
-        :param poll_interval: the interval between polling attempts during the tuning process.
-            Defaults to 60 seconds.
+        :param poll_interval: the interval in seconds between polling attempts during the tuning process
+            or a :py:class:`~yandex_ai_studio_sdk._polling.PollingStrategy` instance.
+            By default the interval is adapted to the tuning progress.
         """
         return await self._tune(
             train_datasets=train_datasets,
@@ -258,6 +358,7 @@ class AsyncTextEmbeddingsModel(BaseTextEmbeddingsModel):
 class TextEmbeddingsModel(BaseTextEmbeddingsModel):
     _tune_operation_type = TuningTask
     __run = run_sync(BaseTextEmbeddingsModel._run)
+    __run_batch = run_sync(BaseTextEmbeddingsModel._run_batch)
     __tune_deferred = run_sync(BaseTextEmbeddingsModel._tune_deferred)
     __tune = run_sync(BaseTextEmbeddingsModel._tune)
     __attach_tune_deferred = run_sync(BaseTextEmbeddingsModel._attach_tune_deferred)
@@ -276,6 +377,22 @@ class TextEmbeddingsModel(BaseTextEmbeddingsModel):
             dimensions=dimensions
         )
 
+    @doc_from(AsyncTextEmbeddingsModel.run_batch)
+    def run_batch(
+        self,
+        texts: Iterable[str],
+        *,
+        timeout=60,
+        dimensions: UndefinedOr[int] = UNDEFINED,
+        concurrency: int = 16,
+    ) -> TextEmbeddingsBatchResult:
+        return self.__run_batch(
+            texts=texts,
+            timeout=timeout,
+            dimensions=dimensions,
+            concurrency=concurrency,
+        )
+
     # pylint: disable=too-many-locals
     @doc_from(AsyncTextEmbeddingsModel.tune_deferred)
     def tune_deferred(
@@ -337,7 +454,7 @@ class TextEmbeddingsModel(BaseTextEmbeddingsModel):
         optimizer: UndefinedOr[BaseOptimizer] = UNDEFINED,
         timeout: float = 60,
         poll_timeout: int = 72 * 60 * 60,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType | None = None,
     ) -> Self:
         return self.__tune(
             train_datasets=train_datasets,
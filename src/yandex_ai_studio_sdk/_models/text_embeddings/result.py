@@ -2,27 +2,30 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, Any, overload
 
 from typing_extensions import Self
 # pylint: disable-next=no-name-in-module
 from yandex.cloud.ai.foundation_models.v1.embedding.embedding_service_pb2 import TextEmbeddingResponse
-from yandex_ai_studio_sdk._types.result import BaseProtoResult
+from yandex_ai_studio_sdk._types.embeddings import BaseEmbeddingResult, EmbeddingVector, stack_embeddings
+from yandex_ai_studio_sdk._types.result import BaseProtoResult, BaseResult
 
 if TYPE_CHECKING:
+    import numpy
+    from yandex_ai_studio_sdk._exceptions import AioRpcError
     from yandex_ai_studio_sdk._sdk import BaseSDK
 
 
 @dataclass(frozen=True)
-class TextEmbeddingsModelResult(BaseProtoResult, Sequence):
+class TextEmbeddingsModelResult(BaseEmbeddingResult, BaseProtoResult):
     """
     Represents the result of a text embeddings model.
 
     It holds the embedding vector, the number of tokens, and the
     version of the model that is used to generate embeggings.
     """
-    #: the embedding vector as a tuple of floats
-    embedding: tuple[float, ...]
+    #: the embedding vector; it is a sequence of floats backed by a contiguous buffer
+    embedding: EmbeddingVector
     #: the number of tokens processed by the model
     num_tokens: int
     #: the version of the model used for generating embeddings
@@ -31,31 +34,69 @@ class TextEmbeddingsModelResult(BaseProtoResult, Sequence):
     @classmethod
     def _from_proto(cls, *, proto: TextEmbeddingResponse, sdk: BaseSDK) -> Self:  # pylint: disable=unused-argument
         return cls(
-            embedding=tuple(proto.embedding),
+            embedding=EmbeddingVector(proto.embedding),
             num_tokens=proto.num_tokens,
             model_version=proto.model_version,
         )
 
+
+@dataclass(frozen=True)
+class TextEmbeddingsBatchResult(BaseResult, Sequence):
+    """
+    Represents the result of a batched text embeddings run.
+
+    Results are placed in the order of input texts; in case of partial failure
+    results of failed texts are ``None`` and their errors are stored at ``errors``.
+    """
+    #: the results in the order of input texts, ``None`` stands for a failed text
+    results: tuple[TextEmbeddingsModelResult | None, ...]
+    #: the errors of failed requests by the index of the input text
+    errors: dict[int, AioRpcError]
+
+    @property
+    def num_tokens(self) -> int:
+        """The total number of tokens processed by the model"""
+        return sum(result.num_tokens for result in self.results if result is not None)
+
+    @property
+    def embeddings(self) -> tuple[EmbeddingVector, ...]:
+        """The embedding vectors in the order of input texts; raises if any of texts failed"""
+        self.raise_for_errors()
+        return tuple(result.embedding for result in self.results)  # type: ignore[union-attr]
+
+    def stack(self, *, dtype: Any = None) -> numpy.ndarray:
+        """Stacks all of the embeddings into one ``(n, dim)`` numpy matrix; raises if any of texts failed.
+
+        :param dtype: numpy dtype of the resulting matrix;
+            by default the dtype of the embeddings buffers is used.
+        """
+        return stack_embeddings(self.embeddings, dtype=dtype)
+
+    def raise_for_errors(self) -> None:
+        """Raises the error of the first failed text if any"""
+        if self.errors:
+            index = min(self.errors)
+            raise self.errors[index]
+
     def __len__(self) -> int:
-        return len(self.embedding)
+        return len(self.results)
 
     @overload
-    def __getitem__(self, index: int, /) -> float:
+    def __getitem__(self, index: int, /) -> TextEmbeddingsModelResult | None:
         pass
 
     @overload
-    def __getitem__(self, slice_: slice, /) -> tuple[float, ...]:
+    def __getitem__(self, slice_: slice, /) -> tuple[TextEmbeddingsModelResult | None, ...]:
         pass
 
     def __getitem__(self, index, /):
-        return self.embedding[index]
+        return self.results[index]
 
     def __array__(self, dtype=None, copy=None):
-        import numpy  # pylint: disable=import-outside-toplevel
-
         if copy is False:
             raise ValueError(
-                "`copy=False` isn't supported. A copy is always created."
+                "`copy=False` isn't supported. Embeddings of different texts are stored separately "
+                "and stacking them always creates a new array."
             )
 
-        return numpy.array(self.embedding, dtype=dtype)
+        return self.stack(dtype=dtype)
@@ -0,0 +1,283 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from yandex_ai_studio_sdk._logging import get_logger
+from yandex_ai_studio_sdk._polling import PollIntervalType, coerce_polling_strategy
+from yandex_ai_studio_sdk._types.domain import BaseDomain
+from yandex_ai_studio_sdk._types.operation import BaseOperationStatus, OperationInterface
+from yandex_ai_studio_sdk._utils.contextlib import aclosing
+from yandex_ai_studio_sdk._utils.doc import doc_from
+from yandex_ai_studio_sdk._utils.sync import run_sync, run_sync_generator
+
+from .poller import OperationPoller
+
+if TYPE_CHECKING:
+    from yandex_ai_studio_sdk._sdk import BaseSDK
+
+logger = get_logger(__name__)
+
+AnyOperationTypeT = TypeVar('AnyOperationTypeT', bound=OperationInterface)
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class BaseOperations(BaseDomain):
+    """Domain for waiting on many operations at once.
+
+    Statuses of all of the operations are polled from a single place with a bounded
+    number of concurrent status requests instead of polling every operation on its own.
+    It works with any of SDK operations: deferred completions, image generations,
+    web searches, tuning and batch tasks.
+    """
+    _grpc_services = ('operation', )
+
+    def __init__(self, name: str, sdk: BaseSDK):
+        super().__init__(name=name, sdk=sdk)
+        self._pollers: dict[asyncio.AbstractEventLoop, OperationPoller] = {}
+
+    def _get_poller(self) -> OperationPoller:
+        """Returns the background poller of the running event loop,
+        which drives futures and callbacks of operations."""
+        loop = asyncio.get_running_loop()
+        if (poller := self._pollers.get(loop)) is None:
+            poller = self._pollers[loop] = OperationPoller()
+        return poller
+
+    # pylint: disable-next=too-many-locals
+    async def _poll_until_done(
+        self,
+        operations: Iterable[AnyOperationTypeT],
+        *,
+        timeout: float,
+        poll_timeout: float | None,
+        poll_interval: PollIntervalType | None,
+        max_concurrency: int,
+    ) -> AsyncIterator[tuple[int, AnyOperationTypeT]]:
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be positive')
+        if isinstance(poll_interval, (int, float)) and poll_interval <= 0:
+            raise ValueError(f'poll_interval must be positive, got {poll_interval}')
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def poll(
+            index: int, operation: AnyOperationTypeT, attempt: int, delay: float
+        ) -> tuple[int, AnyOperationTypeT, int, BaseOperationStatus]:
+            if delay:
+                await operation._sleep_impl(delay)
+
+            async with semaphore:
+                status = await operation._get_status(timeout=timeout)
+            return index, operation, attempt + 1, status
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + poll_timeout if poll_timeout else None
+        started_at = time.monotonic()
+
+        pending = {
+            asyncio.ensure_future(poll(index, operation, 0, 0))
+            for index, operation in enumerate(operations)
+        }
+        logger.info('Starting polling of %d operations with %d concurrent requests', len(pending), max_concurrency)
+
+        try:
+            while pending:
+                wait_timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=wait_timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    raise asyncio.TimeoutError(
+                        f'{len(pending)} operations are not finished within poll timeout {poll_timeout}s'
+                    )
+
+                for task in done:
+                    index, operation, attempt, status = task.result()
+                    if status.is_running:
+                        polling = coerce_polling_strategy(poll_interval, default=operation._get_default_polling())
+                        interval = operation._get_poll_interval(
+                            polling, status, attempt=attempt, started_at=started_at
+                        )
+                        pending.add(asyncio.ensure_future(poll(index, operation, attempt, interval)))
+                        continue
+
+                    logger.debug('%s finished with status %s', operation, status)
+                    yield index, operation
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _as_completed(
+        self,
+        operations: Iterable[AnyOperationTypeT],
+        *,
+        timeout: float = 60,
+        poll_timeout: float | None = None,
+        poll_interval: PollIntervalType | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AsyncIterator[AnyOperationTypeT]:
+        """Yields operations in the order of their completion.
+
+        Finished operations are yielded as is, so call ``get_result`` on them
+        to obtain a result or an error of the operation.
+
+        :param operations: operations to wait for.
+        :param timeout: the timeout, or the maximum time to wait for each of the status requests in seconds.
+            Defaults to 60 seconds.
+        :param poll_timeout: the maximum time in seconds to wait for all of the operations;
+            ``asyncio.TimeoutError`` is raised when it is exceeded. By default there is no limit.
+        :param poll_interval: the interval in seconds between status requests of an operation
+            or a :py:class:`~yandex_ai_studio_sdk._polling.PollingStrategy` instance.
+            By default the polling strategy of the operation class is used.
+        :param max_concurrency: the maximum number of simultaneous status requests.
+            Defaults to 10.
+        """
+        async with aclosing(self._poll_until_done(
+            operations,
+            timeout=timeout,
+            poll_timeout=poll_timeout,
+            poll_interval=poll_interval,
+            max_concurrency=max_concurrency,
+        )) as polled:
+            async for _, operation in polled:
+                yield operation
+
+    async def _wait_many(
+        self,
+        operations: Iterable[OperationInterface],
+        *,
+        timeout: float = 60,
+        poll_timeout: float | None = None,
+        poll_interval: PollIntervalType | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Waits for all of the operations and returns their results in the order of operations.
+
+        :param operations: operations to wait for.
+        :param timeout: the timeout, or the maximum time to wait for each of the requests in seconds.
+            Defaults to 60 seconds.
+        :param poll_timeout: the maximum time in seconds to wait for all of the operations;
+            ``asyncio.TimeoutError`` is raised when it is exceeded. By default there is no limit.
+        :param poll_interval: the interval in seconds between status requests of an operation
+            or a :py:class:`~yandex_ai_studio_sdk._polling.PollingStrategy` instance.
+            By default the polling strategy of the operation class is used.
+        :param max_concurrency: the maximum number of simultaneous status requests.
+            Defaults to 10.
+        :param return_exceptions: when ``True``, errors of failed operations are returned
+            in place of their results; otherwise the first error is raised right away.
+        """
+        operations = list(operations)
+        results: list[Any] = [None] * len(operations)
+
+        async with aclosing(self._poll_until_done(
+            operations,
+            timeout=timeout,
+            poll_timeout=poll_timeout,
+            poll_interval=poll_interval,
+            max_concurrency=max_concurrency,
+        )) as polled:
+            async for index, operation in polled:
+                try:
+                    results[index] = await operation._get_result(timeout=timeout)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+
+        return results
+
+
+@doc_from(BaseOperations)
+class AsyncOperations(BaseOperations):
+    @doc_from(BaseOperations._as_completed)
+    async def as_completed(
+        self,
+        operations: Iterable[AnyOperationTypeT],
+        *,
+        timeout: float = 60,
+        poll_timeout: float | None = None,
+        poll_interval: PollIntervalType | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AsyncIterator[AnyOperationTypeT]:
+        async with aclosing(self._as_completed(
+            operations,
+            timeout=timeout,
+            poll_timeout=poll_timeout,
+            poll_interval=poll_interval,
+            max_concurrency=max_concurrency,
+        )) as completed:
+            async for operation in completed:
+                yield operation
+
+    @doc_from(BaseOperations._wait_many)
+    async def wait_many(
+        self,
+        operations: Iterable[OperationInterface],
+        *,
+        timeout: float = 60,
+        poll_timeout: float | None = None,
+        poll_interval: PollIntervalType | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        return await self._wait_many(
+            operations,
+            timeout=timeout,
+            poll_timeout=poll_timeout,
+            poll_interval=poll_interval,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+
+@doc_from(BaseOperations)
+class Operations(BaseOperations):
+    __as_completed = run_sync_generator(BaseOperations._as_completed)
+    __wait_many = run_sync(BaseOperations._wait_many)
+
+    @doc_from(BaseOperations._as_completed)
+    def as_completed(
+        self,
+        operations: Iterable[AnyOperationTypeT],
+        *,
+        timeout: float = 60,
+        poll_timeout: float | None = None,
+        poll_interval: PollIntervalType | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Iterator[AnyOperationTypeT]:
+        yield from self.__as_completed(
+            operations,
+            timeout=timeout,
+            poll_timeout=poll_timeout,
+            poll_interval=poll_interval,
+            max_concurrency=max_concurrency,
+        )
+
+    @doc_from(BaseOperations._wait_many)
+    def wait_many(
+        self,
+        operations: Iterable[OperationInterface],
+        *,
+        timeout: float = 60,
+        poll_timeout: float | None = None,
+        poll_interval: PollIntervalType | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        return self.__wait_many(
+            operations,
+            timeout=timeout,
+            poll_timeout=poll_timeout,
+            poll_interval=poll_interval,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
@@ -0,0 +1,159 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import heapq
+import itertools
+import time
+from typing import Any
+
+from yandex_ai_studio_sdk._logging import TRACE, get_logger
+from yandex_ai_studio_sdk._polling import PollingStrategy
+from yandex_ai_studio_sdk._types.operation import OperationInterface
+
+logger = get_logger(__name__)
+
+
+@dataclasses.dataclass(eq=False)
+class _WatchedOperation:
+    operation: OperationInterface
+    polling: PollingStrategy
+    futures: list[asyncio.Future[Any]] = dataclasses.field(default_factory=list)
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+    attempt: int = 0
+
+    @property
+    def is_cancelled(self) -> bool:
+        return all(future.done() for future in self.futures)
+
+    def resolve(self, result: Any = None, exception: BaseException | None = None) -> None:
+        for future in self.futures:
+            if future.done():
+                continue
+
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+
+class OperationPoller:
+    """Polls statuses of the watched operations from a single background task
+    and resolves their futures with operations results.
+
+    There is no task per operation: the poller keeps a schedule of the next status
+    requests and runs at most ``max_concurrency`` of them at once.
+    The background task lives only while there are watched operations.
+    Poller is bound to the event loop it was created in.
+    """
+
+    def __init__(self, *, max_concurrency: int = 10, timeout: float = 60):
+        self._max_concurrency = max_concurrency
+        self._timeout = timeout
+
+        # NB: operations are keyed by id, because some of them are unhashable dataclasses
+        self._watched: dict[int, _WatchedOperation] = {}
+        self._schedule: list[tuple[float, int, _WatchedOperation]] = []
+        self._counter = itertools.count()
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._watched)
+
+    def watch(self, operation: OperationInterface, polling: PollingStrategy) -> asyncio.Future[Any]:
+        """Returns a new future of the operation result.
+
+        Operation which is already watched is not polled twice; cancelling of a future
+        doesn't affect other futures of the same operation.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        if watched := self._watched.get(id(operation)):
+            watched.futures.append(future)
+            return future
+
+        watched = self._watched[id(operation)] = _WatchedOperation(
+            operation=operation,
+            polling=polling,
+            futures=[future],
+        )
+        self._schedule_poll(watched, loop.time())
+        logger.log(TRACE, 'Start watching %s, %d operations are watched', operation, len(self._watched))
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        return future
+
+    def _schedule_poll(self, watched: _WatchedOperation, when: float) -> None:
+        heapq.heappush(self._schedule, (when, next(self._counter), watched))
+        self._wakeup.set()
+
+    def _forget(self, watched: _WatchedOperation) -> None:
+        self._watched.pop(id(watched.operation), None)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            self._wakeup.clear()
+
+            now = loop.time()
+            while (
+                self._schedule and
+                self._schedule[0][0] <= now and
+                len(self._in_flight) < self._max_concurrency
+            ):
+                _, _, watched = heapq.heappop(self._schedule)
+                if watched.is_cancelled:
+                    self._forget(watched)
+                    continue
+
+                task = asyncio.create_task(self._poll(watched))
+                self._in_flight.add(task)
+                task.add_done_callback(self._on_poll_done)
+
+            if not self._schedule and not self._in_flight:
+                # nothing is watched anymore
+                break
+
+            timeout: float | None = None
+            if self._schedule and len(self._in_flight) < self._max_concurrency:
+                timeout = max(self._schedule[0][0] - now, 0)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _on_poll_done(self, task: asyncio.Task[None]) -> None:
+        self._in_flight.discard(task)
+        self._wakeup.set()
+
+    async def _poll(self, watched: _WatchedOperation) -> None:
+        operation = watched.operation
+        try:
+            status = await operation._get_status(timeout=self._timeout)
+            watched.attempt += 1
+
+            if status.is_running:
+                interval = operation._get_poll_interval(
+                    watched.polling, status, attempt=watched.attempt, started_at=watched.started_at,
+                )
+                self._schedule_poll(watched, asyncio.get_running_loop().time() + interval)
+                return
+
+            logger.debug('%s finished with status %s', operation, status)
+            result = await operation._get_result(timeout=self._timeout)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._forget(watched)
+            watched.resolve(exception=e)
+            return
+
+        self._forget(watched)
+        watched.resolve(result)
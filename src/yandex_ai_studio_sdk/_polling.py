@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import abc
+import random
+from dataclasses import dataclass, field
+from typing import Union
+
+from typing_extensions import TypeAlias
+
+
+class PollingStrategy(abc.ABC):
+    """Base class for the strategies of operations polling,
+    which are defining delays between operation status requests."""
+
+    @abc.abstractmethod
+    def get_interval(self, *, attempt: int, elapsed: float, progress: float | None) -> float:
+        """Returns the delay in seconds before the next status request.
+
+        :param attempt: the number of status requests made so far, starting from 1.
+        :param elapsed: the time in seconds passed since the start of polling.
+        :param progress: the completed fraction of the operation in range ``[0, 1]``
+            if operation reports its progress, ``None`` otherwise.
+        """
+
+
+@dataclass(frozen=True)
+class FixedPolling(PollingStrategy):
+    """Polls an operation with a constant interval."""
+    #: the interval between status requests (in seconds)
+    interval: float = 10
+
+    def __post_init__(self) -> None:
+        if self.interval < 0:
+            raise ValueError('interval must be non-negative')
+
+    def get_interval(self, *, attempt: int, elapsed: float, progress: float | None) -> float:
+        return self.interval
+
+
+@dataclass(frozen=True)
+class ExponentialPolling(PollingStrategy):
+    """Polls an operation often at the start and backs off exponentially,
+    so short operations are returning fast while long ones are not
+    producing excessive number of status requests.
+    """
+    #: the interval before the second status request (in seconds)
+    initial_interval: float = 1
+    #: the multiplier applied to the interval after each status request
+    multiplier: float = 2
+    #: the maximum interval between status requests (in seconds)
+    max_interval: float = 60
+    #: the maximum fraction of the interval which is randomly added or subtracted,
+    #: it prevents simultaneously started operations from polling in lockstep
+    jitter: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.initial_interval < 0 or self.max_interval < 0:
+            raise ValueError('intervals must be non-negative')
+        if self.multiplier < 1:
+            raise ValueError('multiplier must be greater than or equal to 1')
+        if not 0 <= self.jitter < 1:
+            raise ValueError('jitter must be in range [0, 1)')
+
+    def get_interval(self, *, attempt: int, elapsed: float, progress: float | None) -> float:
+        # NB: exponent is capped to prevent float overflow on very long operations
+        exponent = min(attempt - 1, 64)
+        interval = min(self.initial_interval * self.multiplier ** exponent, self.max_interval)
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+@dataclass(frozen=True)
+class EtaPolling(PollingStrategy):
+    """Estimates the remaining time of an operation from its progress and polls
+    when a part of this time passes; for example tuning tasks are reporting
+    the progress. Operations without the progress are polled with ``fallback`` strategy.
+    """
+    #: the fraction of the estimated remaining time to wait before the next status request
+    fraction: float = 0.5
+    #: the minimum interval between status requests (in seconds)
+    min_interval: float = 5
+    #: the maximum interval between status requests (in seconds)
+    max_interval: float = 600
+    #: the strategy used while the progress is unknown or zero
+    fallback: PollingStrategy = field(default_factory=ExponentialPolling)
+
+    def __post_init__(self) -> None:
+        if not 0 < self.fraction <= 1:
+            raise ValueError('fraction must be in range (0, 1]')
+        if not 0 <= self.min_interval <= self.max_interval:
+            raise ValueError('min_interval must be non-negative and less than or equal to max_interval')
+
+    def get_interval(self, *, attempt: int, elapsed: float, progress: float | None) -> float:
+        if not progress or progress <= 0:
+            return self.fallback.get_interval(attempt=attempt, elapsed=elapsed, progress=progress)
+
+        progress = min(progress, 1)
+        remaining = elapsed * (1 - progress) / progress
+        return min(max(remaining * self.fraction, self.min_interval), self.max_interval)
+
+
+PollIntervalType: TypeAlias = Union[float, PollingStrategy]
+
+
+def coerce_polling_strategy(poll_interval: PollIntervalType | None, default: PollingStrategy) -> PollingStrategy:
+    """Turns ``poll_interval`` argument into a polling strategy.
+
+    ``None`` stands for the ``default`` strategy, a number is a constant interval
+    in seconds which must be positive.
+    """
+    if poll_interval is None:
+        return default
+
+    if isinstance(poll_interval, PollingStrategy):
+        return poll_interval
+
+    if poll_interval <= 0:
+        raise ValueError(f'poll_interval must be positive, got {poll_interval}')
+
+    return FixedPolling(interval=poll_interval)
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import hashlib
+import json
+import pathlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from google.protobuf.message import Message
+
+from ._logging import TRACE, get_logger
+from ._types.misc import PathLike, coerce_path
+
+logger = get_logger(__name__)
+
+ProtoResponseT = TypeVar('ProtoResponseT', bound=Message)
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Counters of the response cache lookups."""
+    #: the number of requests which were served from the cache
+    hits: int
+    #: the number of requests which were sent to the server
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups which were served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache(abc.ABC):
+    """Base class for client-side caches of model responses.
+
+    Cache stores raw responses (serialized protobuf messages or HTTP bodies)
+    keyed by a hash of the canonically serialized request, so any change
+    of the request, including the model config, leads to a different key.
+    Custom backends should implement :py:meth:`get`, :py:meth:`set` and :py:meth:`clear`,
+    and may override :py:meth:`aget` and :py:meth:`aset` if they have a native
+    asynchronous client.
+
+    Any error raised by a backend is logged and treated as a cache miss.
+    """
+
+    def __init__(self) -> None:
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
+
+    @abc.abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Returns the cached response or ``None`` if there is no live entry for the key."""
+
+    @abc.abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """Stores the response for the key."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes all of the entries."""
+
+    async def aget(self, key: str) -> bytes | None:
+        return self.get(key)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        self.set(key, value)
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        """Hits and misses counted since the cache creation or the last :py:meth:`reset_stats` call"""
+        with self._stats_lock:
+            return ResponseCacheStats(hits=self._hits, misses=self._misses)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._hits = self._misses = 0
+
+    async def _lookup(self, key: str) -> bytes | None:
+        try:
+            value = await self.aget(key)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning('Failed to read response cache entry %s', key, exc_info=True)
+            value = None
+
+        with self._stats_lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        logger.log(TRACE, 'Response cache %s for %s', 'miss' if value is None else 'hit', key)
+        return value
+
+    async def _store(self, key: str, value: bytes) -> None:
+        try:
+            await self.aset(key, value)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning('Failed to write response cache entry %s', key, exc_info=True)
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache of model responses.
+
+    :param max_entries: the maximum number of stored responses;
+        least recently used ones are evicted first.
+    :param max_bytes: the maximum total size of stored responses in bytes, not limited by default.
+    :param ttl: time in seconds after which an entry expires, entries don't expire by default.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int | None = None, ttl: float | None = None):
+        super().__init__()
+
+        if max_entries < 1:
+            raise ValueError('max_entries must be a positive integer')
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be a positive integer')
+        if ttl is not None and ttl < 0:
+            raise ValueError('response cache ttl must be non-negative')
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+
+        # key -> (expires_at, value)
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._pop(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if self._max_bytes is not None and len(value) > self._max_bytes:
+            return
+
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (expires_at, value)
+            self._size += len(value)
+
+            while (
+                len(self._entries) > self._max_entries or
+                self._max_bytes is not None and self._size > self._max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+class SqliteResponseCache(ResponseCache):
+    """On-disk cache of model responses stored in a SQLite database.
+
+    Cache survives process restarts and could be shared between processes,
+    which is useful for re-running evaluations or reindexing jobs.
+    Database calls are made in a worker thread, so they don't block the event loop.
+
+    :param path: the path to the database file; parent directories are created if needed.
+    :param ttl: time in seconds after which an entry expires, entries don't expire by default.
+    :param max_entries: the maximum number of stored responses;
+        least recently used ones are evicted first. Not limited by default.
+    """
+
+    def __init__(self, path: PathLike, ttl: float | None = None, max_entries: int | None = None):
+        super().__init__()
+
+        if ttl is not None and ttl < 0:
+            raise ValueError('response cache ttl must be non-negative')
+        if max_entries is not None and max_entries < 1:
+            raise ValueError('max_entries must be a positive integer')
+
+        self._path = coerce_path(path)
+        self._ttl = ttl
+        self._max_entries = max_entries
+
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # NB: connection is used from the worker threads, access is serialized with the lock
+            connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+            self._connection = connection
+
+        return self._connection
+
+    def get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute('SELECT value, expires_at FROM responses WHERE key = ?', (key, )).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                connection.execute('DELETE FROM responses WHERE key = ?', (key, ))
+                return None
+
+            connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            return bytes(value)
+
+    def set(self, key: str, value: bytes) -> None:
+        now = time.time()
+        expires_at = now + self._ttl if self._ttl is not None else None
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                'INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, value, expires_at, now)
+            )
+            if self._max_entries is not None:
+                connection.execute(
+                    'DELETE FROM responses WHERE key IN '
+                    '(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                    (self._max_entries, )
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    async def aget(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
+
+def _make_key(method: str, payload: bytes) -> str:
+    digest = hashlib.sha256(method.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(payload)
+    return digest.hexdigest()
+
+
+async def cached_proto_call(
+    cache: ResponseCache | None,
+    request: Message,
+    response_type: type[ProtoResponseT],
+    call: Callable[[], Awaitable[ProtoResponseT]],
+) -> ProtoResponseT:
+    """Returns response for the gRPC request from the cache or makes the call and caches its result."""
+    if cache is None:
+        return await call()
+
+    # NB: deterministic serialization makes the same bytes for equal requests
+    # regardless of the map fields order
+    key = _make_key(request.DESCRIPTOR.full_name, request.SerializeToString(deterministic=True))
+    if (cached := await cache._lookup(key)) is not None:
+        return response_type.FromString(cached)
+
+    response = await call()
+    await cache._store(key, response.SerializeToString())
+    return response
+
+
+async def cached_http_call(
+    cache: ResponseCache | None,
+    path: str,
+    payload: Any,
+    call: Callable[[], Awaitable[bytes]],
+) -> bytes:
+    """Returns body of the response to the JSON request from the cache
+    or makes the call and caches its result."""
+    if cache is None:
+        return await call()
+
+    try:
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    except (TypeError, ValueError):
+        logger.debug('Request to %s is not cacheable', path, exc_info=True)
+        return await call()
+
+    key = _make_key(path, canonical.encode('utf-8'))
+    if (cached := await cache._lookup(key)) is not None:
+        return cached
+
+    content = await call()
+    await cache._store(key, content)
+    return content
@@ -32,6 +32,7 @@ class BaseRuns(BaseDomain, Generic[RunTypeT]):
 
     For usage examples see `runs example <https://github.com/yandex-cloud/yandex-cloud-ml-sdk/blob/master/examples/{link}/assistants/runs.py>`_.
     """
+    _grpc_services = ('ai-assistants', )
     _run_impl: type[RunTypeT]
 
     # pylint: disable=too-many-locals
@@ -1,39 +1,77 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
+import concurrent.futures
+import importlib
+import itertools
 import os
 import threading
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any
 
+import httpx
 from get_annotations import get_annotations
 from grpc import aio
 from typing_extensions import Self
 from yandex_ai_studio_sdk._utils.doc import doc_from
 
-from ._assistants.domain import Assistants, AsyncAssistants, BaseAssistants
 from ._auth import BaseAuth
 from ._authorization import get_folder_id
-from ._batch.domain import AsyncBatch, BaseBatch, Batch
-from ._chat import AsyncChat, BaseChat, Chat
+from ._channel_pool import ChannelPoolConfig
 from ._client import AsyncCloudClient
-from ._datasets.domain import AsyncDatasets, BaseDatasets, Datasets
-from ._files.domain import AsyncFiles, BaseFiles, Files
+from ._endpoint_cache import DEFAULT_ENDPOINT_CACHE_TTL, EndpointCache, get_default_endpoint_cache_path
+from ._json_codec import JsonCodecType, get_json_codec
 from ._logging import DEFAULT_DATE_FORMAT, DEFAULT_LOG_FORMAT, DEFAULT_LOG_LEVEL, LogLevel
 from ._logging.utils import setup_default_logging_impl
-from ._messages.domain import AsyncMessages, BaseMessages, Messages
-from ._models import AsyncModels, BaseModels, Models
+from ._response_cache import ResponseCache
 from ._retry import RetryPolicy
-from ._runs.domain import AsyncRuns, BaseRuns, Runs
-from ._search_api.domain import AsyncSearchAPIDomain, BaseSearchAPIDomain, SearchAPIDomain
-from ._search_indexes.domain import AsyncSearchIndexes, BaseSearchIndexes, SearchIndexes
-from ._speechkit.domain import AsyncSpeechKitDomain, BaseSpeechKitDomain, SpeechKitDomain
-from ._threads.domain import AsyncThreads, BaseThreads, Threads
-from ._tools.domain import AsyncTools, BaseTools, Tools
-from ._tuning.domain import AsyncTuning, BaseTuning, Tuning
-from ._types.domain import BaseDomain
 from ._types.misc import UNDEFINED, PathLike, UndefinedOr, get_defined_value, is_defined
 
+if TYPE_CHECKING:
+    from ._assistants.domain import Assistants, AsyncAssistants, BaseAssistants
+    from ._batch.domain import AsyncBatch, BaseBatch, Batch
+    from ._chat import AsyncChat, BaseChat, Chat
+    from ._datasets.domain import AsyncDatasets, BaseDatasets, Datasets
+    from ._files.domain import AsyncFiles, BaseFiles, Files
+    from ._messages.domain import AsyncMessages, BaseMessages, Messages
+    from ._models import AsyncModels, BaseModels, Models
+    from ._operations.domain import AsyncOperations, BaseOperations, Operations
+    from ._runs.domain import AsyncRuns, BaseRuns, Runs
+    from ._search_api.domain import AsyncSearchAPIDomain, BaseSearchAPIDomain, SearchAPIDomain
+    from ._search_indexes.domain import AsyncSearchIndexes, BaseSearchIndexes, SearchIndexes
+    from ._speechkit.domain import AsyncSpeechKitDomain, BaseSpeechKitDomain, SpeechKitDomain
+    from ._threads.domain import AsyncThreads, BaseThreads, Threads
+    from ._tools.domain import AsyncTools, BaseTools, Tools
+    from ._tuning.domain import AsyncTuning, BaseTuning, Tuning
+    from ._types.domain import BaseDomain
+
+# NB: domains are constructed on the first access and only then their modules
+# (with all of the protobuf and grpc stuff) are imported, so programs which are using
+# a couple of domains are not paying import time and memory for the rest of them
+_DOMAIN_MODULES: dict[str, str] = {
+    'tools': '._tools.domain',
+    'models': '._models',
+    'threads': '._threads.domain',
+    'files': '._files.domain',
+    'assistants': '._assistants.domain',
+    'runs': '._runs.domain',
+    'search_api': '._search_api.domain',
+    'search_indexes': '._search_indexes.domain',
+    'datasets': '._datasets.domain',
+    'tuning': '._tuning.domain',
+    'batch': '._batch.domain',
+    'chat': '._chat',
+    'speechkit': '._speechkit.domain',
+    'operations': '._operations.domain',
+    '_messages': '._messages.domain',
+}
+
+
+def _import_domain_class(name: str, class_name: str) -> type[BaseDomain]:
+    module = importlib.import_module(_DOMAIN_MODULES[name], __package__)
+    domain_class: type[BaseDomain] = getattr(module, class_name)
+    return domain_class
+
 
 class BaseSDK:
     """The main class that needs to be instantiated to work with SDK."""
@@ -65,11 +103,14 @@ class BaseSDK:
     #: Domain for working with
     #: `Yandex SpeechKit <https://yandex.cloud/docs/speechkit>`_ services.
     speechkit: BaseSpeechKitDomain
+    #: Domain for waiting on many operations at once
+    operations: BaseOperations
 
     _messages: BaseMessages
 
     _logger_name: str = 'yandex_ai_studio_sdk'
 
+    # pylint: disable-next=too-many-locals
     def __init__(
         self,
         *,
@@ -82,6 +123,14 @@ class BaseSDK:
         interceptors: UndefinedOr[Sequence[aio.ClientInterceptor]] = UNDEFINED,
         enable_server_data_logging: UndefinedOr[bool] = UNDEFINED,
         verify: UndefinedOr[bool | PathLike] = UNDEFINED,
+        http_limits: UndefinedOr[httpx.Limits] = UNDEFINED,
+        http2: UndefinedOr[bool] = UNDEFINED,
+        channel_pool: UndefinedOr[ChannelPoolConfig] = UNDEFINED,
+        endpoint_cache: UndefinedOr[PathLike | bool] = UNDEFINED,
+        endpoint_cache_ttl: UndefinedOr[float] = UNDEFINED,
+        event_loops: UndefinedOr[int] = UNDEFINED,
+        json_codec: UndefinedOr[JsonCodecType] = UNDEFINED,
+        response_cache: UndefinedOr[ResponseCache] = UNDEFINED,
     ):
         """Construct a new asynchronous sdk instance.
 
@@ -110,10 +159,58 @@ class BaseSDK:
             of requested hosts. Either `True` (default CA bundle), a path to an SSL certificate file, or `False`
             (which will disable verification).
         :type verify: bool | pathlib.Path | str | os.PathLike
+        :param http_limits: limits of the connection pool which is shared between
+            all of the HTTP requests of this SDK instance (OpenAI-compatible API,
+            datasets and files transfers). By default ``httpx.Limits()`` is used.
+        :type http_limits: httpx.Limits
+        :param http2: enables HTTP/2 for the pooled HTTP connections;
+            requires ``httpx[http2]`` extra to be installed. Defaults to ``False``.
+        :type http2: bool
+        :param channel_pool: configuration of gRPC channels pool which is created
+            for every service endpoint; by default only one channel per endpoint is used.
+            Increase ``max_channels`` when running hundreds of concurrent calls,
+            so they don't queue behind the HTTP/2 streams limit of a single connection.
+        :type channel_pool: ChannelPoolConfig
+        :param endpoint_cache: enables on-disk cache of services endpoints, which are
+            discovered with the first request to the ``endpoint``; it saves a network round-trip
+            at the start of every short-lived process. ``True`` means the default location
+            ``$XDG_CACHE_HOME/yandex-ai-studio-sdk/endpoints.json``, path-like value sets
+            a custom location. Disabled by default.
+        :type endpoint_cache: bool | pathlib.Path | str | os.PathLike
+        :param endpoint_cache_ttl: time in seconds after which the cached endpoints are
+            considered stale; stale endpoints are still used, but they are revalidated
+            in background. Defaults to one day.
+        :type endpoint_cache_ttl: float
+        :param event_loops: the number of background event loops which are serving
+            calls of the synchronous SDK; it has no effect for the asynchronous one.
+            By default all of the threads are sharing a single event loop thread,
+            which becomes a bottleneck under heavy multi-threaded load.
+            With ``event_loops > 1`` every calling thread is pinned to one of the loops
+            in turn, and each loop gets its own gRPC channels and HTTP connections.
+            Objects returned by SDK should be used from the thread they were obtained in.
+        :type event_loops: int
+        :param json_codec: the library which encodes and decodes JSON bodies of HTTP requests
+            (OpenAI-compatible API): ``'json'``, ``'orjson'``, ``'msgspec'`` or a custom
+            :py:class:`~yandex_ai_studio_sdk._json_codec.JsonCodec`.
+            Defaults to ``'auto'``, which means orjson or msgspec if one of them is installed
+            and the standard ``json`` module otherwise.
+        :type json_codec: str | JsonCodec
+        :param response_cache: enables client-side cache of the non-streaming model responses,
+            for example :py:class:`~yandex_ai_studio_sdk._response_cache.MemoryResponseCache`
+            or :py:class:`~yandex_ai_studio_sdk._response_cache.SqliteResponseCache`.
+            Identical requests to completions, embeddings and classifiers models are served
+            from the cache without calling the server. Disabled by default.
+        :type response_cache: ResponseCache
         """
         endpoint = self._get_endpoint(endpoint)
         retry_policy = retry_policy if is_defined(retry_policy) else RetryPolicy()
 
+        self._event_loops_number = get_defined_value(event_loops, 1)
+        if self._event_loops_number < 1:
+            raise ValueError('event_loops must be positive')
+        self._loop_counter = itertools.count()
+        self._loop_clients: dict[asyncio.AbstractEventLoop, AsyncCloudClient] = {}
+
         self._client = AsyncCloudClient(
             endpoint=endpoint,
             auth=get_defined_value(auth, None),  # type: ignore[arg-type]
@@ -123,10 +220,45 @@ class BaseSDK:
             yc_profile=get_defined_value(yc_profile, None),
             enable_server_data_logging=get_defined_value(enable_server_data_logging, None),
             verify=get_defined_value(verify, None),  # type: ignore[arg-type]
+            http_limits=get_defined_value(http_limits, None),
+            http2=get_defined_value(http2, False),
+            channel_pool=get_defined_value(channel_pool, None),
+            endpoint_cache=self._get_endpoint_cache(
+                get_defined_value(endpoint_cache, False),  # type: ignore[arg-type]
+                get_defined_value(endpoint_cache_ttl, DEFAULT_ENDPOINT_CACHE_TTL),
+            ),
+            json_codec=get_json_codec(get_defined_value(json_codec, 'auto')),
+            response_cache=get_defined_value(response_cache, None),
         )
         self._folder_id = get_folder_id(folder_id=get_defined_value(folder_id, None))
 
-        self._init_domains()
+    @property
+    def _client(self) -> AsyncCloudClient:
+        """Cloud client for the running event loop.
+
+        Additional event loops of the synchronous SDK are getting their own
+        copies of the main client, because gRPC channels are bound to a loop.
+        """
+        client = self.__client
+        if self._event_loops_number == 1:
+            return client
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return client
+
+        if loop is self._get_event_loop():
+            return client
+
+        if (loop_client := self._loop_clients.get(loop)) is None:
+            loop_client = self._loop_clients[loop] = client._clone()  # pylint: disable=protected-access
+        return loop_client
+
+    @_client.setter
+    def _client(self, client: AsyncCloudClient) -> None:
+        self.__client = client
+        self._loop_clients.clear()
 
     def setup_default_logging(
         self,
@@ -152,24 +284,79 @@ class BaseSDK:
         )
         return self
 
-    def _init_domains(self) -> None:
-        """Initializes domain members by creating instances of them.
+    async def _close(self) -> None:
+        """Closes pooled HTTP connections and gRPC channels of the SDK.
 
-        This method inspects the class for any members that are subclasses of
-        BaseDomain and initializes them.
+        SDK instance could be used after closing, but all of connections will be opened anew.
         """
 
-        members: dict[str, type] = {}
-        for kls in reversed(self.__class__.__mro__):
+        await self._client.close()
+
+    async def _warmup(
+        self,
+        *,
+        domains: UndefinedOr[Iterable[str]] = UNDEFINED,
+        timeout: float = 60,
+    ) -> None:
+        """Pays the SDK startup costs up front instead of the first request.
+
+        It concurrently obtains auth credentials, discovers service endpoints,
+        opens gRPC channels (waiting until they are ready) and pooled HTTP connections
+        which are used by the given domains.
+
+        :param domains: names of SDK domains to warm up, for example ``['models', 'chat']``.
+            By default all of the domains are warmed up.
+        :param timeout: the maximum time in seconds to wait for each of the warmup steps.
+            Defaults to 60 seconds.
+        """
+        all_names = [name for name in _DOMAIN_MODULES if not name.startswith('_')]
+        names = list(domains) if is_defined(domains) else all_names
+        if unknown := [name for name in names if name not in all_names]:
+            raise ValueError(
+                f'unknown domains {unknown} for warmup, available domains are: {", ".join(all_names)}'
+            )
+
+        all_domains: dict[str, BaseDomain] = {name: getattr(self, name) for name in names}
+        await self._client.warmup(
+            grpc_services=(
+                service for domain in all_domains.values()
+                for service in domain._grpc_services  # pylint: disable=protected-access
+            ),
+            http_services=(
+                service for domain in all_domains.values()
+                for service in domain._http_services  # pylint: disable=protected-access
+            ),
+            timeout=timeout,
+        )
+
+    def _get_domain_class(self, name: str) -> type[BaseDomain] | None:
+        """Finds a domain class by the member annotation of the SDK class."""
+        if name not in _DOMAIN_MODULES:
+            return None
+
+        for kls in self.__class__.__mro__:
             if kls in (BaseSDK, object):
                 continue
-            kls_members = get_annotations(kls, eval_str=True)
-            members.update(kls_members)
 
-        for member_name, member in members.items():
-            if inspect.isclass(member) and issubclass(member, BaseDomain):
-                resource = member(name=member_name, sdk=self)
-                setattr(self, member_name, resource)
+            annotation = get_annotations(kls).get(name)
+            if isinstance(annotation, type):
+                return annotation
+            if isinstance(annotation, str):
+                return _import_domain_class(name, annotation)
+
+        return None
+
+    if not TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any:
+            """Creates a domain instance on the first access to it."""
+            domain_class = self._get_domain_class(name)
+            if domain_class is None:
+                raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {name!r}')
+
+            domain = domain_class(name=name, sdk=self)
+            # NB: in case of concurrent first access from different threads
+            # all of them are getting the same instance
+            return self.__dict__.setdefault(name, domain)
 
     def _get_endpoint(self, endpoint: UndefinedOr[str] | None) -> str | None:
         """Retrieves the API endpoint.
@@ -188,12 +375,22 @@ class BaseSDK:
 
         return 'api.cloud.yandex.net:443'
 
+    def _get_endpoint_cache(self, endpoint_cache: PathLike | bool, ttl: float) -> EndpointCache | None:
+        if endpoint_cache is False:
+            return None
+
+        if endpoint_cache is True:
+            return EndpointCache(get_default_endpoint_cache_path(), ttl=ttl)
+
+        return EndpointCache(endpoint_cache, ttl=ttl)
+
     # NB: All typehints on these classes must be 3.8-compatible
     # to properly work with get_annotations
     _event_loop: asyncio.AbstractEventLoop | None = None
     _loop_thread: threading.Thread | None = None
     _number: int = 0
     _lock = threading.Lock()
+    _extra_event_loops: list[asyncio.AbstractEventLoop] = []
 
     @classmethod
     def _start_event_loop(cls):
@@ -206,6 +403,51 @@ class BaseSDK:
         asyncio.set_event_loop(loop)
         loop.run_forever()
 
+    def _get_thread_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Selects event loop for a new thread which is calling the synchronous SDK.
+
+        The result is remembered by yandex_ai_studio_sdk._utils.sync for the thread,
+        so threads are pinned to the loops and distributed between them in turn.
+        """
+        if self._event_loops_number == 1:
+            return self._get_event_loop()
+
+        loops = self._get_event_loops(self._event_loops_number)
+        return loops[next(self._loop_counter) % len(loops)]
+
+    @staticmethod
+    def _get_event_loops(number: int) -> list[asyncio.AbstractEventLoop]:
+        """Returns ``number`` of event loops with the main one going first.
+
+        Additional loops are started on demand and shared between the SDK instances,
+        the same as the main loop.
+        """
+        # pylint: disable=protected-access
+        kls = BaseSDK
+        main_loop = kls._get_event_loop()
+
+        with kls._lock:
+            while len(kls._extra_event_loops) < number - 1:
+                thread_name = f'{kls.__name__}-{kls._number}'
+                kls._number += 1
+
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=kls._run_event_loop,
+                    args=(loop, ),
+                    daemon=True,
+                    name=thread_name
+                )
+                thread.start()
+                kls._extra_event_loops.append(loop)
+
+            return [main_loop, *kls._extra_event_loops[:number - 1]]
+
+    @staticmethod
+    def _run_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
     @staticmethod
     def _get_event_loop() -> asyncio.AbstractEventLoop:
         """This event loop is used at yandex_ai_studio_sdk._utils.sync.run_sync
@@ -255,8 +497,28 @@ class AsyncAIStudio(BaseSDK):
     batch: AsyncBatch
     chat: AsyncChat
     speechkit: AsyncSpeechKitDomain
+    operations: AsyncOperations
     _messages: AsyncMessages
 
+    @doc_from(BaseSDK._warmup)
+    async def warmup(
+        self,
+        *,
+        domains: UndefinedOr[Iterable[str]] = UNDEFINED,
+        timeout: float = 60,
+    ) -> None:
+        await self._warmup(domains=domains, timeout=timeout)
+
+    @doc_from(BaseSDK._close)
+    async def close(self) -> None:
+        await self._close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._close()
+
 
 @doc_from(BaseSDK)
 class AIStudio(BaseSDK):
@@ -273,4 +535,50 @@ class AIStudio(BaseSDK):
     batch: Batch
     chat: Chat
     speechkit: SpeechKitDomain
+    operations: Operations
     _messages: Messages
+
+    @doc_from(BaseSDK._warmup)
+    def warmup(
+        self,
+        *,
+        domains: UndefinedOr[Iterable[str]] = UNDEFINED,
+        timeout: float = 60,
+    ) -> None:
+        # NB: with event_loops > 1 every loop has its own client, and calling threads
+        # are distributed between loops, so all of the clients are warmed up
+        if is_defined(domains):
+            domains = list(domains)
+
+        loops = self._get_event_loops(self._event_loops_number)
+        futures = [
+            asyncio.run_coroutine_threadsafe(self._warmup(domains=domains, timeout=timeout), loop)
+            for loop in loops
+        ]
+        concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
+
+    @doc_from(BaseSDK._close)
+    def close(self) -> None:
+        # NB: every event loop has its own client which must be closed within the loop
+        for loop in [self._get_event_loop(), *self._loop_clients]:
+            asyncio.run_coroutine_threadsafe(self._close(), loop).result()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def import_domains() -> None:
+    """Imports all of the domain classes into this module namespace.
+
+    Domains are imported lazily, but tools such as sphinx autodoc
+    need them to resolve annotations of the SDK classes.
+    """
+    for kls in (BaseSDK, AsyncAIStudio, AIStudio):
+        for name, class_name in get_annotations(kls).items():
+            if name in _DOMAIN_MODULES:
+                globals()[class_name] = _import_domain_class(name, class_name)
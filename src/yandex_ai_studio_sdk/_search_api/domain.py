@@ -13,6 +13,7 @@ class BaseSearchAPIDomain(DomainWithFunctions):
     """
     Domain for working with `Yandex Search API <https://yandex.cloud/docs/search-api>`_ services.
     """
+    _grpc_services = ('searchapi', )
 
     #: API for `generative response <https://yandex.cloud/docs/search-api/concepts/generative-response>`_ service
     generative: BaseGenerativeSearchFunction
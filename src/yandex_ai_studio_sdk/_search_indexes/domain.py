@@ -28,6 +28,7 @@ class BaseSearchIndexes(BaseDomain, Generic[SearchIndexTypeT, OperationTypeT]):
     A class for search indexes. It is a part of Assistants API
     and it provides the foundation for creating and managing search indexes.
     """
+    _grpc_services = ('ai-assistants', 'operation')
     _impl: type[SearchIndexTypeT]
     _operation_type: type[OperationTypeT]
 
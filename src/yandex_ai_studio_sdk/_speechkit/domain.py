@@ -10,6 +10,7 @@ class BaseSpeechKitDomain(DomainWithFunctions):
     """
     Domain for working with `Yandex SpeechKit services <https://yandex.cloud/docs/speechkit/>`_.
     """
+    _grpc_services = ('ai-tts-v3', )
 
     #: API for `text to speech <https://yandex.cloud/docs/speechkit/tts/>`_ service
     text_to_speech: BaseTextToSpeechFunction
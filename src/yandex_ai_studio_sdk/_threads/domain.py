@@ -23,6 +23,7 @@ class BaseThreads(BaseDomain, Generic[ThreadTypeT]):
 
     This class provides methods to create, retrieve, and list threads.
     """
+    _grpc_services = ('ai-assistants', )
     _thread_impl: type[ThreadTypeT]
 
     async def _create(
@@ -30,6 +30,7 @@ class BaseTuning(BaseDomain, Generic[TuningTaskTypeT]):
     This class serves as the foundation for all model fine-tuning operations,
     providing comprehensive functionality.
     """
+    _grpc_services = ('ai-foundation-models', )
     _tuning_impl: type[TuningTaskTypeT]
 
     def _coerce_datasets(
@@ -17,6 +17,7 @@ from yandex.cloud.operation.operation_pb2 import Operation as ProtoOperation
 from yandex.cloud.operation.operation_service_pb2 import CancelOperationRequest, GetOperationRequest
 from yandex.cloud.operation.operation_service_pb2_grpc import OperationServiceStub
 from yandex_ai_studio_sdk._logging import TRACE, get_logger
+from yandex_ai_studio_sdk._polling import EtaPolling, ExponentialPolling, PollingStrategy
 from yandex_ai_studio_sdk._types.operation import (
     AsyncOperationMixin, OperationErrorInfo, OperationInterface, OperationStatus, SyncOperationMixin
 )
@@ -155,6 +156,23 @@ class BaseTuningTask(OperationInterface[TuningResultTypeT_co, TuningTaskStatus])
     def _client(self):
         return self._sdk._client
 
+    def _get_default_polling(self) -> PollingStrategy:
+        return EtaPolling(
+            min_interval=10,
+            max_interval=600,
+            fallback=ExponentialPolling(initial_interval=10, multiplier=1.5, max_interval=120),
+        )
+
+    def _get_progress(self, status: TuningTaskStatus) -> float | None:
+        if not status.metadata:
+            return None
+
+        metadata = TuningMetadata()
+        if not status.metadata.Unpack(metadata) or not metadata.total_steps:
+            return None
+
+        return metadata.current_step / metadata.total_steps
+
     async def _get_operation_id(self, *, timeout: float = 60) -> str | None:
         if not self._operation_id:
             logger.debug('Trying to find operation_id for %s', self)
@@ -11,6 +11,7 @@ from yandex.cloud.ai.batch_inference.v1.batch_inference_service_pb2 import (
 from yandex.cloud.ai.batch_inference.v1.batch_inference_service_pb2_grpc import BatchInferenceServiceStub
 from yandex_ai_studio_sdk._datasets.dataset import AsyncDataset, Dataset
 from yandex_ai_studio_sdk._logging import TRACE, get_logger
+from yandex_ai_studio_sdk._polling import ExponentialPolling, PollingStrategy
 from yandex_ai_studio_sdk._types.operation import (
     AsyncOperationMixin, OperationInterface, ResultTypeT_co, SyncOperationMixin
 )
@@ -41,6 +42,10 @@ class BaseBatchTaskOperation(OperationInterface[ResultTypeT_co, BatchTaskStatus]
         self._sdk = sdk
         self._lock = Lock()
 
+    def _get_default_polling(self) -> PollingStrategy:
+        # NB: batch tasks are running for hours, so there is no sense in frequent polling
+        return ExponentialPolling(initial_interval=10, multiplier=1.5, max_interval=600)
+
     @property
     def id(self) -> str:  # type: ignore[override]
         return self._id
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from get_annotations import get_annotations
 
@@ -9,10 +9,17 @@ from .function import BaseModelFunction
 if TYPE_CHECKING:
     from yandex_ai_studio_sdk._client import AsyncCloudClient
     from yandex_ai_studio_sdk._sdk import BaseSDK
+    from yandex_ai_studio_sdk._utils.http import HTTPServiceName
 
 
 class BaseDomain:
     # TODO: add some repr, description and such
+
+    # names of gRPC services (as they are named at endpoints discovery)
+    # and HTTP services which are used by the domain; used for SDK warmup
+    _grpc_services: ClassVar[tuple[str, ...]] = ()
+    _http_services: ClassVar[tuple[HTTPServiceName, ...]] = ()
+
     def __init__(self, name: str, sdk: BaseSDK):
         self._name = name
         self._sdk = sdk
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import array
+import sys
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Literal, overload
+
+from typing_extensions import Self, TypeAlias
+
+if TYPE_CHECKING:
+    import numpy
+
+EmbeddingTypecode: TypeAlias = Literal['f', 'd']
+
+
+class EmbeddingVector(Sequence):
+    """Immutable vector of floats, which is stored in a contiguous array buffer.
+
+    It behaves like a tuple of floats (and compares equal to it),
+    but doesn't keep a Python float object per element and could be
+    viewed as a numpy array without copying.
+    """
+
+    __slots__ = ('_buffer',)
+
+    _buffer: array.array
+
+    def __init__(self, values: Iterable[float] | array.array, typecode: EmbeddingTypecode = 'd'):
+        if isinstance(values, array.array) and values.typecode == typecode:
+            buffer = values
+        else:
+            buffer = array.array(typecode, values)
+
+        object.__setattr__(self, '_buffer', buffer)
+
+    @classmethod
+    def _from_bytes(
+        cls,
+        data: bytes,
+        typecode: EmbeddingTypecode,
+        byteorder: Literal['little', 'big'] = 'little',
+    ) -> Self:
+        buffer = array.array(typecode)
+        buffer.frombytes(data)
+        # NB: frombytes decodes items in the native byte order
+        if byteorder != sys.byteorder:
+            buffer.byteswap()
+        return cls(buffer, typecode=typecode)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __reduce__(self):
+        # NB: default protocol restores slots via __setattr__, which is forbidden here;
+        # array itself is pickled in a portable way regardless of the byte order
+        return (type(self), (self._buffer, self.typecode))
+
+    @property
+    def typecode(self) -> EmbeddingTypecode:
+        """Typecode of the underlying buffer: ``'f'`` for float32 and ``'d'`` for float64"""
+        return self._buffer.typecode  # type: ignore[return-value]
+
+    def tobytes(self) -> bytes:
+        """Returns raw bytes of the underlying buffer"""
+        return self._buffer.tobytes()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @overload
+    def __getitem__(self, index: int, /) -> float:
+        pass
+
+    @overload
+    def __getitem__(self, slice_: slice, /) -> tuple[float, ...]:
+        pass
+
+    def __getitem__(self, index, /):
+        if isinstance(index, slice):
+            return tuple(self._buffer[index])
+        return self._buffer[index]
+
+    def __iter__(self):
+        return iter(self._buffer)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EmbeddingVector):
+            return self._buffer == other._buffer
+        if isinstance(other, tuple):
+            return tuple(self._buffer) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._buffer))
+
+    def __repr__(self) -> str:
+        return repr(tuple(self._buffer))
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> numpy.ndarray:
+        array_ = _view_buffer(self._buffer)
+        # NB: view shares memory with an immutable vector, so it must be immutable too
+        array_.flags.writeable = False
+
+        return _coerce_array(array_, dtype=dtype, copy=copy)
+
+
+def _view_buffer(buffer: array.array) -> numpy.ndarray:
+    import numpy  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    dtype = numpy.float32 if buffer.typecode == 'f' else numpy.float64
+    return numpy.frombuffer(memoryview(buffer), dtype=dtype)
+
+
+def _coerce_array(array_: numpy.ndarray, dtype: Any, copy: bool | None) -> numpy.ndarray:
+    import numpy  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    need_cast = dtype is not None and numpy.dtype(dtype) != array_.dtype
+
+    if copy is False and need_cast:
+        raise ValueError(
+            f"`copy=False` isn't supported for dtype {dtype!r}, because embeddings are stored as {array_.dtype}"
+        )
+
+    if need_cast:
+        return array_.astype(dtype)
+
+    if copy:
+        return array_.copy()
+
+    return array_
+
+
+class BaseEmbeddingResult(Sequence):
+    """Mixin for results with an embedding vector, which gives them
+    sequence and numpy array protocols.
+    """
+
+    embedding: EmbeddingVector
+
+    def __post_init__(self) -> None:
+        # NB: we are allowing to pass any sequence of floats into constructor
+        if not isinstance(self.embedding, EmbeddingVector):
+            object.__setattr__(self, 'embedding', EmbeddingVector(self.embedding))
+
+    def __len__(self) -> int:
+        return len(self.embedding)
+
+    @overload
+    def __getitem__(self, index: int, /) -> float:
+        pass
+
+    @overload
+    def __getitem__(self, slice_: slice, /) -> tuple[float, ...]:
+        pass
+
+    def __getitem__(self, index, /):
+        return self.embedding[index]
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> numpy.ndarray:
+        return self.embedding.__array__(dtype=dtype, copy=copy)
+
+    @classmethod
+    def stack(
+        cls,
+        results: Iterable[BaseEmbeddingResult | EmbeddingVector],
+        *,
+        dtype: Any = None,
+    ) -> numpy.ndarray:
+        """Stacks embeddings of several results into one ``(n, dim)`` numpy matrix.
+
+        Embeddings are joined buffer by buffer, without creating a Python float
+        for each element.
+
+        :param results: results or embedding vectors of the same dimension.
+        :param dtype: numpy dtype of the resulting matrix;
+            by default the dtype of the embeddings buffers is used.
+        """
+        return stack_embeddings(results, dtype=dtype)
+
+
+def stack_embeddings(
+    results: Iterable[BaseEmbeddingResult | EmbeddingVector],
+    *,
+    dtype: Any = None,
+) -> numpy.ndarray:
+    import numpy  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    buffer: array.array | None = None
+    dim: int | None = None
+    rows = 0
+    for result in results:
+        vector = result.embedding if isinstance(result, BaseEmbeddingResult) else result
+        # pylint: disable-next=protected-access
+        source = vector._buffer
+
+        if buffer is None:
+            buffer = array.array(source.typecode)
+            dim = len(source)
+        elif len(source) != dim:
+            raise ValueError(f'all embeddings must have the same dimension, got {len(source)} and {dim}')
+
+        if source.typecode == buffer.typecode:
+            buffer.extend(source)
+        else:
+            buffer.extend(array.array(buffer.typecode, source))
+        rows += 1
+
+    if buffer is None or dim is None:
+        return numpy.empty((0, 0), dtype=dtype or numpy.float64)
+
+    matrix = _view_buffer(buffer).reshape(rows, dim)
+    if dtype is not None and numpy.dtype(dtype) != matrix.dtype:
+        return matrix.astype(dtype)
+
+    return matrix
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Generic, TypeVar
 from yandex_ai_studio_sdk._tuning.tuning_task import TuningTaskTypeT
 
 from .._client import AsyncCloudClient
+from .._polling import PollIntervalType
 from .._utils.parse_uri import parse_uri
 from .misc import Undefined, UndefinedOr, get_defined_value
 from .model_config import ConfigTypeT
@@ -147,7 +148,7 @@ class ModelTuneMixin(
         self,
         timeout: float = 60,
         poll_timeout: int = 72 * 60 * 60,
-        poll_interval: float = 60,
+        poll_interval: PollIntervalType | None = None,
         **kwargs,
     ) -> Self:
         operation = await self._tune_deferred(
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import concurrent.futures
+import time
 from collections.abc import Awaitable, Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, TypeVar, cast, get_origin
@@ -15,6 +17,9 @@ from yandex.cloud.operation.operation_pb2 import Operation as ProtoOperation
 from yandex.cloud.operation.operation_service_pb2 import CancelOperationRequest, GetOperationRequest
 from yandex.cloud.operation.operation_service_pb2_grpc import OperationServiceStub
 from yandex_ai_studio_sdk._logging import TRACE, get_logger
+from yandex_ai_studio_sdk._polling import (
+    ExponentialPolling, PollingStrategy, PollIntervalType, coerce_polling_strategy
+)
 from yandex_ai_studio_sdk._utils.sync import run_sync_impl
 from yandex_ai_studio_sdk.exceptions import RunError, WrongAsyncOperationStatusError
 
@@ -150,15 +155,42 @@ class OperationInterface(abc.ABC, Generic[AnyResultTypeT_co, OperationStatusType
         # method is created for patching it in a tests
         await asyncio.sleep(delay)
 
-    async def _wait_impl(self, timeout: float, poll_interval: float) -> OperationStatusTypeT:
+    def _get_default_polling(self) -> PollingStrategy:
+        """Polling strategy which is used when user doesn't pass ``poll_interval``."""
+        interval = self._default_poll_interval
+        return ExponentialPolling(initial_interval=min(1, interval), max_interval=interval)
+
+    def _get_progress(self, status: OperationStatusTypeT) -> float | None:  # pylint: disable=unused-argument
+        """Returns the completed fraction of the operation if it is known from the status."""
+        return None
+
+    def _get_poll_interval(
+        self,
+        polling: PollingStrategy,
+        status: OperationStatusTypeT,
+        *,
+        attempt: int,
+        started_at: float,
+    ) -> float:
+        return polling.get_interval(
+            attempt=attempt,
+            elapsed=time.monotonic() - started_at,
+            progress=self._get_progress(status),
+        )
+
+    async def _wait_impl(self, timeout: float, polling: PollingStrategy) -> OperationStatusTypeT:
+        started_at = time.monotonic()
+        attempt = 1
         status = await self._get_status(timeout=timeout)
         while status.is_running:
+            poll_interval = self._get_poll_interval(polling, status, attempt=attempt, started_at=started_at)
             logger.debug(
                 "%s have non-terminal status %s, sleep for %fs",
                 self, status.status_name, poll_interval
             )
             await self._sleep_impl(poll_interval)
             status = await self._get_status(timeout=timeout)
+            attempt += 1
 
         if status.is_succeeded:
             logger.info('%s successfully finished', self)
@@ -172,20 +204,20 @@ class OperationInterface(abc.ABC, Generic[AnyResultTypeT_co, OperationStatusType
         *,
         timeout: float,
         poll_timeout: int | None,
-        poll_interval: float | None,
+        poll_interval: PollIntervalType | None,
     ) -> AnyResultTypeT_co:
         # poll_timeout got from user
         # custom_default_poll_timeout - from operation __init__
         # default_poll_timeout - from class
         poll_timeout = poll_timeout or self._custom_default_poll_timeout or self._default_poll_timeout
-        poll_interval = poll_interval or self._default_poll_interval
+        polling = coerce_polling_strategy(poll_interval, default=self._get_default_polling())
 
         logger.info(
-            "Starting %s polling with a poll interval %fs and poll timeout %fs",
-            self, poll_interval, poll_timeout,
+            "Starting %s polling with %r and poll timeout %fs",
+            self, polling, poll_timeout,
         )
 
-        coro = self._wait_impl(timeout=timeout, poll_interval=poll_interval)
+        coro = self._wait_impl(timeout=timeout, polling=polling)
         if poll_timeout:
             coro = asyncio.wait_for(coro, timeout=poll_timeout)
 
@@ -195,6 +227,36 @@ class OperationInterface(abc.ABC, Generic[AnyResultTypeT_co, OperationStatusType
 
         return await self._get_result(timeout=timeout)
 
+    def _watch(self, poll_interval: PollIntervalType | None) -> asyncio.Future[AnyResultTypeT_co]:
+        polling = coerce_polling_strategy(poll_interval, default=self._get_default_polling())
+        poller = self._sdk.operations._get_poller()
+        return poller.watch(self, polling)
+
+    async def _watch_concurrent(
+        self,
+        poll_interval: PollIntervalType | None,
+    ) -> concurrent.futures.Future[AnyResultTypeT_co]:
+        loop = asyncio.get_running_loop()
+        async_future = self._watch(poll_interval)
+        future: concurrent.futures.Future[AnyResultTypeT_co] = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+
+        def copy_state(source: asyncio.Future[AnyResultTypeT_co]) -> None:
+            if source.cancelled():
+                future.cancel()
+            elif (exception := source.exception()) is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(source.result())
+
+        def propagate_cancel(destination: concurrent.futures.Future[AnyResultTypeT_co]) -> None:
+            if destination.cancelled() and not loop.is_closed():
+                loop.call_soon_threadsafe(async_future.cancel)
+
+        async_future.add_done_callback(copy_state)
+        future.add_done_callback(propagate_cancel)
+        return future
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}<id="{self.id}">'
 
@@ -355,7 +417,7 @@ class BaseOperation(Generic[ResultTypeT_co], OperationInterface[ResultTypeT_co,
         *,
         timeout: float = 60,
         poll_timeout: int | None = None,
-        poll_interval: float | None = None,
+        poll_interval: PollIntervalType | None = None,
     ) -> ResultTypeT_co:
         return await super()._wait(
             timeout=timeout,
@@ -379,7 +441,7 @@ class AsyncOperationMixin(OperationInterface[AnyResultTypeT_co, OperationStatusT
         *,
         timeout: float = 60,
         poll_timeout: int | None = None,
-        poll_interval: float | None = None,
+        poll_interval: PollIntervalType | None = None,
     ) -> AnyResultTypeT_co:
         return await self._wait(
             timeout=timeout,
@@ -387,6 +449,38 @@ class AsyncOperationMixin(OperationInterface[AnyResultTypeT_co, OperationStatusT
             poll_interval=poll_interval,
         )
 
+    def as_future(self, *, poll_interval: PollIntervalType | None = None) -> asyncio.Future[AnyResultTypeT_co]:
+        """Returns a future which is resolved with the operation result when it finishes.
+
+        Unlike :meth:`wait`, it doesn't require a coroutine per operation: statuses of all
+        of the watched operations are polled by a single background task of the SDK,
+        see :class:`~yandex_ai_studio_sdk._operations.domain.AsyncOperations`.
+        Cancelling of the future stops the polling of the operation,
+        but doesn't cancel the operation itself.
+
+        :param poll_interval: the interval in seconds between status requests or
+            a :class:`~yandex_ai_studio_sdk.polling.PollingStrategy`.
+        """
+        return self._watch(poll_interval)
+
+    def add_done_callback(
+        self,
+        callback: Callable[[asyncio.Future[AnyResultTypeT_co]], Any],
+        *,
+        poll_interval: PollIntervalType | None = None,
+    ) -> asyncio.Future[AnyResultTypeT_co]:
+        """Calls ``callback`` with the future of operation result when the operation finishes.
+
+        Returns the future, see :meth:`as_future` for details.
+
+        :param callback: a callable accepting the finished future.
+        :param poll_interval: the interval in seconds between status requests or
+            a :class:`~yandex_ai_studio_sdk.polling.PollingStrategy`.
+        """
+        future = self.as_future(poll_interval=poll_interval)
+        future.add_done_callback(callback)
+        return future
+
     def __await__(self):
         return self.wait().__await__()
 
@@ -419,7 +513,7 @@ class SyncOperationMixin(OperationInterface[AnyResultTypeT_co, OperationStatusTy
         *,
         timeout: float = 60,
         poll_timeout: int | None = None,
-        poll_interval: float | None = None,
+        poll_interval: PollIntervalType | None = None,
     ) -> AnyResultTypeT_co:
         return run_sync_impl(
             self._wait(
@@ -430,6 +524,46 @@ class SyncOperationMixin(OperationInterface[AnyResultTypeT_co, OperationStatusTy
             self._sdk
         )
 
+    def as_future(
+        self,
+        *,
+        poll_interval: PollIntervalType | None = None,
+    ) -> concurrent.futures.Future[AnyResultTypeT_co]:
+        """Returns a future which is resolved with the operation result when it finishes.
+
+        Unlike :meth:`wait`, it doesn't block and doesn't require a thread per operation:
+        statuses of all of the watched operations are polled by a single background task
+        in the SDK event loop.
+        Cancelling of the future stops the polling of the operation,
+        but doesn't cancel the operation itself.
+
+        :param poll_interval: the interval in seconds between status requests or
+            a :class:`~yandex_ai_studio_sdk.polling.PollingStrategy`.
+        """
+        return run_sync_impl(
+            self._watch_concurrent(poll_interval),
+            self._sdk,
+        )
+
+    def add_done_callback(
+        self,
+        callback: Callable[[concurrent.futures.Future[AnyResultTypeT_co]], Any],
+        *,
+        poll_interval: PollIntervalType | None = None,
+    ) -> concurrent.futures.Future[AnyResultTypeT_co]:
+        """Calls ``callback`` with the future of operation result when the operation finishes.
+
+        Callback is called in the thread of the SDK event loop, so it must not block.
+        Returns the future, see :meth:`as_future` for details.
+
+        :param callback: a callable accepting the finished future.
+        :param poll_interval: the interval in seconds between status requests or
+            a :class:`~yandex_ai_studio_sdk.polling.PollingStrategy`.
+        """
+        future = self.as_future(poll_interval=poll_interval)
+        future.add_done_callback(callback)
+        return future
+
 
 class Operation(SyncOperationMixin[ResultTypeT_co, OperationStatus], BaseOperation[ResultTypeT_co]):
     pass
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import weakref
 from typing import Literal, TypedDict, Union
 
 from typing_extensions import NotRequired, Required, TypeAlias, TypeGuard
@@ -81,6 +83,26 @@ def is_pydantic_model_class(response_format: ResponseType) -> TypeGuard[type[pyd
     )
 
 
+# NB: schema generation by pydantic is slow, so schemas are cached per class;
+# weak keys are allowing classes, which are created on the fly, to be collected
+_PYDANTIC_SCHEMAS: weakref.WeakKeyDictionary[type, JsonSchemaType] = weakref.WeakKeyDictionary()
+
+
+def _pydantic_json_schema(type_: type) -> JsonSchemaType:
+    """Returns cached json schema of pydantic model class or pydantic dataclass;
+    result is shared between calls and must not be modified."""
+    if (schema := _PYDANTIC_SCHEMAS.get(type_)) is not None:
+        return schema
+
+    if is_pydantic_model_class(type_):
+        schema = type_.model_json_schema()
+    else:
+        schema = pydantic.TypeAdapter(type_).json_schema()
+
+    _PYDANTIC_SCHEMAS[type_] = schema
+    return schema
+
+
 def http_schema_from_response_format(response_format: ResponseType) -> JsonSchemaParameterType:
     result: JsonSchemaParameterType
 
@@ -130,21 +152,11 @@ def http_schema_from_response_format(response_format: ResponseType) -> JsonSchem
             "Response type could be only str, jsonschema dict, pydantic model class or pydantic dataclass"
         )
 
-    elif is_pydantic_model_class(response_format):
-        result = {
-            'type': 'json_schema',
-            'json_schema': {
-                'schema': response_format.model_json_schema(),
-                'name': response_format.__name__,
-                'strict': True,
-            },
-        }
     else:
-        assert pydantic.dataclasses.is_pydantic_dataclass(response_format)
         result = {
             'type': 'json_schema',
             'json_schema': {
-                'schema': pydantic.TypeAdapter(response_format).json_schema(),
+                'schema': _pydantic_json_schema(response_format),
                 'name': response_format.__name__,
                 'strict': True,
             },
@@ -177,10 +189,9 @@ def make_response_format_kwargs(
 def schema_from_parameters(parameters: ParametersType) -> JsonSchemaType:
     if isinstance(parameters, dict):
         result = dict(parameters)
-    elif is_pydantic_model_class(parameters):
-        result = parameters.model_json_schema()
-    elif PYDANTIC and pydantic.dataclasses.is_pydantic_dataclass(parameters):
-        result = pydantic.TypeAdapter(parameters).json_schema()
+    elif is_pydantic_model_class(parameters) or PYDANTIC and pydantic.dataclasses.is_pydantic_dataclass(parameters):
+        # NB: tool owns its parameters, so it gets a copy of the cached schema
+        result = copy.deepcopy(_pydantic_json_schema(parameters))  # type: ignore[arg-type]
     else:
         raise TypeError(
             "Function call parameters could be only jsonschema dict, pydantic model class or pydantic dataclass"
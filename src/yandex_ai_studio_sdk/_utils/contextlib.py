@@ -27,3 +27,25 @@ class nullcontext:  # pylint: disable=invalid-name
 
     async def __aexit__(self, *excinfo):
         pass
+
+
+class aclosing:  # pylint: disable=invalid-name
+    """Async context manager for safely finalizing an asynchronously cleaned-up
+    resource such as an async generator, calling its ``aclose()`` method.
+
+    It is needed for nested async generators: closing of the outer one doesn't
+    close the inner ones, which otherwise are finalized by event loop sometime later.
+
+    async with aclosing(agen) as agen:
+        async for item in agen:
+            ...
+    """
+
+    def __init__(self, thing):
+        self.thing = thing
+
+    async def __aenter__(self):
+        return self.thing
+
+    async def __aexit__(self, *excinfo):
+        await self.thing.aclose()
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import tempfile
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Coroutine, Iterable
+from pathlib import Path
+from typing import Any, Callable, Final, TypeVar
+
+import httpx
+from typing_extensions import TypeAlias
+from yandex_ai_studio_sdk._logging import get_logger
+from yandex_ai_studio_sdk._utils.contextlib import aclosing
+
+logger = get_logger(__name__)
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE: Final[int] = 8 * 1024 ** 2  # 8Mb
+DEFAULT_MAX_RESUME_ATTEMPTS: Final[int] = 3
+
+T = TypeVar('T')
+
+
+@dataclasses.dataclass(frozen=True)
+class DownloadProgress:
+    """This class represents a progress of a single file download."""
+    #: the name of the downloading file
+    key: str
+    #: the number of bytes downloaded so far
+    downloaded_bytes: int
+    #: the size of the file in bytes if it was reported by the server
+    total_bytes: int | None
+    #: time in seconds passed since the start of the download
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Average download speed in bytes per second"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.downloaded_bytes / self.elapsed
+
+
+#: type alias for a download progress callback;
+#: in case of synchronous SDK it is called from the SDK event loop thread
+DownloadProgressCallback: TypeAlias = Callable[[DownloadProgress], None]
+
+
+# pylint: disable-next=too-many-locals
+async def iter_url_bytes(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    key: str,
+    timeout: float,
+    chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    max_resume_attempts: int = DEFAULT_MAX_RESUME_ATTEMPTS,
+    progress_callback: DownloadProgressCallback | None = None,
+) -> AsyncIterator[bytes]:
+    """Streams the body of ``url`` by chunks without buffering it whole in memory.
+
+    In case of network failure in the middle of the download it
+    continues from the last received byte with a ``Range`` request.
+    """
+
+    offset = 0
+    attempt = 0
+    total: int | None = None
+    start = time.monotonic()
+
+    while True:
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+        try:
+            async with client.stream('GET', url, headers=headers, timeout=timeout) as response:
+                response.raise_for_status()
+
+                # NB: server is free to ignore Range header and send the whole body again,
+                # in this case we need to skip already received part
+                to_skip = offset if response.status_code != httpx.codes.PARTIAL_CONTENT else 0
+                if total is None and (content_length := response.headers.get('content-length')):
+                    total = int(content_length) + offset - to_skip
+
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    if to_skip:
+                        if len(chunk) <= to_skip:
+                            to_skip -= len(chunk)
+                            continue
+                        chunk = chunk[to_skip:]
+                        to_skip = 0
+
+                    offset += len(chunk)
+                    yield chunk
+
+                    if progress_callback:
+                        progress_callback(
+                            DownloadProgress(
+                                key=key,
+                                downloaded_bytes=offset,
+                                total_bytes=total,
+                                elapsed=time.monotonic() - start,
+                            )
+                        )
+            return
+        except httpx.TransportError:
+            if attempt >= max_resume_attempts:
+                raise
+
+            attempt += 1
+            logger.warning(
+                'Download of %s was interrupted at %d bytes, resuming (attempt %d of %d)',
+                key, offset, attempt, max_resume_attempts,
+                exc_info=True,
+            )
+
+
+async def iter_prefetched_files(
+    items: Iterable[tuple[str, str]],
+    *,
+    download: Callable[[Path, str, str], Coroutine[Any, Any, None]],
+    read_file: Callable[[str], AsyncIterator[T]],
+    prefetch: int,
+) -> AsyncIterator[T]:
+    """Downloads ``(key, url)`` items to temporary files and reads them strictly in order.
+
+    Downloads of the next ``prefetch`` items are running in background while
+    the current file is being read, so network and decoding are overlapping;
+    at most ``prefetch + 1`` temporary files exist at once.
+    """
+
+    items_iter = iter(items)
+    pending: deque[tuple[Path, asyncio.Task[None]]] = deque()
+
+    def schedule_next() -> None:
+        item = next(items_iter, None)
+        if item is None:
+            return
+
+        key, url = item
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            path = Path(tmp.name)
+
+        task = asyncio.create_task(download(path, key, url))
+        pending.append((path, task))
+
+    try:
+        for _ in range(prefetch + 1):
+            schedule_next()
+
+        while pending:
+            path, task = pending[0]
+            await task
+
+            async with aclosing(read_file(str(path))) as records:
+                async for record in records:
+                    yield record
+
+            pending.popleft()
+            path.unlink()
+
+            # NB: next download starts only after the current file is removed,
+            # so the current file and prefetched ones are never more than prefetch + 1
+            schedule_next()
+    finally:
+        for _, task in pending:
+            task.cancel()
+        await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+        for path, _ in pending:
+            if path.exists():
+                path.unlink()
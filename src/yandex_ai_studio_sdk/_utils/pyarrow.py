@@ -2,29 +2,56 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncIterator, Iterator
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    import pyarrow
 
 RecordType = dict[Any, Any]
 
+T = TypeVar('T')
+
+_STOP = object()
 
-async def read_dataset_records(path: str, batch_size: int | None) -> AsyncIterator[RecordType]:
-    iterator = read_dataset_records_sync(path=path, batch_size=batch_size)
 
-    def get_next() -> RecordType | None:
-        try:
-            return next(iterator)
-        except StopIteration:
-            return None
+async def _iterate_in_thread(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """Pulls items from a blocking iterator with one thread hop per item"""
+
+    def get_next() -> Any:
+        return next(iterator, _STOP)
 
     while True:
         item = await asyncio.to_thread(get_next)
-        if item is None:
+        if item is _STOP:
             return
 
         yield item
 
 
-def read_dataset_records_sync(path: str, batch_size: int | None) -> Iterator[RecordType]:
+async def read_dataset_batches(path: str, batch_size: int | None) -> AsyncIterator[pyarrow.RecordBatch]:
+    async for batch in _iterate_in_thread(read_dataset_batches_sync(path=path, batch_size=batch_size)):
+        yield batch
+
+
+async def read_dataset_records(path: str, batch_size: int | None) -> AsyncIterator[RecordType]:
+    # NB: batch decoding and conversion to python objects are both
+    # happening in a thread, so we are doing only one hop per batch
+    iterator = (
+        batch.to_pylist()
+        for batch in read_dataset_batches_sync(path=path, batch_size=batch_size)
+    )
+    async for records in _iterate_in_thread(iterator):
+        for record in records:
+            yield record
+
+
+async def read_dataset_table(path: str) -> pyarrow.Table:
+    import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+    return await asyncio.to_thread(pq.read_table, path)
+
+
+def read_dataset_batches_sync(path: str, batch_size: int | None) -> Iterator[pyarrow.RecordBatch]:
     import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
 
     # we need use kwargs method to preserve original default value
@@ -32,5 +59,9 @@ def read_dataset_records_sync(path: str, batch_size: int | None) -> Iterator[Rec
     if batch_size is not None:
         kwargs['batch_size'] = batch_size
     with pq.ParquetFile(path) as reader:
-        for batch in reader.iter_batches(**kwargs):  # type: ignore[arg-type]
-            yield from batch.to_pylist()
+        yield from reader.iter_batches(**kwargs)  # type: ignore[arg-type]
+
+
+def read_dataset_records_sync(path: str, batch_size: int | None) -> Iterator[RecordType]:
+    for batch in read_dataset_batches_sync(path=path, batch_size=batch_size):
+        yield from batch.to_pylist()
@@ -34,7 +34,7 @@ def run_sync_impl(coro: Awaitable[T], sdk: BaseSDK) -> T:
     name = threading.current_thread().name
     key = (name, sdk)
     if key not in _runner_map:
-        _runner_map[key] = _TaskRunner(sdk._get_event_loop())  # pylint: disable=protected-access
+        _runner_map[key] = _TaskRunner(sdk._get_thread_event_loop())  # pylint: disable=protected-access
 
     result: T = _runner_map[key].run(coro)
     return result
@@ -68,7 +68,7 @@ def run_sync_generator_impl(aiter_: AsyncIterator[T], sdk: BaseSDK) -> Iterator[
     name = threading.current_thread().name
     key = (name, sdk)
     if key not in _runner_map:
-        _runner_map[key] = _TaskRunner(sdk._get_event_loop())  # pylint: disable=protected-access
+        _runner_map[key] = _TaskRunner(sdk._get_thread_event_loop())  # pylint: disable=protected-access
 
     def run_from(runner: Callable[[Awaitable[T]], Any]) -> Iterator[T]:
         while True:
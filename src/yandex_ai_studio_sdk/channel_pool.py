@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from ._channel_pool import ChannelPoolConfig
+
+__all__ = ['ChannelPoolConfig']
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from ._json_codec import JsonCodec
+
+__all__ = ['JsonCodec']
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from ._polling import EtaPolling, ExponentialPolling, FixedPolling, PollingStrategy
+
+__all__ = ['PollingStrategy', 'FixedPolling', 'ExponentialPolling', 'EtaPolling']
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from ._response_cache import MemoryResponseCache, ResponseCache, ResponseCacheStats, SqliteResponseCache
+
+__all__ = ['MemoryResponseCache', 'ResponseCache', 'ResponseCacheStats', 'SqliteResponseCache']
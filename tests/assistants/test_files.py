@@ -1,9 +1,18 @@
+# pylint: disable=no-name-in-module
 from __future__ import annotations
 
+import httpx
 import pytest
+from pytest_httpx import HTTPXMock
+from yandex.cloud.ai.common.common_pb2 import ExpirationConfig as ExpirationConfigProto
+from yandex.cloud.ai.files.v1.file_pb2 import File as ProtoFile
+from yandex_ai_studio_sdk._files.file import AsyncFile
+from yandex_ai_studio_sdk._types.resource import safe_on_delete
 
 pytestmark = pytest.mark.asyncio
 
+FILE_URL = 'https://example.com/file'
+
 
 @pytest.fixture(name='test_file_path')
 def fixture_test_file_path(tmp_path):
@@ -12,6 +21,23 @@ def fixture_test_file_path(tmp_path):
     yield path
 
 
+@pytest.fixture(name='mock_file')
+def fixture_mock_file(async_sdk, mocker):
+    @safe_on_delete
+    async def get_url(self, *, timeout=60):  # pylint: disable=unused-argument
+        return FILE_URL
+
+    mocker.patch.object(AsyncFile, '_get_url', get_url)
+
+    return AsyncFile._from_proto(
+        sdk=async_sdk,
+        proto=ProtoFile(
+            id='file-id',
+            expiration_config=ExpirationConfigProto(expiration_policy=ExpirationConfigProto.STATIC),
+        ),
+    )
+
+
 @pytest.mark.allow_grpc
 @pytest.mark.vcr
 async def test_file(async_sdk, test_file_path):
@@ -120,3 +146,44 @@ async def test_file_expiration(async_sdk, test_file_path):
 
     await file.delete()
     await file2.delete()
+
+
+async def test_file_download_as_bytes(mock_file, httpx_mock: HTTPXMock):
+    content = bytes(range(256)) * 100
+    httpx_mock.add_response(url=FILE_URL, content=content)
+
+    assert await mock_file.download_as_bytes(chunk_size=1000) == content
+
+
+async def test_file_aiter_bytes(mock_file, httpx_mock: HTTPXMock):
+    content = b'x' * 2500
+    httpx_mock.add_response(url=FILE_URL, content=content)
+
+    chunks = [chunk async for chunk in mock_file.aiter_bytes(chunk_size=1000)]
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+    assert b''.join(chunks) == content
+
+
+async def test_file_download_to(mock_file, httpx_mock: HTTPXMock, tmp_path):
+    httpx_mock.add_response(url=FILE_URL, content=b'test file', is_reusable=True)
+
+    path = tmp_path / 'downloaded'
+    assert await mock_file.download_to(path) == path
+    assert path.read_bytes() == b'test file'
+
+    with pytest.raises(ValueError, match='already exists'):
+        await mock_file.download_to(path)
+
+    path.write_bytes(b'old content which is longer')
+    await mock_file.download_to(str(path), exist_ok=True)
+    assert path.read_bytes() == b'test file'
+
+
+async def test_file_download_to_failure(mock_file, httpx_mock: HTTPXMock, tmp_path):
+    httpx_mock.add_response(url=FILE_URL, status_code=404)
+
+    path = tmp_path / 'downloaded'
+    with pytest.raises(httpx.HTTPStatusError):
+        await mock_file.download_to(path)
+
+    assert not path.exists()
@@ -1,9 +1,11 @@
 # pylint: disable=protected-access
 from __future__ import annotations
 
+import asyncio
 import time
 import warnings
 
+import grpc
 import pytest
 from yandex.cloud.iam.v1.iam_token_service_pb2 import CreateIamTokenResponse  # pylint: disable=no-name-in-module
 from yandex.cloud.iam.v1.iam_token_service_pb2_grpc import (
@@ -24,16 +26,20 @@ def fixture_auth(oauth_token):
     return OAuthTokenAuth(oauth_token)
 
 
-@pytest.fixture
-def servicers(oauth_token):
+@pytest.fixture(name='servicers')
+def fixture_servicers(oauth_token):
     class Servicer(IamTokenServiceServicer):
         def __init__(self):
             self.i = 0
+            self.fail = False
 
         def Create(self, request, context):
             assert request.yandex_passport_oauth_token == oauth_token
+            if self.fail:
+                context.abort(grpc.StatusCode.INTERNAL, 'failed')
 
             response = CreateIamTokenResponse(iam_token=f"<iam-token-{self.i}>")
+            response.expires_at.FromSeconds(int(time.time()) + 12 * 60 * 60)
             self.i += 1
             return response
 
@@ -49,7 +55,7 @@ async def test_auth(async_sdk, auth, get_auth_meta):
 
 
 @pytest.mark.filterwarnings(r"ignore:.*OAuth:UserWarning")
-async def test_reissue(async_sdk, auth, monkeypatch):
+async def test_reissue(async_sdk, auth, get_auth_meta, monkeypatch):
     assert auth._token is None
     assert auth._issue_time is None
 
@@ -68,11 +74,81 @@ async def test_reissue(async_sdk, auth, monkeypatch):
     # now we will trigger reissue of a token
     monkeypatch.setattr(auth, "_token_refresh_period", 1)
 
-    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    # token is refreshed in background, so current token is still used
+    metadata = await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    assert get_auth_meta(metadata) == "Bearer <iam-token-0>"
+    await auth._refresh_task
+
     assert auth._token == "<iam-token-1>"
     assert auth._issue_time > issue_time
 
 
+@pytest.mark.filterwarnings(r"ignore:.*OAuth:UserWarning")
+async def test_expiration(async_sdk, auth, get_auth_meta, monkeypatch):
+    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    assert auth._expires_at == pytest.approx(time.time() + 12 * 60 * 60, abs=10)
+
+    # token which is close to expiration is refreshed in background
+    monkeypatch.setattr(auth, "_expires_at", time.time() + 60)
+    metadata = await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    assert get_auth_meta(metadata) == "Bearer <iam-token-0>"
+    await auth._refresh_task
+    assert auth._token == "<iam-token-1>"
+
+    # expired token is refreshed right away
+    monkeypatch.setattr(auth, "_expires_at", time.time() - 1)
+    metadata = await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    assert get_auth_meta(metadata) == "Bearer <iam-token-2>"
+
+
+@pytest.mark.filterwarnings(r"ignore:.*OAuth:UserWarning")
+async def test_refresh_backoff(async_sdk, auth, get_auth_meta, servicers, monkeypatch):
+    (servicer, _), = servicers
+    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+
+    servicer.fail = True
+    monkeypatch.setattr(auth, "_token_refresh_period", 0)
+
+    metadata = await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    assert get_auth_meta(metadata) == "Bearer <iam-token-0>"
+    task = auth._refresh_task
+    await task
+    assert auth._refresh_failures == 1
+    assert auth._next_refresh_attempt > time.time()
+
+    # no new attempts until backoff is over
+    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    assert auth._refresh_task is task
+
+    servicer.fail = False
+    monkeypatch.setattr(auth, "_next_refresh_attempt", 0)
+    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    await auth._refresh_task
+    assert auth._refresh_failures == 0
+    assert auth._token == "<iam-token-1>"
+
+
+@pytest.mark.filterwarnings(r"ignore:.*OAuth:UserWarning")
+async def test_close_cancels_refresh(async_sdk, auth, monkeypatch):
+    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+
+    async def hanging_fetch_token(*_args, **_kwargs):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(auth, "_fetch_token", hanging_fetch_token)
+    monkeypatch.setattr(auth, "_token_refresh_period", 0)
+
+    await async_sdk._client._get_metadata(auth_required=True, timeout=1)
+    task = auth._refresh_task
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    await async_sdk._close()
+    assert task.cancelled()
+    assert auth._refresh_task is None
+    assert auth._token == "<iam-token-0>"
+
+
 async def test_applicable_from_env(oauth_token, monkeypatch):
     monkeypatch.delenv(OAuthTokenAuth.env_var, raising=False)
     with warnings.catch_warnings():
@@ -8,7 +8,7 @@ from typing import cast
 import httpx._client
 import pytest
 from yandex_ai_studio_sdk import AsyncAIStudio
-from yandex_ai_studio_sdk._chat.completions.result import AlternativeStatus, FinishReason
+from yandex_ai_studio_sdk._chat.completions.result import AlternativeStatus, ChatModelDelta, FinishReason
 from yandex_ai_studio_sdk._types.misc import UNDEFINED
 from yandex_ai_studio_sdk._types.tools.function import FunctionDictType
 from yandex_ai_studio_sdk._types.tools.tool_choice import ToolChoiceType
@@ -99,6 +99,77 @@ async def test_run_stream(model):
     assert ''.join(r[0].delta for r in results) == result_text
 
 
+@pytest.mark.default_cassette('test_run_stream.yaml')
+@pytest.mark.vcr(allow_playback_repeats=True)
+async def test_run_stream_delta(model):
+    message = 'hello! could you please tell me about platypuses?'
+
+    deltas = [delta async for delta in model.run_stream(message, mode='delta')]
+    results = [result async for result in model.run_stream(message)]
+
+    assert all(isinstance(delta, ChatModelDelta) for delta in deltas)
+    assert all(delta.role == 'assistant' for delta in deltas)
+    assert all(delta.status == AlternativeStatus.PARTIAL for delta in deltas[:-2])
+    assert deltas[-2].finish_reason == FinishReason.STOP
+    assert deltas[-1].finish_reason == FinishReason.USAGE
+    assert deltas[-1].usage == results[-1].usage
+    assert [delta.text for delta in deltas] == [result[0].delta for result in results]
+
+    result = model.join_deltas(deltas)
+    assert result.text == results[-1].text
+    assert result.status == AlternativeStatus.FINAL
+    assert result.usage == results[-1].usage
+    assert result.id == results[-1].id
+
+    with pytest.raises(ValueError):
+        model.join_deltas([])
+
+    # mode is checked at the call, not at the first iteration
+    with pytest.raises(ValueError, match='unknown stream mode'):
+        model.run_stream(message, mode='foo')  # type: ignore[call-overload]
+
+
+async def test_run_stream_wrong_mode_sync(sdk):
+    model = sdk.chat.completions('yandexgpt')
+    with pytest.raises(ValueError, match='unknown stream mode'):
+        model.run_stream('hello', mode='foo')  # type: ignore[call-overload]
+
+
+@pytest.mark.default_cassette('test_stream_function_call[yandexgpt].yaml')
+@pytest.mark.vcr(allow_playback_repeats=True)
+async def test_run_stream_delta_function_call(async_sdk: AsyncAIStudio) -> None:
+    calculator_tool = async_sdk.tools.function(
+        name="calculator",
+        description=(
+            "A simple calculator that performs basic arithmetic and @ operations; "
+            "call it on ANY arithmetic questions"
+        ),
+        parameters={
+            "type": "object",
+            "properties": {
+                "expression": {
+                    "type": "string",
+                    "description": "The mathematical expression to evaluate (e.g., '2 + 3 * 4').",
+                }
+            },
+            "required": ["expression"],
+        },
+        strict=True,
+    )
+    model = async_sdk.chat.completions('yandexgpt', model_version='rc').configure(tools=calculator_tool)
+
+    deltas = [delta async for delta in model.run_stream("How much it would be 7@8?", mode='delta')]
+    assert any(delta.tool_calls_delta for delta in deltas)
+
+    result = model.join_deltas(deltas)
+    assert result.status == AlternativeStatus.TOOL_CALLS
+    assert result.tool_calls
+    tool_call = result.tool_calls[0]
+    assert tool_call.function
+    assert tool_call.function.name == 'calculator'
+    assert tool_call.function.arguments == {"expression": '7@8'}
+
+
 async def test_chat(model):
     messages = [
         {'role': 'system', 'text': 'Your name is Arkadiy'},
@@ -160,6 +231,15 @@ async def test_configure(model):
     model = model.configure(reasoning_mode='LOW')
     assert make_request(messages="foo", stream=None)['reasoning_effort'] == 'low'
 
+    # config part of the request is built only once per configured model
+    model = model.configure(extra_query={'top_k': 3})
+    prefix = model._request_prefix
+    first = make_request(messages="foo", stream=False)
+    second = make_request(messages="bar", stream=True)
+    assert first['top_k'] == second['top_k'] == 3
+    assert first['messages'] != second['messages']
+    assert model._request_prefix is prefix
+
 
 async def test_structured_output_simple_json(async_sdk):
     model = async_sdk.chat.completions('yandexgpt')
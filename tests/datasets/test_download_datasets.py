@@ -11,6 +11,7 @@ import pytest
 from pytest_httpx import HTTPXMock
 from yandex.cloud.ai.dataset.v1.dataset_pb2 import DatasetInfo
 from yandex_ai_studio_sdk._datasets.dataset import AsyncDataset
+from yandex_ai_studio_sdk._utils.download import DownloadProgress
 
 
 @pytest.fixture
@@ -232,3 +233,85 @@ async def test_download_fd_num(mock_dataset, httpx_mock: HTTPXMock, mocker, tmp_
     assert paths[0].read_bytes() == f"test file{0} content".encode()
 
     assert max_open <= max_fd_num
+
+
+class BrokenStream(httpx.AsyncByteStream):
+    def __init__(self, content: bytes):
+        self._content = content
+
+    async def __aiter__(self):
+        yield self._content
+        raise httpx.ReadError("connection reset")
+
+
+@pytest.mark.asyncio
+async def test_download_chunked_with_progress(mock_dataset, httpx_mock: HTTPXMock, mocker, tmp_path: Path) -> None:
+    mocker.patch.object(
+        mock_dataset, "_get_download_urls",
+        return_value=[("file1.txt", "https://example.com/file1.txt")]
+    )
+    httpx_mock.add_response(
+        url="https://example.com/file1.txt",
+        content=b"0123456789"
+    )
+
+    progress: list[DownloadProgress] = []
+    paths = await mock_dataset.download(
+        timeout=30,
+        download_path=tmp_path,
+        chunk_size=4,
+        progress_callback=progress.append,
+    )
+
+    assert paths[0].read_bytes() == b"0123456789"
+    assert [p.downloaded_bytes for p in progress] == [4, 8, 10]
+    assert all(p.key == "file1.txt" and p.total_bytes == 10 for p in progress)
+    assert progress[-1].throughput >= 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("partial", [True, False])
+async def test_download_resume(
+    mock_dataset, httpx_mock: HTTPXMock, mocker, tmp_path: Path, partial: bool
+) -> None:
+    mocker.patch.object(
+        mock_dataset, "_get_download_urls",
+        return_value=[("file1.txt", "https://example.com/file1.txt")]
+    )
+    httpx_mock.add_response(
+        url="https://example.com/file1.txt",
+        stream=BrokenStream(b"01234"),
+    )
+    # NB: with chunk_size=3 only b"012" reaches the file before the failure
+    if partial:
+        httpx_mock.add_response(
+            url="https://example.com/file1.txt",
+            match_headers={"Range": "bytes=3-"},
+            status_code=206,
+            content=b"3456789",
+        )
+    else:
+        # server is ignoring Range header and sends the whole file again
+        httpx_mock.add_response(
+            url="https://example.com/file1.txt",
+            match_headers={"Range": "bytes=3-"},
+            content=b"0123456789",
+        )
+
+    paths = await mock_dataset.download(timeout=30, download_path=tmp_path, chunk_size=3)
+
+    assert paths[0].read_bytes() == b"0123456789"
+
+
+@pytest.mark.asyncio
+async def test_download_resume_attempts_exceeded(mock_dataset, httpx_mock: HTTPXMock, mocker, tmp_path: Path) -> None:
+    mocker.patch.object(
+        mock_dataset, "_get_download_urls",
+        return_value=[("file1.txt", "https://example.com/file1.txt")]
+    )
+    httpx_mock.add_exception(httpx.ReadError("connection reset"), is_reusable=True)
+
+    with pytest.raises(httpx.ReadError):
+        await mock_dataset.download(timeout=30, download_path=tmp_path, max_resume_attempts=2)
+
+    assert len(httpx_mock.get_requests()) == 3
@@ -2,7 +2,9 @@
 # pylint: disable=redefined-outer-name
 from __future__ import annotations
 
+import asyncio
 import io
+import tempfile
 import uuid
 from pathlib import Path
 
@@ -99,3 +101,150 @@ async def test_reading_order(mock_dataset, httpx_mock: HTTPXMock, mocker, tmp_pa
                     {'name': '3.parquet'},
                     {'name': '4.parquet'},
                     {'name': 'test.parquet'}]
+
+
+@pytest.fixture
+def multi_file_dataset(mock_dataset, httpx_mock: HTTPXMock, mocker) -> AsyncDataset:
+    mocker.patch.object(
+        mock_dataset, "_get_download_urls",
+        return_value=[
+            (f"{i}.parquet", f"https://example.com/{i}.parquet") for i in (2, 1)
+        ]
+    )
+    for i in (1, 2):
+        table = pa.table({"id": [i * 10 + j for j in range(5)]})
+        sink = io.BytesIO()
+        pq.write_table(table, sink)
+        httpx_mock.add_response(
+            url=f"https://example.com/{i}.parquet",
+            content=sink.getvalue()
+        )
+
+    return mock_dataset
+
+
+async def test_read_batched_records(multi_file_dataset, mocker) -> None:
+    to_thread = mocker.spy(asyncio, 'to_thread')
+
+    data = [line async for line in multi_file_dataset.read(batch_size=2)]
+
+    assert data == [{'id': i * 10 + j} for i in (1, 2) for j in range(5)]
+    # one thread hop per batch (3 batches per file) plus one final hop per file
+    assert to_thread.call_count == 8
+
+
+async def test_read_batches(multi_file_dataset) -> None:
+    batches = [batch async for batch in multi_file_dataset.read_batches(batch_size=2)]
+
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    assert [batch.num_rows for batch in batches] == [2, 2, 1, 2, 2, 1]
+    assert pa.Table.from_batches(batches).column('id').to_pylist() == [10, 11, 12, 13, 14, 20, 21, 22, 23, 24]
+
+
+async def test_read_arrow(multi_file_dataset) -> None:
+    table = await multi_file_dataset.read_arrow()
+
+    assert isinstance(table, pa.Table)
+    assert table.column('id').to_pylist() == [10, 11, 12, 13, 14, 20, 21, 22, 23, 24]
+
+
+async def test_read_arrow_empty(mock_dataset, mocker) -> None:
+    mocker.patch.object(mock_dataset, "_get_download_urls", return_value=[])
+
+    table = await mock_dataset.read_arrow()
+
+    assert table.num_rows == 0
+
+
+@pytest.mark.require_env('pandas')
+async def test_read_pandas(multi_file_dataset) -> None:
+    df = await multi_file_dataset.read_pandas()
+
+    assert type(df).__name__ == 'DataFrame'
+    assert df['id'].tolist() == [10, 11, 12, 13, 14, 20, 21, 22, 23, 24]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+async def test_read_prefetch(mock_dataset, mocker, monkeypatch, tmp_path: Path, prefetch: int) -> None:
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    mocker.patch.object(
+        mock_dataset, "_get_download_urls",
+        return_value=[(f"{i}.parquet", f"https://example.com/{i}.parquet") for i in range(5)]
+    )
+
+    downloading = 0
+    max_downloading = 0
+
+    async def fake_download(*, path: Path, key: str, **_) -> None:
+        nonlocal downloading, max_downloading
+        downloading += 1
+        max_downloading = max(max_downloading, downloading)
+        await asyncio.sleep(0.01)
+        path.write_bytes(make_parquet_bytes(key))
+        downloading -= 1
+
+    mocker.patch.object(mock_dataset, "_BaseDataset__download_file", fake_download)
+
+    data = [line async for line in mock_dataset.read(prefetch=prefetch)]
+
+    assert data == [{'name': f'{i}.parquet'} for i in range(5)]
+    assert max_downloading == prefetch + 1
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+async def test_read_prefetch_window(mock_dataset, mocker, monkeypatch, tmp_path: Path, prefetch: int) -> None:
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    mocker.patch.object(
+        mock_dataset, "_get_download_urls",
+        return_value=[(f"{i}.parquet", f"https://example.com/{i}.parquet") for i in range(5)]
+    )
+
+    downloading = 0
+    max_files = 0
+
+    def count_files() -> None:
+        nonlocal max_files
+        max_files = max(max_files, len(list(tmp_path.iterdir())))
+
+    async def fake_download(*, path: Path, key: str, **_) -> None:
+        nonlocal downloading
+        downloading += 1
+        count_files()
+        await asyncio.sleep(0.01)
+        path.write_bytes(make_parquet_bytes(key))
+        downloading -= 1
+
+    mocker.patch.object(mock_dataset, "_BaseDataset__download_file", fake_download)
+
+    async for _ in mock_dataset.read(prefetch=prefetch):
+        count_files()
+        if prefetch == 0:
+            # no download is overlapping with reading of the current file
+            assert downloading == 0
+        await asyncio.sleep(0.02)
+
+    assert max_files == prefetch + 1
+    assert not list(tmp_path.iterdir())
+
+
+async def test_read_prefetch_early_exit(mock_dataset, mocker, monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    mocker.patch.object(
+        mock_dataset, "_get_download_urls",
+        return_value=[(f"{i}.parquet", f"https://example.com/{i}.parquet") for i in range(5)]
+    )
+
+    async def fake_download(*, path: Path, key: str, **_) -> None:
+        await asyncio.sleep(0.01)
+        path.write_bytes(make_parquet_bytes(key))
+
+    mocker.patch.object(mock_dataset, "_BaseDataset__download_file", fake_download)
+
+    iterator = mock_dataset.read(prefetch=3)
+    async for record in iterator:
+        assert record == {'name': '0.parquet'}
+        break
+    await iterator.aclose()
+
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,356 @@
+# pylint: disable=redefined-outer-name,protected-access
+from __future__ import annotations
+
+import datetime
+import decimal
+import hashlib
+import json
+import tempfile
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from yandex_ai_studio_sdk._datasets.manifest import UploadManifest
+from yandex_ai_studio_sdk._datasets.sources import iter_source_bytes
+from yandex_ai_studio_sdk._datasets.uploaders import (
+    MIN_CHUNK_SIZE, UPLOAD_BLOCK_SIZE, ETagMismatchError, MultipartUploader, SingleUploader, SourceUploader,
+    create_uploader
+)
+from yandex_ai_studio_sdk.retry import NoRetryPolicy, RetryPolicy
+
+URL = 'https://storage.example.com/upload'
+
+
+@pytest.fixture
+def dataset(mocker):
+    dataset = mocker.MagicMock()
+    dataset._client.httpx.side_effect = lambda **_: httpx.AsyncClient()
+    dataset._client._retry_policy = RetryPolicy(max_attempts=3, initial_backoff=0, jitter=0)
+    dataset._get_upload_url = mocker.AsyncMock(return_value=URL)
+    return dataset
+
+
+@pytest.fixture
+def data_file(tmp_path: Path) -> Path:
+    path = tmp_path / 'data.jsonl'
+    path.write_bytes(bytes(range(256)) * (3 * UPLOAD_BLOCK_SIZE // 256 + 7))
+    return path
+
+
+def md5_etag(data: bytes) -> str:
+    return f'"{hashlib.md5(data).hexdigest()}"'
+
+
+def get_single_request(httpx_mock: HTTPXMock) -> httpx.Request:
+    request = httpx_mock.get_request()
+    assert request is not None
+    return request
+
+
+@pytest.mark.asyncio
+async def test_single_upload_streaming(dataset, data_file: Path, httpx_mock: HTTPXMock) -> None:
+    data = data_file.read_bytes()
+    httpx_mock.add_response(url=URL, method='PUT', headers={'ETag': md5_etag(data)})
+
+    uploader = SingleUploader(chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    await uploader.upload(data_file, dataset=dataset, timeout=10, upload_timeout=10)
+
+    request = get_single_request(httpx_mock)
+    assert request.headers['Content-Length'] == str(len(data))
+    assert 'Transfer-Encoding' not in request.headers
+    assert request.content == data
+
+
+@pytest.mark.asyncio
+async def test_single_upload_retries(dataset, data_file: Path, httpx_mock: HTTPXMock) -> None:
+    data = data_file.read_bytes()
+    httpx_mock.add_response(url=URL, method='PUT', status_code=503)
+    httpx_mock.add_exception(httpx.WriteError('connection reset'), url=URL)
+    httpx_mock.add_response(url=URL, method='PUT', headers={'ETag': md5_etag(data)})
+
+    uploader = SingleUploader(chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    await uploader.upload(data_file, dataset=dataset, timeout=10, upload_timeout=10)
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 3
+    assert requests[-1].content == data
+
+
+
+@pytest.mark.asyncio
+async def test_single_upload_infinite_retries(dataset, data_file: Path, httpx_mock: HTTPXMock) -> None:
+    dataset._client._retry_policy = RetryPolicy(max_attempts=-1, initial_backoff=0, jitter=0)
+    data = data_file.read_bytes()
+    for _ in range(5):
+        httpx_mock.add_response(url=URL, method='PUT', status_code=503)
+    httpx_mock.add_response(url=URL, method='PUT', headers={'ETag': md5_etag(data)})
+
+    uploader = SingleUploader(chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    await uploader.upload(data_file, dataset=dataset, timeout=10, upload_timeout=10)
+
+    assert len(httpx_mock.get_requests()) == 6
+
+@pytest.mark.asyncio
+async def test_single_upload_no_retry_on_client_error(dataset, data_file: Path, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=URL, method='PUT', status_code=403)
+
+    uploader = SingleUploader(chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    with pytest.raises(httpx.HTTPStatusError):
+        await uploader.upload(data_file, dataset=dataset, timeout=10, upload_timeout=10)
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_single_upload_etag_mismatch(dataset, data_file: Path, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(url=URL, method='PUT', headers={'ETag': md5_etag(b'other')}, is_reusable=True)
+
+    uploader = SingleUploader(chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    with pytest.raises(ETagMismatchError):
+        await uploader.upload(data_file, dataset=dataset, timeout=10, upload_timeout=10)
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_single_upload_no_retry_policy(dataset, data_file: Path, httpx_mock: HTTPXMock) -> None:
+    dataset._client._retry_policy = NoRetryPolicy()
+    httpx_mock.add_response(url=URL, method='PUT', status_code=503)
+
+    uploader = SingleUploader(chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    with pytest.raises(httpx.HTTPStatusError):
+        await uploader.upload(data_file, dataset=dataset, timeout=10, upload_timeout=10)
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload(dataset, tmp_path: Path, httpx_mock: HTTPXMock, mocker) -> None:
+    path = tmp_path / 'data.jsonl'
+    data = b'x' * (2 * MIN_CHUNK_SIZE + 100)
+    path.write_bytes(data)
+
+    urls = [f'{URL}/{i}' for i in range(2)]
+    dataset._start_multipart_upload = mocker.AsyncMock(return_value=urls)
+    dataset._finish_multipart_upload = mocker.AsyncMock()
+
+    real_chunk_size = MIN_CHUNK_SIZE + 50
+    parts = [data[:real_chunk_size], data[real_chunk_size:]]
+    for url, part in zip(urls, parts):
+        # NB: ETags of multipart parts are checked too, because they are md5 of parts
+        httpx_mock.add_response(url=url, method='PUT', headers={'ETag': md5_etag(part)})
+
+    uploader = MultipartUploader(chunk_size=MIN_CHUNK_SIZE, parallelism=2)
+    await uploader.upload(path, dataset=dataset, timeout=10, upload_timeout=10)
+
+    requests = sorted(httpx_mock.get_requests(), key=lambda r: str(r.url))
+    assert [r.content for r in requests] == parts
+    assert [r.headers['Content-Length'] for r in requests] == [str(len(p)) for p in parts]
+
+    dataset._finish_multipart_upload.assert_awaited_once_with(
+        [(1, md5_etag(parts[0])), (2, md5_etag(parts[1]))],
+        timeout=10,
+    )
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_resume(dataset, tmp_path: Path, httpx_mock: HTTPXMock, mocker) -> None:
+    path = tmp_path / 'data.jsonl'
+    data = b'x' * (3 * MIN_CHUNK_SIZE)
+    path.write_bytes(data)
+    parts = [data[i * MIN_CHUNK_SIZE:(i + 1) * MIN_CHUNK_SIZE] for i in range(3)]
+
+    urls = [f'{URL}/{i}' for i in range(3)]
+    dataset.id = 'dataset-id'
+    dataset._start_multipart_upload = mocker.AsyncMock(return_value=tuple(urls))
+    dataset._finish_multipart_upload = mocker.AsyncMock()
+
+    manifest_path = tmp_path / 'manifest.json'
+    manifest = UploadManifest(
+        manifest_path=manifest_path,
+        dataset_id=dataset.id,
+        source_path=str(path.resolve()),
+        source_size=len(data),
+        chunk_size=MIN_CHUNK_SIZE,
+    )
+
+    httpx_mock.add_response(url=urls[0], method='PUT', headers={'ETag': md5_etag(parts[0])})
+    httpx_mock.add_response(url=urls[1], method='PUT', status_code=403)
+    httpx_mock.add_response(url=urls[2], method='PUT', headers={'ETag': md5_etag(parts[2])})
+
+    uploader = MultipartUploader(chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    with pytest.raises(httpx.HTTPStatusError):
+        await uploader.upload(path, dataset=dataset, timeout=10, upload_timeout=10, manifest=manifest)
+
+    dataset._finish_multipart_upload.assert_not_awaited()
+
+    # NB: state must survive the process restart
+    restored = UploadManifest.load(manifest_path)
+    assert restored is not None
+    assert restored.urls == urls
+    assert restored.etags == {1: md5_etag(parts[0]), 3: md5_etag(parts[2])}
+    restored.check_source(path)
+
+    httpx_mock.add_response(url=urls[1], method='PUT', headers={'ETag': md5_etag(parts[1])})
+
+    await uploader.upload(path, dataset=dataset, timeout=10, upload_timeout=10, manifest=restored)
+
+    assert dataset._start_multipart_upload.await_count == 1
+    assert [str(r.url) for r in httpx_mock.get_requests()] == urls + [urls[1]]
+    dataset._finish_multipart_upload.assert_awaited_once_with(
+        [(i + 1, md5_etag(part)) for i, part in enumerate(parts)],
+        timeout=10,
+    )
+
+
+def test_manifest_source_mismatch(tmp_path: Path) -> None:
+    path = tmp_path / 'data.jsonl'
+    path.write_bytes(b'data')
+
+    manifest = UploadManifest(
+        manifest_path=tmp_path / 'manifest.json',
+        dataset_id='dataset-id',
+        source_path=str(path.resolve()),
+        source_size=3,
+        chunk_size=MIN_CHUNK_SIZE,
+    )
+    with pytest.raises(ValueError, match='was created for'):
+        manifest.check_source(path)
+
+    assert UploadManifest.load(tmp_path / 'other.json') is None
+
+
+async def records(n: int):
+    for i in range(n):
+        yield {'request': f'question {i}', 'response': 'answer'}
+
+
+@pytest.mark.asyncio
+async def test_source_upload_in_memory(dataset, httpx_mock: HTTPXMock, mocker) -> None:
+    mkstemp = mocker.spy(tempfile, 'mkstemp')
+    httpx_mock.add_response(url=URL, method='PUT')
+
+    uploader = create_uploader(records(3), chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    assert isinstance(uploader, SourceUploader)
+    await uploader.upload(records(3), dataset=dataset, timeout=10, upload_timeout=10)
+
+    content = get_single_request(httpx_mock).content
+    assert content.decode('utf-8').splitlines() == [
+        json.dumps({'request': f'question {i}', 'response': 'answer'}) for i in range(3)
+    ]
+    dataset._get_upload_url.assert_awaited_once_with(size=len(content), timeout=10)
+    mkstemp.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_source_upload_spill(dataset, httpx_mock: HTTPXMock, mocker) -> None:
+    mkstemp = mocker.spy(tempfile, 'mkstemp')
+    dataset._start_multipart_upload = mocker.AsyncMock(return_value=(f'{URL}/0', f'{URL}/1'))
+    dataset._finish_multipart_upload = mocker.AsyncMock()
+    httpx_mock.add_response(url=f'{URL}/0', method='PUT', headers={'ETag': 'etag0'})
+    httpx_mock.add_response(url=f'{URL}/1', method='PUT', headers={'ETag': 'etag1'})
+
+    data = [{'text': 'x' * 1000, 'i': i} for i in range(2 * MIN_CHUNK_SIZE // 1000)]
+    uploader = SourceUploader(chunk_size=MIN_CHUNK_SIZE, parallelism=2, upload_format='jsonlines')
+    await uploader.upload(data, dataset=dataset, timeout=10, upload_timeout=10)
+
+    content = b''.join(r.content for r in sorted(httpx_mock.get_requests(), key=lambda r: str(r.url)))
+    assert content == b''.join(json.dumps(r).encode() + b'\n' for r in data)
+    dataset._finish_multipart_upload.assert_awaited_once_with([(1, 'etag0'), (2, 'etag1')], timeout=10)
+
+    mkstemp.assert_called_once()
+    assert not Path(mkstemp.spy_return[1]).exists()
+
+
+@pytest.mark.require_env('pyarrow')
+@pytest.mark.asyncio
+async def test_source_upload_arrow(dataset, httpx_mock: HTTPXMock) -> None:
+    import pyarrow  # pylint: disable=import-outside-toplevel
+
+    httpx_mock.add_response(url=URL, method='PUT')
+    table = pyarrow.table({'request': ['a', 'b'], 'response': ['c', 'd']})
+
+    uploader = create_uploader(table, chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    await uploader.upload(table, dataset=dataset, timeout=10, upload_timeout=10)
+
+    assert get_single_request(httpx_mock).content == (
+        b'{"request": "a", "response": "c"}\n'
+        b'{"request": "b", "response": "d"}\n'
+    )
+
+
+
+@pytest.mark.require_env('pyarrow')
+@pytest.mark.asyncio
+async def test_source_upload_arrow_types(dataset, httpx_mock: HTTPXMock) -> None:
+    import pyarrow  # pylint: disable=import-outside-toplevel
+
+    httpx_mock.add_response(url=URL, method='PUT')
+    table = pyarrow.table({
+        'ts': pyarrow.array([datetime.datetime(2024, 1, 2, 3, 4, 5, 123000)], pyarrow.timestamp('ms')),
+        'date': pyarrow.array([datetime.date(2024, 1, 2)]),
+        'duration': pyarrow.array([datetime.timedelta(days=1, seconds=90)]),
+        'price': pyarrow.array([decimal.Decimal('1.25')]),
+        'raw': pyarrow.array([b'abc']),
+    })
+
+    uploader = create_uploader(table, chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    await uploader.upload(table, dataset=dataset, timeout=10, upload_timeout=10)
+
+    assert json.loads(get_single_request(httpx_mock).content) == {
+        'ts': '2024-01-02T03:04:05.123000',
+        'date': '2024-01-02',
+        'duration': 'P1DT0H1M30S',
+        'price': 1.25,
+        'raw': 'abc',
+    }
+
+    with pytest.raises(TypeError, match='not JSON serializable'):
+        await iter_source_bytes([{'a': object()}], 'jsonlines').__anext__()
+
+    table = pyarrow.table({'text': ['a'], 'raw': pyarrow.array([b'\xff\xfe'])})
+    with pytest.raises(TypeError, match="column 'raw' is not valid UTF-8"):
+        await iter_source_bytes(table, 'jsonlines').__anext__()
+
+
+def test_source_wrong_format() -> None:
+    with pytest.raises(ValueError, match='not supported for in-memory data'):
+        iter_source_bytes([{'a': 1}], 'parquet')
+
+    with pytest.raises(TypeError, match='unsupported type'):
+        create_uploader({'a': 1}, chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+
+
+def test_draft_from_data(async_sdk) -> None:
+    data = [{'request': 'a', 'response': 'b'}]
+    draft = async_sdk.datasets.completions.draft_from_data(data)
+
+    assert draft.source is data
+    assert draft.path is None
+    assert draft.upload_format == 'jsonlines'
+    draft.validate()
+
+    with pytest.raises(TypeError, match='only one of path or source'):
+        draft.configure(path=__file__).validate()
+
+    with pytest.raises(TypeError, match='unsupported type of data'):
+        async_sdk.datasets.draft_from_data('some/path.jsonl')
+
+
+@pytest.mark.require_env('pandas')
+@pytest.mark.asyncio
+async def test_source_upload_pandas(dataset, httpx_mock: HTTPXMock) -> None:
+    import pandas  # pylint: disable=import-outside-toplevel,import-error
+
+    httpx_mock.add_response(url=URL, method='PUT')
+    df = pandas.DataFrame({'request': ['a', 'б'], 'response': ['c', 'd']})
+
+    uploader = create_uploader(df, chunk_size=MIN_CHUNK_SIZE, parallelism=1)
+    await uploader.upload(df, dataset=dataset, timeout=10, upload_timeout=10)
+
+    lines = get_single_request(httpx_mock).content.decode('utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {'request': 'a', 'response': 'c'},
+        {'request': 'б', 'response': 'd'},
+    ]
@@ -1,7 +1,25 @@
+# pylint: disable=no-name-in-module,protected-access
 from __future__ import annotations
 
+import asyncio
+import copy
+import dataclasses
+import pickle
+import threading
+import time
+
+import grpc
 import pytest
+from yandex.cloud.ai.foundation_models.v1.embedding.embedding_service_pb2 import TextEmbeddingResponse
+from yandex.cloud.ai.foundation_models.v1.embedding.embedding_service_pb2_grpc import (
+    EmbeddingsServiceServicer, add_EmbeddingsServiceServicer_to_server
+)
+from yandex_ai_studio_sdk import AsyncAIStudio
 from yandex_ai_studio_sdk._models.text_embeddings.result import TextEmbeddingsModelResult
+from yandex_ai_studio_sdk._testing.client import MockClient
+from yandex_ai_studio_sdk._types.embeddings import EmbeddingVector
+from yandex_ai_studio_sdk.channel_pool import ChannelPoolConfig
+from yandex_ai_studio_sdk.exceptions import AioRpcError
 
 
 @pytest.fixture(name='model')
@@ -42,3 +60,196 @@ def test_numpy_integration():
     assert (numpy.array(result) == numpy.array(array)).all()
 
     assert numpy.array(result).dtype == 'float64'
+
+
+@pytest.mark.require_env('numpy')
+def test_numpy_zero_copy():
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    result = TextEmbeddingsModelResult(
+        embedding=(1.0, 2.0, 3.0),
+        num_tokens=-1,
+        model_version='foo'
+    )
+    assert isinstance(result.embedding, EmbeddingVector)
+    assert result.embedding == (1.0, 2.0, 3.0)
+    assert result[1:] == (2.0, 3.0)
+    assert hash(result)
+
+    view = numpy.asarray(result)
+    assert numpy.shares_memory(view, numpy.asarray(result))
+    assert not view.flags.writeable
+    assert numpy.array(result, copy=False) is not None
+
+    copied = numpy.array(result, copy=True)
+    assert not numpy.shares_memory(copied, view)
+    copied[0] = 10
+
+    assert numpy.array(result, dtype='float32').dtype == 'float32'
+    with pytest.raises(ValueError):
+        numpy.array(result, dtype='float32', copy=False)
+
+    other = TextEmbeddingsModelResult(
+        embedding=EmbeddingVector((4.0, 5.0, 6.0), typecode='f'),
+        num_tokens=-1,
+        model_version='foo'
+    )
+    matrix = TextEmbeddingsModelResult.stack([result, other])
+    assert matrix.shape == (2, 3)
+    assert matrix.dtype == 'float64'
+    assert (matrix == numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])).all()
+
+    assert TextEmbeddingsModelResult.stack([other, result.embedding], dtype='float16').dtype == 'float16'
+
+    with pytest.raises(ValueError):
+        TextEmbeddingsModelResult.stack([result, EmbeddingVector([1.0])])
+
+
+def test_embedding_copy_and_pickle():
+    result = TextEmbeddingsModelResult(
+        embedding=EmbeddingVector((1.0, 2.0, 3.0), typecode='f'),
+        num_tokens=3,
+        model_version='foo'
+    )
+
+    for restored in (
+        pickle.loads(pickle.dumps(result)),
+        copy.deepcopy(result),
+        copy.copy(result),
+    ):
+        assert restored == result
+        assert isinstance(restored.embedding, EmbeddingVector)
+        assert restored.embedding.typecode == 'f'
+
+    deep = copy.deepcopy(result.embedding)
+    assert deep == (1.0, 2.0, 3.0)
+    assert deep._buffer is not result.embedding._buffer
+
+    assert dataclasses.asdict(result)['embedding'] == (1.0, 2.0, 3.0)
+
+    with pytest.raises(AttributeError):
+        result.embedding._buffer = None
+
+@pytest.fixture(name='batch_model')
+def fixture_batch_model(test_server, auth, folder_id):
+    class EmbeddingsServicer(EmbeddingsServiceServicer):
+        def __init__(self):
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.lock = threading.Lock()
+
+        def TextEmbedding(self, request, context):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+            # to make responses be completed in an order different from requests
+            time.sleep(0.01 * (int(request.text) % 3))
+
+            with self.lock:
+                self.in_flight -= 1
+
+            if request.text == '13':
+                context.abort(grpc.StatusCode.INTERNAL, 'unlucky')
+
+            return TextEmbeddingResponse(
+                embedding=[float(request.text), float(request.dim.value)],
+                num_tokens=1,
+                model_version='1',
+            )
+
+    servicer = EmbeddingsServicer()
+    add_EmbeddingsServiceServicer_to_server(servicer, test_server)
+    test_server.start()
+
+    sdk = AsyncAIStudio(folder_id=folder_id, auth=auth)
+    sdk._client = MockClient(port=test_server.port, auth=auth)
+    model = sdk.models.text_embeddings('doc')
+    model.servicer = servicer
+    return model
+
+
+@pytest.mark.asyncio
+async def test_run_batch(batch_model):
+    texts = (str(i) for i in range(10))
+    result = await batch_model.run_batch(texts, concurrency=4, dimensions=2)
+
+    assert len(result) == 10
+    assert not result.errors
+    assert result.num_tokens == 10
+    assert result.embeddings == tuple((float(i), 2.0) for i in range(10))
+    assert 1 < batch_model.servicer.max_in_flight <= 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.require_env('numpy')
+async def test_run_batch_numpy(batch_model):
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    result = await batch_model.run_batch(['1', '2', '3'], dimensions=2)
+
+    matrix = numpy.asarray(result)
+    assert matrix.shape == (3, 2)
+    assert (matrix[:, 0] == [1.0, 2.0, 3.0]).all()
+    assert result.stack(dtype='float32').dtype == 'float32'
+
+
+@pytest.mark.asyncio
+async def test_run_batch_partial_failure(batch_model):
+    result = await batch_model.run_batch([str(i) for i in range(20)], concurrency=3)
+
+    assert len(result) == 20
+    assert result[13] is None
+    assert set(result.errors) == {13}
+    assert result.errors[13].code() == grpc.StatusCode.INTERNAL
+    assert result[14].embedding == (14.0, 0.0)
+    assert result.num_tokens == 19
+
+    with pytest.raises(AioRpcError):
+        result.raise_for_errors()
+
+    with pytest.raises(AioRpcError):
+        _ = result.embeddings
+
+    with pytest.raises(ValueError):
+        await batch_model.run_batch(['1'], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_run_batch_channel_pool(batch_model):
+    client = batch_model._client
+    client._channel_pool_config = ChannelPoolConfig(max_channels=4, max_concurrent_streams=1)
+
+    result = await batch_model.run_batch([str(i) for i in range(12)], concurrency=4)
+    assert len(result) == 12
+
+    (pool, ) = client._channel_pools.values()
+    assert len(pool) > 1
+    assert all(pooled.in_flight == 0 for pooled in pool._channels)
+
+
+@pytest.mark.asyncio
+async def test_run_batch_worker_failure(batch_model, monkeypatch):
+    taken = []
+
+    def texts():
+        for i in range(100):
+            taken.append(i)
+            yield str(i)
+
+    make_request = batch_model._make_request
+
+    def broken_make_request(text, dimensions):
+        if text == '5':
+            raise RuntimeError('broken')
+        return make_request(text=text, dimensions=dimensions)
+
+    monkeypatch.setattr(batch_model, '_make_request', broken_make_request)
+
+    with pytest.raises(RuntimeError, match='broken'):
+        await batch_model.run_batch(texts(), concurrency=3)
+
+    # the rest of workers were cancelled right after the failure
+    assert len(taken) <= 9
+    await asyncio.sleep(0.1)
+    assert len(taken) <= 9
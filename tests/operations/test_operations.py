@@ -0,0 +1,157 @@
+# pylint: disable=protected-access,unused-argument
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from yandex_ai_studio_sdk._types.operation import (
+    AsyncOperationMixin, BaseOperation, OperationErrorInfo, OperationStatus, SyncOperationMixin
+)
+from yandex_ai_studio_sdk.exceptions import RunError
+
+
+class FakeOperationMixin:
+    def __init__(self, *, sdk, id, polls_left, error=None, stats=None):  # pylint: disable=redefined-builtin
+        self._id = id
+        self._sdk = sdk
+        self._polls_left = polls_left
+        self._error = error
+        self._stats = stats if stats is not None else {'calls': 0, 'in_flight': 0, 'max_in_flight': 0}
+
+    async def _get_status(self, *, timeout: float = 60) -> OperationStatus:
+        stats = self._stats
+        stats['calls'] += 1
+        stats['in_flight'] += 1
+        stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+        await asyncio.sleep(0.001)
+        stats['in_flight'] -= 1
+
+        self._polls_left -= 1
+        done = self._polls_left <= 0
+        error = OperationErrorInfo(code=13, message=self._error, details=None) if done and self._error else None
+        return OperationStatus(done=done, error=error, response='result' if done else None, metadata=None)
+
+    async def _get_result(self, *, timeout: float = 60) -> str:
+        if self._error:
+            raise RunError(code=13, message=self._error, details=None, operation_id=self._id)
+        return f'result-{self._id}'
+
+
+class FakeAsyncOperation(FakeOperationMixin, AsyncOperationMixin[str, OperationStatus], BaseOperation[str]):
+    pass
+
+
+class FakeOperation(FakeOperationMixin, SyncOperationMixin[str, OperationStatus], BaseOperation[str]):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_as_completed(async_sdk):
+    stats = {'calls': 0, 'in_flight': 0, 'max_in_flight': 0}
+    operations = [
+        FakeAsyncOperation(sdk=async_sdk, id=str(i), polls_left=polls_left, stats=stats)
+        for i, polls_left in enumerate([3, 1, 2] * 10)
+    ]
+
+    completed = [
+        operation async for operation in async_sdk.operations.as_completed(
+            operations,
+            poll_interval=0.001,
+            max_concurrency=4,
+        )
+    ]
+
+    assert sorted(operation.id for operation in completed) == sorted(operation.id for operation in operations)
+    assert stats['calls'] == 60
+    assert stats['max_in_flight'] == 4
+
+
+@pytest.mark.asyncio
+async def test_as_completed_order(async_sdk):
+    operations = [
+        FakeAsyncOperation(sdk=async_sdk, id=str(i), polls_left=polls_left)
+        for i, polls_left in enumerate([3, 1, 2] * 10)
+    ]
+
+    # poll interval is much longer than a status request, so the polls are going in separate waves
+    completed = [
+        operation.id async for operation in async_sdk.operations.as_completed(
+            operations,
+            poll_interval=0.05,
+            max_concurrency=30,
+        )
+    ]
+
+    # operations which require fewer polls are finishing first
+    assert set(completed[:10]) == {str(i) for i in range(1, 30, 3)}
+    assert set(completed[10:20]) == {str(i) for i in range(2, 30, 3)}
+    assert set(completed[20:]) == {str(i) for i in range(0, 30, 3)}
+
+
+@pytest.mark.asyncio
+async def test_wait_many(async_sdk):
+    operations = [
+        FakeAsyncOperation(sdk=async_sdk, id=str(i), polls_left=polls_left)
+        for i, polls_left in enumerate([3, 1, 2])
+    ]
+    results = await async_sdk.operations.wait_many(operations, poll_interval=0.001)
+    assert results == ['result-0', 'result-1', 'result-2']
+
+
+@pytest.mark.asyncio
+async def test_wait_many_errors(async_sdk):
+    def make_operations():
+        return [
+            FakeAsyncOperation(sdk=async_sdk, id='0', polls_left=2),
+            FakeAsyncOperation(sdk=async_sdk, id='1', polls_left=1, error='oops'),
+        ]
+
+    with pytest.raises(RunError, match='oops'):
+        await async_sdk.operations.wait_many(make_operations(), poll_interval=0.001)
+
+    results = await async_sdk.operations.wait_many(make_operations(), poll_interval=0.001, return_exceptions=True)
+    assert results[0] == 'result-0'
+    assert isinstance(results[1], RunError)
+
+
+@pytest.mark.asyncio
+async def test_wait_many_errors_cleanup(async_sdk):
+    operations = [
+        FakeAsyncOperation(sdk=async_sdk, id='0', polls_left=1000),
+        FakeAsyncOperation(sdk=async_sdk, id='1', polls_left=1, error='oops'),
+    ]
+
+    with pytest.raises(RunError, match='oops'):
+        await async_sdk.operations.wait_many(operations, poll_interval=0.001)
+
+    # polling of the rest of operations is stopped before the error is raised
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_wait_many_poll_timeout(async_sdk):
+    operations = [
+        FakeAsyncOperation(sdk=async_sdk, id='0', polls_left=1),
+        FakeAsyncOperation(sdk=async_sdk, id='1', polls_left=1000),
+    ]
+
+    completed = []
+    with pytest.raises(asyncio.TimeoutError):
+        async for operation in async_sdk.operations.as_completed(operations, poll_interval=0.01, poll_timeout=0.1):
+            completed.append(operation)
+
+    assert [operation.id for operation in completed] == ['0']
+
+
+def test_wait_many_sync(sdk):
+    operations = [
+        FakeOperation(sdk=sdk, id=str(i), polls_left=polls_left)
+        for i, polls_left in enumerate([2, 1])
+    ]
+
+    completed = list(sdk.operations.as_completed(operations, poll_interval=0.001))
+    assert [operation.id for operation in completed] == ['1', '0']
+    assert completed[0].get_result() == 'result-1'
+
+    operations = [FakeOperation(sdk=sdk, id='2', polls_left=2)]
+    assert sdk.operations.wait_many(operations, poll_interval=0.001) == ['result-2']
@@ -0,0 +1,109 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+from yandex_ai_studio_sdk._operations.poller import OperationPoller
+from yandex_ai_studio_sdk.exceptions import RunError
+
+from .test_operations import FakeAsyncOperation, FakeOperation
+
+
+@pytest.mark.asyncio
+async def test_add_done_callback(async_sdk):
+    stats = {'calls': 0, 'in_flight': 0, 'max_in_flight': 0}
+    operations = [
+        FakeAsyncOperation(sdk=async_sdk, id=str(i), polls_left=polls_left, stats=stats)
+        for i, polls_left in enumerate([3, 1, 2] * 10)
+    ]
+
+    finished = []
+    futures = [
+        operation.add_done_callback(lambda future: finished.append(future.result()), poll_interval=0.001)
+        for operation in operations
+    ]
+
+    # all of the operations are polled by a single background task
+    poller = async_sdk.operations._get_poller()
+    assert len(poller) == 30
+    tasks_before = len(asyncio.all_tasks())
+
+    results = await asyncio.gather(*futures)
+    assert results == [f'result-{i}' for i in range(30)]
+    assert sorted(finished) == sorted(results)
+    assert tasks_before - len(asyncio.all_tasks()) <= 10 + 1
+
+    assert stats['calls'] == 60
+    assert stats['max_in_flight'] == 10
+    assert len(poller) == 0
+
+    # background task finishes when nothing is watched
+    await asyncio.sleep(0)
+    assert poller._task.done()
+
+
+@pytest.mark.asyncio
+async def test_as_future_error(async_sdk):
+    operation = FakeAsyncOperation(sdk=async_sdk, id='0', polls_left=2, error='oops')
+    with pytest.raises(RunError, match='oops'):
+        await operation.as_future(poll_interval=0.001)
+
+
+@pytest.mark.asyncio
+async def test_as_future_same_operation(async_sdk):
+    stats = {'calls': 0, 'in_flight': 0, 'max_in_flight': 0}
+    operation = FakeAsyncOperation(sdk=async_sdk, id='0', polls_left=3, stats=stats)
+
+    first = operation.as_future(poll_interval=0.001)
+    second = operation.as_future(poll_interval=0.001)
+    assert first is not second
+
+    # cancelling of one future doesn't stop polling for another one
+    first.cancel()
+    assert await second == 'result-0'
+    assert stats['calls'] == 3
+
+
+@pytest.mark.asyncio
+async def test_as_future_cancel():
+    stats = {'calls': 0, 'in_flight': 0, 'max_in_flight': 0}
+    operation = FakeAsyncOperation(sdk=None, id='0', polls_left=1000, stats=stats)
+
+    poller = OperationPoller()
+    future = poller.watch(operation, operation._get_default_polling())
+    await asyncio.sleep(0.01)
+    assert stats['calls'] == 1
+
+    future.cancel()
+    await asyncio.wait_for(poller._task, timeout=5)
+    assert len(poller) == 0
+    assert stats['calls'] == 1
+
+
+def test_as_future_sync(sdk):
+    operations = [
+        FakeOperation(sdk=sdk, id=str(i), polls_left=polls_left)
+        for i, polls_left in enumerate([3, 1, 2])
+    ]
+
+    callback_threads = []
+    futures = [
+        operation.add_done_callback(
+            lambda _: callback_threads.append(threading.current_thread()),
+            poll_interval=0.001,
+        )
+        for operation in operations
+    ]
+    assert all(isinstance(future, concurrent.futures.Future) for future in futures)
+
+    results = [future.result(timeout=5) for future in concurrent.futures.as_completed(futures, timeout=5)]
+    assert results == ['result-1', 'result-2', 'result-0']
+    assert len(callback_threads) == 3
+    assert threading.current_thread() not in callback_threads
+
+    future = FakeOperation(sdk=sdk, id='3', polls_left=2, error='oops').as_future(poll_interval=0.001)
+    with pytest.raises(RunError, match='oops'):
+        future.result(timeout=5)
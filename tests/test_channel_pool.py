@@ -0,0 +1,236 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, cast
+
+import grpc.aio
+import pytest
+from yandex.cloud.ai.foundation_models.v1.text_common_pb2 import Token  # pylint: disable=no-name-in-module
+from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_service_pb2 import (  # pylint: disable=no-name-in-module
+    TokenizeResponse
+)
+from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_service_pb2_grpc import (
+    TextGenerationServiceStub, TokenizerServiceServicer, TokenizerServiceStub, add_TokenizerServiceServicer_to_server
+)
+from yandex_ai_studio_sdk._channel_pool import ChannelPool
+from yandex_ai_studio_sdk.channel_pool import ChannelPoolConfig
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeCall:
+    def __init__(self):
+        self.callbacks = []
+
+    def add_done_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def finish(self):
+        for callback in self.callbacks:
+            callback(self)
+
+
+class FakeChannel:
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def make_pool(**kwargs) -> ChannelPool:
+    channel_factory = cast(Callable[[str], grpc.aio.Channel], FakeChannel)
+    return ChannelPool('foo:443', channel_factory=channel_factory, config=ChannelPoolConfig(**kwargs))
+
+
+async def test_lazy_growth():
+    pool = make_pool(max_channels=3, max_concurrent_streams=2)
+    assert len(pool) == 0
+
+    acquired = [pool.acquire() for _ in range(4)]
+    assert len(pool) == 2
+    assert [pooled.in_flight for pooled in pool._channels] == [2, 2]
+
+    acquired += [pool.acquire() for _ in range(4)]
+    # pool doesn't grow beyond max_channels and spreads calls
+    # between saturated channels
+    assert len(pool) == 3
+    assert sorted(pooled.in_flight for pooled in pool._channels) == [2, 3, 3]
+
+    for pooled in acquired:
+        await pool.release(pooled)
+    assert [pooled.in_flight for pooled in pool._channels] == [0, 0, 0]
+
+
+async def test_least_in_flight():
+    pool = make_pool(max_channels=2, max_concurrent_streams=1)
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first.channel is not second.channel
+
+    pool.acquire()
+    await pool.release(second)
+    third = pool.acquire()
+    assert third.channel is second.channel
+
+
+async def test_round_robin():
+    pool = make_pool(max_channels=2, max_concurrent_streams=1, strategy='round_robin')
+    pool.acquire()
+    pool.acquire()
+
+    channels = [pool.acquire().channel for _ in range(4)]
+    assert channels[0] is channels[2]
+    assert channels[1] is channels[3]
+    assert channels[0] is not channels[1]
+
+
+@pytest.mark.parametrize('idle_timeout', [0, None])
+async def test_idle_shrink(idle_timeout):
+    pool = make_pool(max_channels=3, max_concurrent_streams=1, idle_timeout=idle_timeout)
+    acquired = [pool.acquire() for _ in range(3)]
+    assert len(pool) == 3
+
+    await pool.release(acquired[2])
+    if idle_timeout is None:
+        assert len(pool) == 3
+        return
+
+    assert len(pool) == 2
+    assert acquired[2].channel.closed
+
+    for pooled in acquired[:2]:
+        await pool.release(pooled)
+    # the first channel is kept alive
+    assert len(pool) == 1
+    assert not acquired[0].channel.closed
+
+    await pool.close()
+    assert acquired[0].channel.closed
+    assert len(pool) == 0
+
+
+
+async def test_idle_shrink_pinned_call():
+    pool = make_pool(max_channels=2, max_concurrent_streams=1, idle_timeout=0)
+    first = pool.acquire()
+    second = pool.acquire()
+
+    # streaming call is kept open after the release of its channel
+    call = FakeCall()
+    pool.pin(second, call)
+    await pool.release(second)
+    await pool.release(first)
+    assert len(pool) == 2
+    assert not second.channel.closed
+
+    call.finish()
+    assert second.in_flight == 0
+
+    pooled = pool.acquire()
+    await pool.release(pooled)
+    assert len(pool) == 1
+    assert second.channel.closed
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'max_channels': 0},
+    {'max_concurrent_streams': 0},
+    {'idle_timeout': -1},
+    {'strategy': 'random'},
+])
+async def test_config_validation(kwargs):
+    with pytest.raises(ValueError):
+        ChannelPoolConfig(**kwargs)
+
+
+@pytest.fixture(name='servicers')
+def fixture_servicers():
+    class TokenizerService(TokenizerServiceServicer):
+        def __init__(self):
+            self.peers = set()
+
+        def TokenizeCompletion(self, request, context):
+            self.peers.add(context.peer())
+            return TokenizeResponse(
+                tokens=[Token(id=1, text="abc")],
+                model_version='foo',
+            )
+
+    return [
+        (TokenizerService(), add_TokenizerServiceServicer_to_server),
+    ]
+
+
+async def test_client_channel_pool(async_sdk, servicers, monkeypatch):
+    client = async_sdk._client
+    client._channel_pool_config = ChannelPoolConfig(max_channels=4, max_concurrent_streams=1)
+
+    new_channel = client._new_channel
+    channels = []
+
+    def new_channel_spy(endpoint):
+        channel = new_channel(endpoint)
+        channels.append(channel)
+        return channel
+
+    monkeypatch.setattr(client, '_new_channel', new_channel_spy)
+
+    model = async_sdk.models.completions('foo')
+    results = await asyncio.gather(*(model.tokenize('bar') for _ in range(10)))
+    assert all(result[0].text == 'abc' for result in results)
+
+    assert 1 < len(channels) <= 4
+    (pool, ) = client._channel_pools.values()
+    assert len(pool) == len(channels)
+    # every channel has its own connection to the server
+    assert len(servicers[0][0].peers) == len(channels)
+    assert all(pooled.in_flight == 0 for pooled in pool._channels)
+
+    await client.close()
+    assert not client._channel_pools
+
+
+async def test_client_shared_channel(async_sdk, monkeypatch):
+    client = async_sdk._client
+
+    new_channel = client._new_channel
+    endpoints = []
+
+    def new_channel_spy(endpoint):
+        endpoints.append(endpoint)
+        return new_channel(endpoint)
+
+    monkeypatch.setattr(client, '_new_channel', new_channel_spy)
+
+    async with client.get_service_stub(TokenizerServiceStub, timeout=10) as stub1:
+        async with client.get_service_stub(TextGenerationServiceStub, timeout=10) as stub2:
+            assert stub1 is not stub2
+
+    assert len(endpoints) == 1
+    assert set(client._endpoints) == {TokenizerServiceStub, TextGenerationServiceStub}
+    assert list(client._channel_pools) == endpoints
+
+    (pool, ) = client._channel_pools.values()
+    assert len(pool) == 1
+
+    await client.close()
+
+
+async def test_client_stream_call_pinned(async_sdk):
+    client = async_sdk._client
+    call = FakeCall()
+
+    async with client.get_service_stub(TokenizerServiceStub, timeout=10):
+        assert await client.stream_stream_call(lambda **_: call, timeout=10) is call  # type: ignore[arg-type]
+
+    (pool, ) = client._channel_pools.values()
+    (pooled, ) = pool._channels
+    assert pooled.in_flight == 1
+
+    call.finish()
+    assert pooled.in_flight == 0
+
+    await client.close()
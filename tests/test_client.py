@@ -8,6 +8,7 @@ from multiprocessing.pool import ThreadPool
 import certifi
 import grpc
 import grpc.aio
+import httpx
 import httpx._transports.default
 import pytest
 from yandex.cloud.ai.foundation_models.v1.text_common_pb2 import Token
@@ -20,9 +21,10 @@ from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_servic
 )
 from yandex.cloud.endpoint.api_endpoint_service_pb2 import ListApiEndpointsRequest, ListApiEndpointsResponse
 from yandex.cloud.endpoint.api_endpoint_service_pb2_grpc import ApiEndpointServiceStub
-from yandex_ai_studio_sdk import AsyncAIStudio
+from yandex_ai_studio_sdk import AIStudio, AsyncAIStudio
 from yandex_ai_studio_sdk._client import AsyncCloudClient, _get_user_agent
 from yandex_ai_studio_sdk._types.misc import UNDEFINED
+from yandex_ai_studio_sdk._utils.sync import run_sync_impl
 from yandex_ai_studio_sdk.auth import NoAuth
 from yandex_ai_studio_sdk.exceptions import AioRpcError, UnknownEndpointError
 
@@ -247,6 +249,50 @@ async def test_channel_credentials(folder_id):
         sdk._client._new_channel('foo')
 
 
+@pytest.mark.asyncio
+async def test_httpx_pooled_transport(folder_id):
+    sdk = AsyncAIStudio(folder_id=folder_id, http_limits=httpx.Limits(max_connections=5))
+    client = sdk._client
+
+    async with client.httpx(timeout=10, auth=False, base_url='https://foo.bar') as http_client1:
+        pass
+    async with client.httpx(timeout=10, auth=False, base_url='https://foo.bar') as http_client2:
+        pass
+    async with client.httpx(timeout=10, auth=False) as http_client3:
+        pass
+
+    assert http_client1 is not http_client2
+    assert http_client1._transport._transport is http_client2._transport._transport
+    assert http_client1._transport._transport is not http_client3._transport._transport
+    assert set(client._http_transports) == {'https://foo.bar', None}
+
+    transport = http_client1._transport._transport
+    assert transport._pool._max_connections == 5
+
+    async with sdk:
+        pass
+
+    assert not client._http_transports
+
+    async with client.httpx(timeout=10, auth=False, base_url='https://foo.bar') as http_client4:
+        assert http_client4._transport._transport is not transport
+
+
+def test_httpx_pooled_transport_sync(folder_id):
+    with AIStudio(folder_id=folder_id) as sdk:
+        client = sdk._client
+
+        async def get_transport():
+            async with client.httpx(timeout=10, auth=False) as http_client:
+                return http_client._transport._transport
+
+        transport1 = run_sync_impl(get_transport(), sdk)
+        transport2 = run_sync_impl(get_transport(), sdk)
+        assert transport1 is transport2
+
+    assert not client._http_transports
+
+
 @pytest.mark.asyncio
 async def test_httpx_credentials(folder_id, monkeypatch):
     path = certifi.where()
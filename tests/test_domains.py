@@ -0,0 +1,50 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+from yandex_ai_studio_sdk import AIStudio, AsyncAIStudio
+from yandex_ai_studio_sdk._chat import AsyncChat
+from yandex_ai_studio_sdk._models import Models
+
+
+def test_lazy_domains():
+    sdk = AsyncAIStudio(folder_id='foo')
+    assert 'chat' not in vars(sdk)
+
+    chat = sdk.chat
+    assert isinstance(chat, AsyncChat)
+    assert sdk.chat is chat
+    assert vars(sdk)['chat'] is chat
+    assert 'models' not in vars(sdk)
+
+    with pytest.raises(AttributeError, match="'AsyncAIStudio' object has no attribute 'foo'"):
+        sdk.foo  # pylint: disable=pointless-statement
+
+
+def test_lazy_domains_subclass():
+    class CustomSDK(AIStudio):
+        pass
+
+    sdk = CustomSDK(folder_id='foo')
+    assert isinstance(sdk.models, Models)
+    assert sdk.models._sdk is sdk
+
+
+def test_lazy_imports():
+    code = '''
+import sys
+import yandex_ai_studio_sdk
+
+sdk = yandex_ai_studio_sdk.AIStudio(folder_id='foo')
+modules = {name.split('.')[1] for name in sys.modules if name.startswith('yandex_ai_studio_sdk._')}
+print(' '.join(sorted(modules)))
+'''
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    modules = set(output.split())
+
+    assert '_client' in modules
+    for domain_module in ('_assistants', '_models', '_chat', '_search_api', '_speechkit', '_batch'):
+        assert domain_module not in modules
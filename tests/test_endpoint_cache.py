@@ -0,0 +1,205 @@
+# pylint: disable=protected-access,no-name-in-module
+from __future__ import annotations
+
+import json
+
+import grpc
+import pytest
+from grpc.aio import Metadata
+from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_service_pb2_grpc import (
+    TextGenerationServiceStub
+)
+from yandex.cloud.endpoint.api_endpoint_pb2 import ApiEndpoint
+from yandex.cloud.endpoint.api_endpoint_service_pb2 import ListApiEndpointsResponse
+from yandex.cloud.endpoint.api_endpoint_service_pb2_grpc import (
+    ApiEndpointServiceServicer, ApiEndpointServiceStub, add_ApiEndpointServiceServicer_to_server
+)
+from yandex_ai_studio_sdk import AsyncAIStudio
+from yandex_ai_studio_sdk._client import AsyncCloudClient
+from yandex_ai_studio_sdk._endpoint_cache import EndpointCache, get_default_endpoint_cache_path
+from yandex_ai_studio_sdk._exceptions import AioRpcError
+from yandex_ai_studio_sdk.auth import NoAuth
+from yandex_ai_studio_sdk.retry import NoRetryPolicy
+
+pytestmark = pytest.mark.asyncio
+
+
+class EndpointService(ApiEndpointServiceServicer):
+    def __init__(self):
+        self.calls = 0
+        self.endpoints = {'ai-foundation-models': 'llm.example.com:443'}
+
+    def List(self, request, context):
+        self.calls += 1
+        return ListApiEndpointsResponse(
+            endpoints=[
+                ApiEndpoint(id=id_, address=address)
+                for id_, address in self.endpoints.items()
+            ]
+        )
+
+
+@pytest.fixture(name='endpoint_service')
+def fixture_endpoint_service(test_server):
+    servicer = EndpointService()
+    add_ApiEndpointServiceServicer_to_server(servicer, test_server)
+    test_server.start()
+    return servicer
+
+
+@pytest.fixture(name='client_maker')
+def fixture_client_maker(test_server, tmp_path):
+    cache_path = tmp_path / 'cache' / 'endpoints.json'
+
+    def maker(ttl: float = 60) -> AsyncCloudClient:
+        return AsyncCloudClient(
+            endpoint=f'localhost:{test_server.port}',
+            auth=NoAuth(),
+            service_map={},
+            interceptors=None,
+            yc_profile=None,
+            retry_policy=NoRetryPolicy(),
+            enable_server_data_logging=None,
+            verify=False,
+            endpoint_cache=EndpointCache(cache_path, ttl=ttl),
+        )
+
+    maker.cache_path = cache_path  # type: ignore[attr-defined]
+    return maker
+
+
+async def discover(client: AsyncCloudClient, service_name: str = 'ai-foundation-models') -> str:
+    return await client._discover_service_endpoint(service_name, stub_class=ApiEndpointServiceStub, timeout=5)
+
+
+async def test_endpoint_cache(endpoint_service, client_maker):
+    client = client_maker()
+    assert await discover(client) == 'llm.example.com:443'
+    assert endpoint_service.calls == 1
+    await client.close()
+
+    data = json.loads(client_maker.cache_path.read_text())
+    (entry, ) = data['endpoints'].values()
+    assert entry['services'] == endpoint_service.endpoints
+
+    # new client, for example in a new process, doesn't call endpoint service
+    client = client_maker()
+    assert await discover(client) == 'llm.example.com:443'
+    assert endpoint_service.calls == 1
+    assert client._service_map_refresh is None
+    await client.close()
+
+
+async def test_endpoint_cache_stale(endpoint_service, client_maker):
+    client = client_maker()
+    await discover(client)
+    await client.close()
+
+    endpoint_service.endpoints['ai-foundation-models'] = 'new-llm.example.com:443'
+
+    client = client_maker(ttl=0)
+    # stale value is returned right away
+    assert await discover(client) == 'llm.example.com:443'
+
+    refresh = client._service_map_refresh
+    assert refresh is not None
+    await refresh
+    assert endpoint_service.calls == 2
+    assert await discover(client) == 'new-llm.example.com:443'
+    await client.close()
+
+    client = client_maker()
+    assert await discover(client) == 'new-llm.example.com:443'
+    assert endpoint_service.calls == 2
+    await client.close()
+
+
+
+async def test_endpoint_cache_stale_resolved_stub(endpoint_service, client_maker):
+    client = client_maker()
+    await discover(client)
+    await client.close()
+
+    endpoint_service.endpoints['ai-foundation-models'] = 'new-llm.example.com:443'
+
+    client = client_maker(ttl=0)
+    pool = await client._get_channel_pool(TextGenerationServiceStub, timeout=5)
+    assert pool.endpoint == 'llm.example.com:443'
+
+    await client._service_map_refresh
+    # stubs which were resolved with the stale map are resolved again
+    assert not client._endpoints
+    pool = await client._get_channel_pool(TextGenerationServiceStub, timeout=5)
+    assert pool.endpoint == 'new-llm.example.com:443'
+    await client.close()
+
+
+async def test_endpoint_cache_unavailable(endpoint_service, client_maker):
+    client = client_maker()
+    await discover(client)
+    await client.close()
+
+    endpoint_service.endpoints['ai-foundation-models'] = 'new-llm.example.com:443'
+
+    # cache is fresh, so it is not revalidated until the service is unavailable
+    client = client_maker()
+    await client._get_channel_pool(TextGenerationServiceStub, timeout=5)
+    assert client._service_map_refresh is None
+
+    with pytest.raises(AioRpcError) as exc_info:
+        with client.with_sdk_error(TextGenerationServiceStub):
+            raise grpc.aio.AioRpcError(
+                code=grpc.StatusCode.UNAVAILABLE,
+                initial_metadata=Metadata(),
+                trailing_metadata=Metadata(),
+            )
+    assert exc_info.value._endpoint == 'llm.example.com:443'
+    assert TextGenerationServiceStub not in client._endpoints
+
+    refresh = client._service_map_refresh
+    assert refresh is not None
+    await refresh
+    assert endpoint_service.calls == 2
+
+    pool = await client._get_channel_pool(TextGenerationServiceStub, timeout=5)
+    assert pool.endpoint == 'new-llm.example.com:443'
+    await client.close()
+
+async def test_endpoint_cache_unknown_service(endpoint_service, client_maker):
+    client = client_maker()
+    await discover(client)
+    await client.close()
+
+    endpoint_service.endpoints['ai-files'] = 'files.example.com:443'
+
+    client = client_maker()
+    assert await discover(client, 'ai-files') == 'files.example.com:443'
+    assert endpoint_service.calls == 2
+    await client.close()
+
+
+async def test_endpoint_cache_corrupted(endpoint_service, client_maker):
+    client_maker.cache_path.parent.mkdir()
+    client_maker.cache_path.write_text('{not a json')
+
+    client = client_maker()
+    assert await discover(client) == 'llm.example.com:443'
+    assert endpoint_service.calls == 1
+    await client.close()
+
+    data = json.loads(client_maker.cache_path.read_text())
+    assert data['version'] == 1
+
+
+async def test_sdk_endpoint_cache(tmp_path, monkeypatch):
+    assert AsyncAIStudio(folder_id='foo')._client._endpoint_cache is None
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    cache = AsyncAIStudio(folder_id='foo', endpoint_cache=True)._client._endpoint_cache
+    assert cache.path == get_default_endpoint_cache_path() == tmp_path / 'yandex-ai-studio-sdk' / 'endpoints.json'
+
+    cache = AsyncAIStudio(folder_id='foo', endpoint_cache=tmp_path / 'foo.json')._client._endpoint_cache
+    assert cache.path == tmp_path / 'foo.json'
+
+    with pytest.raises(ValueError):
+        EndpointCache(tmp_path, ttl=-1)
@@ -0,0 +1,95 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import threading
+
+import pytest
+from yandex.cloud.ai.foundation_models.v1.text_common_pb2 import Token  # pylint: disable=no-name-in-module
+from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_service_pb2 import (  # pylint: disable=no-name-in-module
+    TokenizeResponse
+)
+from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_service_pb2_grpc import (
+    TokenizerServiceServicer, add_TokenizerServiceServicer_to_server
+)
+from yandex_ai_studio_sdk import AIStudio
+
+
+@pytest.fixture(name='servicers')
+def fixture_servicers():
+    class TokenizerService(TokenizerServiceServicer):
+        def TokenizeCompletion(self, request, context):
+            return TokenizeResponse(
+                tokens=[Token(id=1, text="abc")],
+                model_version='foo',
+            )
+
+    return [
+        (TokenizerService(), add_TokenizerServiceServicer_to_server),
+    ]
+
+
+@pytest.fixture(name='sharded_sdk')
+def fixture_sharded_sdk(folder_id, auth, retry_policy, test_client_maker):
+    sdk = AIStudio(folder_id=folder_id, auth=auth, retry_policy=retry_policy, event_loops=3)
+    sdk._client = test_client_maker()
+    return sdk
+
+
+def test_event_loops(sharded_sdk):
+    model = sharded_sdk.models.completions('foo')
+    results = {}
+
+    def target(i):
+        results[i] = model.tokenize('bar')
+
+    threads = [threading.Thread(target=target, args=(i, )) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 6
+    assert all(result[0].text == 'abc' for result in results.values())
+
+    # the main loop is using the main client and two additional loops are
+    # getting their own clients with separate channels
+    main_loop = sharded_sdk._get_event_loop()
+    loop_clients = sharded_sdk._loop_clients
+    assert len(loop_clients) == 2
+    assert main_loop not in loop_clients
+
+    clients = [sharded_sdk._client, *loop_clients.values()]
+    channels = set()
+    for client in clients:
+        (pool, ) = client._channel_pools.values()
+        (pooled, ) = pool._channels
+        channels.add(pooled.channel)
+    assert len(channels) == 3
+
+    sharded_sdk.close()
+    assert not any(client._channel_pools for client in clients)
+
+
+def test_event_loops_warmup(sharded_sdk):
+    sharded_sdk.warmup(domains=iter(['models']))
+
+    # clients of all of the loops are warmed up, not just the one of the calling thread
+    loop_clients = sharded_sdk._loop_clients
+    assert len(loop_clients) == 2
+
+    clients = [sharded_sdk._client, *loop_clients.values()]
+    for client in clients:
+        assert client._channel_pools
+
+    sharded_sdk.close()
+
+
+def test_event_loops_default(sdk):
+    loop = sdk._get_event_loop()
+    assert sdk._get_thread_event_loop() is loop
+    assert sdk._get_thread_event_loop() is loop
+
+
+def test_event_loops_validation():
+    with pytest.raises(ValueError):
+        AIStudio(folder_id='foo', event_loops=0)
@@ -0,0 +1,111 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import base64
+import json
+import struct
+import sys
+
+import pytest
+from pytest_httpx import HTTPXMock
+from yandex_ai_studio_sdk import AsyncAIStudio
+from yandex_ai_studio_sdk._json_codec import get_json_codec
+from yandex_ai_studio_sdk._types.embeddings import EmbeddingVector
+from yandex_ai_studio_sdk.json_codec import JsonCodec
+
+URL = 'https://example.com/v1/'
+
+EMBEDDINGS_RESPONSE = {
+    'model': 'emb://folder/text-search-doc/latest',
+    'usage': {'prompt_tokens': 1, 'total_tokens': 1},
+}
+
+
+def test_get_json_codec(monkeypatch):
+    assert get_json_codec('json').loads is json.loads
+    assert get_json_codec('json').dumps({'text': 'привет', 'value': 1}) == '{"text":"привет","value":1}'.encode()
+
+    codec = JsonCodec(name='custom', loads=json.loads, dumps=lambda obj: json.dumps(obj).encode())
+    assert get_json_codec(codec) is codec
+
+    with pytest.raises(ValueError, match='unknown json_codec'):
+        get_json_codec('foo')  # type: ignore[arg-type]
+
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+    monkeypatch.setitem(sys.modules, 'msgspec', None)
+    monkeypatch.setitem(sys.modules, 'msgspec.json', None)
+    assert get_json_codec('auto').name == 'json'
+
+    with pytest.raises(RuntimeError, match='requires package "orjson"'):
+        get_json_codec('orjson')
+
+
+@pytest.mark.asyncio
+async def test_json_codec_http(httpx_mock: HTTPXMock):
+    calls = []
+
+    def loads(data):
+        calls.append('loads')
+        return json.loads(data)
+
+    def dumps(obj):
+        calls.append('dumps')
+        return json.dumps(obj).encode()
+
+    sdk = AsyncAIStudio(
+        folder_id='folder',
+        auth='key',
+        service_map={'http_completions': URL},
+        json_codec=JsonCodec(name='spy', loads=loads, dumps=dumps),
+    )
+    httpx_mock.add_response(
+        method='POST',
+        url=f'{URL}embeddings',
+        json={**EMBEDDINGS_RESPONSE, 'data': [{'embedding': [0.5, 1.5]}]},
+    )
+
+    result = await sdk.chat.text_embeddings('text-search-doc').run('hello')
+    assert tuple(result) == (0.5, 1.5)
+    assert calls == ['dumps', 'loads']
+
+    (request, ) = httpx_mock.get_requests()
+    assert request.headers['Content-Type'] == 'application/json'
+    assert json.loads(request.content)['input'] == ['hello']
+
+    await sdk.close()
+
+
+@pytest.mark.asyncio
+async def test_embeddings_base64(httpx_mock: HTTPXMock):
+    sdk = AsyncAIStudio(folder_id='folder', auth='key', service_map={'http_completions': URL})
+    values = (0.5, -1.25, 3.0)
+    httpx_mock.add_response(
+        method='POST',
+        url=f'{URL}embeddings',
+        json={
+            **EMBEDDINGS_RESPONSE,
+            'data': [{'embedding': base64.b64encode(struct.pack('<3f', *values)).decode()}],
+        },
+    )
+
+    model = sdk.chat.text_embeddings('text-search-doc').configure(encoding_format='base64')
+    result = await model.run('hello')
+
+    assert result.embedding.typecode == 'f'
+    assert tuple(result) == values
+
+    (request, ) = httpx_mock.get_requests()
+    assert json.loads(request.content)['encoding_format'] == 'base64'
+
+    await sdk.close()
+
+
+@pytest.mark.parametrize('byteorder', ['little', 'big'])
+def test_embedding_vector_byteorder(byteorder):
+    values = (0.5, -1.25, 3.0)
+    fmt = '<3f' if byteorder == 'little' else '>3f'
+
+    # buffer is decoded the same way regardless of the native byte order
+    vector = EmbeddingVector._from_bytes(struct.pack(fmt, *values), typecode='f', byteorder=byteorder)
+    assert tuple(vector) == values
+    assert vector.tobytes() == struct.pack(f'={len(values)}f', *values)
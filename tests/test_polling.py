@@ -0,0 +1,122 @@
+# pylint: disable=protected-access,no-name-in-module
+from __future__ import annotations
+
+import pytest
+from google.protobuf.any_pb2 import Any as ProtoAny
+from yandex.cloud.ai.tuning.v1.tuning_service_pb2 import TuningMetadata
+from yandex_ai_studio_sdk._polling import coerce_polling_strategy
+from yandex_ai_studio_sdk._tuning.tuning_task import AsyncTuningTask, TuningTaskStatus
+from yandex_ai_studio_sdk._types.operation import AsyncOperation, OperationStatus
+from yandex_ai_studio_sdk.polling import EtaPolling, ExponentialPolling, FixedPolling
+
+
+def test_fixed_polling():
+    polling = FixedPolling(interval=5)
+    assert polling.get_interval(attempt=1, elapsed=0, progress=None) == 5
+    assert polling.get_interval(attempt=100, elapsed=1000, progress=0.5) == 5
+
+
+def test_exponential_polling():
+    polling = ExponentialPolling(initial_interval=1, multiplier=2, max_interval=10, jitter=0)
+    intervals = [polling.get_interval(attempt=attempt, elapsed=0, progress=None) for attempt in range(1, 7)]
+    assert intervals == [1, 2, 4, 8, 10, 10]
+
+    assert polling.get_interval(attempt=10 ** 6, elapsed=0, progress=None) == 10
+
+    polling = ExponentialPolling(initial_interval=10, jitter=0.2)
+    intervals = {polling.get_interval(attempt=1, elapsed=0, progress=None) for _ in range(20)}
+    assert all(8 <= interval <= 12 for interval in intervals)
+    assert len(intervals) > 1
+
+
+def test_eta_polling():
+    polling = EtaPolling(fraction=0.5, min_interval=5, max_interval=100, fallback=FixedPolling(interval=7))
+    assert polling.get_interval(attempt=1, elapsed=10, progress=None) == 7
+    assert polling.get_interval(attempt=1, elapsed=10, progress=0) == 7
+
+    # 40s passed for 20%, so 160s remains
+    assert polling.get_interval(attempt=2, elapsed=40, progress=0.2) == 80
+    assert polling.get_interval(attempt=2, elapsed=400, progress=0.2) == 100
+    assert polling.get_interval(attempt=2, elapsed=40, progress=0.99) == 5
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'initial_interval': -1},
+    {'multiplier': 0.5},
+    {'jitter': 1},
+])
+def test_exponential_polling_validation(kwargs):
+    with pytest.raises(ValueError):
+        ExponentialPolling(**kwargs)
+
+
+def test_coerce_polling_strategy():
+    default = FixedPolling(interval=1)
+    assert coerce_polling_strategy(None, default) is default
+    assert coerce_polling_strategy(3, default) == FixedPolling(interval=3)
+
+    polling = ExponentialPolling()
+    assert coerce_polling_strategy(polling, default) is polling
+
+
+class FakeOperation(AsyncOperation[str]):
+    def __init__(self, sdk, polls_left):
+        super().__init__(sdk=sdk, id='foo', result_type=str, proto_result_type=None)
+        self.polls_left = polls_left
+        self.delays = []
+
+    async def _get_status(self, *, timeout: float = 60) -> OperationStatus:
+        self.polls_left -= 1
+        done = self.polls_left <= 0
+        return OperationStatus(done=done, error=None, response='foo' if done else None, metadata=None)
+
+    async def _get_result(self, *, timeout: float = 60) -> str:
+        return 'result'
+
+    async def _sleep_impl(self, delay: float) -> None:
+        self.delays.append(delay)
+
+
+@pytest.mark.asyncio
+async def test_wait_polling(async_sdk):
+    operation = FakeOperation(async_sdk, polls_left=4)
+    assert await operation.wait(poll_interval=ExponentialPolling(initial_interval=0.5, jitter=0)) == 'result'
+    assert operation.delays == [0.5, 1, 2]
+
+    operation = FakeOperation(async_sdk, polls_left=3)
+    await operation.wait(poll_interval=0.25)
+    assert operation.delays == [0.25, 0.25]
+
+    # by default operation is polled often at the start,
+    # but not longer than its default poll interval
+    operation = FakeOperation(async_sdk, polls_left=8)
+    await operation.wait()
+    assert operation.delays[0] <= 1.1
+    assert max(operation.delays) <= operation._default_poll_interval * 1.1
+
+
+@pytest.mark.asyncio
+async def test_wait_polling_non_positive(async_sdk):
+    operation = FakeOperation(async_sdk, polls_left=2)
+    for poll_interval in (0, -1):
+        with pytest.raises(ValueError, match='poll_interval must be positive'):
+            await operation.wait(poll_interval=poll_interval)
+
+        with pytest.raises(ValueError, match='poll_interval must be positive'):
+            await async_sdk.operations.wait_many([operation], poll_interval=poll_interval)
+
+    assert operation.polls_left == 2
+
+
+def test_tuning_progress(sdk):
+    task = AsyncTuningTask(sdk=sdk, result_type=str, operation_id='foo', task_id=None)
+
+    status = TuningTaskStatus(done=False, error=None, response=None, metadata=None)
+    assert task._get_progress(status) is None
+
+    metadata = ProtoAny()
+    metadata.Pack(TuningMetadata(tuning_task_id='bar', total_steps=200, current_step=50))
+    status = TuningTaskStatus(done=False, error=None, response=None, metadata=metadata)
+    assert task._get_progress(status) == 0.25
+
+    assert isinstance(task._get_default_polling(), EtaPolling)
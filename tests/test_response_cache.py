@@ -0,0 +1,250 @@
+# pylint: disable=protected-access,no-name-in-module
+from __future__ import annotations
+
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+from yandex.cloud.ai.foundation_models.v1.embedding.embedding_service_pb2 import TextEmbeddingResponse
+from yandex.cloud.ai.foundation_models.v1.embedding.embedding_service_pb2_grpc import (
+    EmbeddingsServiceServicer, add_EmbeddingsServiceServicer_to_server
+)
+from yandex.cloud.ai.foundation_models.v1.text_common_pb2 import Alternative, ContentUsage, Message
+from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_service_pb2 import CompletionResponse
+from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_service_pb2_grpc import (
+    TextGenerationServiceServicer, add_TextGenerationServiceServicer_to_server
+)
+from yandex_ai_studio_sdk import AsyncAIStudio
+from yandex_ai_studio_sdk.response_cache import MemoryResponseCache, ResponseCache, SqliteResponseCache
+
+URL = 'https://example.com/v1/'
+
+
+class EmbeddingsService(EmbeddingsServiceServicer):
+    def __init__(self):
+        self.calls = 0
+
+    def TextEmbedding(self, request, context):
+        self.calls += 1
+        return TextEmbeddingResponse(
+            embedding=[float(len(request.text)), float(self.calls)],
+            num_tokens=1,
+            model_version='1',
+        )
+
+
+class TextGenerationService(TextGenerationServiceServicer):
+    def __init__(self):
+        self.calls = 0
+
+    def Completion(self, request, context):
+        self.calls += 1
+        yield CompletionResponse(
+            alternatives=[
+                Alternative(
+                    message=Message(role='assistant', text=f'answer {self.calls}'),
+                    status=Alternative.ALTERNATIVE_STATUS_FINAL,
+                )
+            ],
+            usage=ContentUsage(input_text_tokens=1, completion_tokens=2, total_tokens=3),
+            model_version='1',
+        )
+
+
+@pytest.fixture(name='servicers')
+def fixture_servicers():
+    return [
+        (EmbeddingsService(), add_EmbeddingsServiceServicer_to_server),
+        (TextGenerationService(), add_TextGenerationServiceServicer_to_server),
+    ]
+
+
+@pytest.fixture(name='cache')
+def fixture_cache(async_sdk):
+    cache = MemoryResponseCache()
+    async_sdk._client._response_cache = cache
+    return cache
+
+
+def test_memory_cache_lru():
+    cache = MemoryResponseCache(max_entries=2)
+    cache.set('a', b'1')
+    cache.set('b', b'2')
+    assert cache.get('a') == b'1'
+
+    # 'b' is the least recently used one
+    cache.set('c', b'3')
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1'
+    assert cache.get('c') == b'3'
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_memory_cache_limits():
+    cache = MemoryResponseCache(max_bytes=5)
+    cache.set('a', b'12')
+    cache.set('b', b'34')
+    cache.set('c', b'56')
+    assert cache.get('a') is None
+    assert cache.get('c') == b'56'
+
+    # value which doesn't fit the cache at all is not stored and doesn't evict others
+    cache.set('d', b'123456')
+    assert cache.get('d') is None
+    assert cache.get('b') == b'34'
+
+    cache = MemoryResponseCache(ttl=0)
+    cache.set('a', b'1')
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        MemoryResponseCache(max_entries=0)
+    with pytest.raises(ValueError):
+        MemoryResponseCache(ttl=-1)
+
+
+def test_sqlite_cache(tmp_path):
+    path = tmp_path / 'cache' / 'responses.sqlite'
+    cache = SqliteResponseCache(path, max_entries=2)
+    cache.set('a', b'1')
+    cache.set('b', b'2')
+    cache.set('c', b'3')
+    assert cache.get('a') is None
+    cache.close()
+
+    # entries survive reopening, for example in a new process
+    cache = SqliteResponseCache(path)
+    assert cache.get('b') == b'2'
+    assert cache.get('c') == b'3'
+    cache.clear()
+    assert cache.get('b') is None
+    cache.close()
+
+    cache = SqliteResponseCache(path, ttl=0)
+    cache.set('a', b'1')
+    assert cache.get('a') is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_text_embeddings_cache(async_sdk, servicers, cache):
+    embeddings_service = servicers[0][0]
+    model = async_sdk.models.text_embeddings('foo')
+
+    first = await model.run('hello')
+    second = await model.run('hello')
+    assert tuple(first) == tuple(second) == (5.0, 1.0)
+    assert embeddings_service.calls == 1
+
+    await model.run('hello', dimensions=256)
+    await model.configure(dimensions=256).run('hello')
+    assert embeddings_service.calls == 2
+
+    batch = await model.run_batch(['hello', 'hi', 'hi'], concurrency=1)
+    assert [tuple(result) for result in batch] == [(5.0, 1.0), (2.0, 3.0), (2.0, 3.0)]
+    assert embeddings_service.calls == 3
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses) == (4, 3)
+    assert stats.hit_rate == pytest.approx(4 / 7)
+
+    cache.reset_stats()
+    assert cache.stats.hit_rate == 0
+
+
+@pytest.mark.asyncio
+async def test_completions_cache(async_sdk, servicers, cache):
+    generation_service = servicers[1][0]
+    model = async_sdk.models.completions('foo')
+
+    first = await model.run('hello')
+    second = await model.run('hello')
+    assert first.text == second.text == 'answer 1'
+    assert second.usage.total_tokens == 3
+    assert generation_service.calls == 1
+
+    await model.configure(temperature=0.5).run('hello')
+    assert generation_service.calls == 2
+
+    # streaming calls are never cached
+    results = [result async for result in model.run_stream('hello')]
+    assert results[-1].text == 'answer 3'
+    assert generation_service.calls == 3
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_broken_cache(async_sdk, servicers):
+    class BrokenCache(ResponseCache):
+        def get(self, key):
+            raise RuntimeError('broken')
+
+        def set(self, key, value):
+            raise RuntimeError('broken')
+
+        def clear(self):
+            pass
+
+    cache = async_sdk._client._response_cache = BrokenCache()
+    model = async_sdk.models.text_embeddings('foo')
+
+    assert tuple(await model.run('hello')) == (5.0, 1.0)
+    assert tuple(await model.run('hello')) == (5.0, 2.0)
+    assert servicers[0][0].calls == 2
+    assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+
+
+@pytest.mark.asyncio
+async def test_chat_cache(httpx_mock: HTTPXMock, tmp_path):
+    cache = SqliteResponseCache(tmp_path / 'responses.sqlite')
+    sdk = AsyncAIStudio(
+        folder_id='folder',
+        auth='key',
+        service_map={'http_completions': URL},
+        response_cache=cache,
+    )
+    assert sdk._client.response_cache is cache
+
+    httpx_mock.add_response(
+        method='POST',
+        url=f'{URL}chat/completions',
+        json={
+            'id': 'id',
+            'created': 1,
+            'model': 'gpt://folder/foo/latest',
+            'choices': [{
+                'index': 0,
+                'finish_reason': 'stop',
+                'message': {'role': 'assistant', 'content': 'hi'},
+            }],
+        },
+    )
+    httpx_mock.add_response(
+        method='POST',
+        url=f'{URL}embeddings',
+        json={
+            'model': 'emb://folder/foo/latest',
+            'usage': {'prompt_tokens': 1, 'total_tokens': 1},
+            'data': [{'embedding': [0.5, 1.5]}],
+        },
+    )
+
+    model = sdk.chat.completions('foo')
+    assert (await model.run('hello')).text == 'hi'
+    assert (await model.run('hello')).text == 'hi'
+
+    embeddings_model = sdk.chat.text_embeddings('foo')
+    assert tuple(await embeddings_model.run('hello')) == (0.5, 1.5)
+    assert tuple(await embeddings_model.run('hello')) == (0.5, 1.5)
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 2
+    assert json.loads(requests[0].content)['messages'][0]['content'] == 'hello'
+    assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+    cache.close()
+    await sdk.close()
@@ -0,0 +1,88 @@
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import grpc
+import pytest
+from pytest_httpx import HTTPXMock
+from yandex.cloud.ai.foundation_models.v1.text_generation.text_generation_service_pb2_grpc import (
+    TokenizerServiceServicer, add_TokenizerServiceServicer_to_server
+)
+
+
+@pytest.fixture(name='servicers')
+def fixture_servicers():
+    return [
+        (TokenizerServiceServicer(), add_TokenizerServiceServicer_to_server),
+    ]
+
+
+@pytest.fixture(name='warmup_spy')
+def fixture_warmup_spy(async_sdk, monkeypatch):
+    client = async_sdk._client
+    calls = []
+
+    get_common_headers = client._get_common_headers
+    discover = client._discover_service_endpoint
+
+    async def get_common_headers_spy(auth_required, timeout):
+        calls.append(('auth', auth_required))
+        return await get_common_headers(auth_required, timeout)
+
+    async def discover_spy(service_name, stub_class, timeout):
+        calls.append(('discover', service_name))
+        return await discover(service_name, stub_class, timeout)
+
+    monkeypatch.setattr(client, '_get_common_headers', get_common_headers_spy)
+    monkeypatch.setattr(client, '_discover_service_endpoint', discover_spy)
+
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_warmup(async_sdk, warmup_spy):
+    client = async_sdk._client
+    assert not client._channel_pools
+
+    await async_sdk.warmup(domains=['models', 'files', 'threads', 'assistants'], timeout=5)
+
+    assert ('auth', True) in warmup_spy
+    discovered = [args[1] for args in warmup_spy if args[0] == 'discover']
+    assert discovered == ['ai-foundation-models', 'operation', 'ai-files', 'ai-assistants']
+
+    # all services are living at the test server, so there is only one channel
+    (pool, ) = client._channel_pools.values()
+    (pooled, ) = pool._channels
+    assert pooled.channel.get_state() == grpc.ChannelConnectivity.READY
+    assert pooled.in_flight == 0
+
+    await async_sdk.close()
+
+
+@pytest.mark.asyncio
+async def test_warmup_http(async_sdk, httpx_mock: HTTPXMock, warmup_spy):
+    client = async_sdk._client
+    client._service_map_override['http_completions'] = 'https://example.com/v1/'
+    httpx_mock.add_response(method='HEAD', url='https://example.com/v1/', status_code=404)
+
+    await async_sdk.warmup(domains=['chat'])
+
+    assert [args[0] for args in warmup_spy] == ['auth', 'auth']
+    assert not client._channel_pools
+    assert set(client._http_transports) == {'https://example.com/v1/'}
+
+    await async_sdk.close()
+
+
+@pytest.mark.asyncio
+async def test_warmup_unknown_domain(async_sdk):
+    with pytest.raises(ValueError, match=r"unknown domains \['foo'\]"):
+        await async_sdk.warmup(domains=['models', 'foo'])
+
+
+def test_warmup_sync(sdk):
+    sdk.warmup(domains=['models'], timeout=5)
+
+    (pool, ) = sdk._client._channel_pools.values()
+    assert len(pool) == 1
+
+    sdk.close()
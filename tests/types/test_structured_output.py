@@ -4,6 +4,7 @@ from __future__ import annotations
 import dataclasses
 import sys
 import typing
+import weakref
 
 import pytest
 import yandex_ai_studio_sdk._types.schemas
@@ -101,6 +102,59 @@ def test_pydantic_dataclass() -> None:
     }
 
 
+@pytest.mark.require_env('pydantic')
+def test_pydantic_schema_cache(monkeypatch) -> None:
+    import pydantic
+
+    from yandex_ai_studio_sdk._types.schemas import schema_from_parameters
+
+    class Test(pydantic.BaseModel):
+        a: int
+
+    calls = []
+    model_json_schema = Test.model_json_schema
+
+    def model_json_schema_spy(*args, **kwargs):
+        calls.append(1)
+        return model_json_schema(*args, **kwargs)
+
+    monkeypatch.setattr(Test, 'model_json_schema', model_json_schema_spy)
+
+    first = schema_from_response_format(Test)
+    assert schema_from_response_format(Test) is first
+    assert len(calls) == 1
+
+    # function tool gets its own copy of the schema
+    parameters = schema_from_parameters(Test)
+    assert parameters == first
+    assert parameters is not first
+    assert len(calls) == 1
+
+
+@pytest.mark.require_env('pydantic')
+def test_pydantic_schema_cache_weak() -> None:
+    import gc
+
+    import pydantic
+
+    from yandex_ai_studio_sdk._types.schemas import _PYDANTIC_SCHEMAS
+
+    # NB: class is created in a separate frame, so no local variable
+    # or closure of the test keeps it alive
+    def cache_schema() -> weakref.ref:
+        class Test(pydantic.BaseModel):
+            a: int
+
+        schema_from_response_format(Test)
+        assert Test in _PYDANTIC_SCHEMAS
+        return weakref.ref(Test)
+
+    # classes are not kept alive by the cache
+    ref = cache_schema()
+    gc.collect()
+    assert ref() is None
+
+
 def test_wrong_type() -> None:
     class A:
         a: int